@@ -0,0 +1,306 @@
+"""Cost rollups over the meeting history database.
+
+Each recorded meeting's cost is split among its participants as it was
+priced when recorded (or, for imported logs, by time in the meeting and
+wage) and added to daily and weekly totals per department, cost center,
+worksite and recurring meeting. Rollups are applied
+incrementally as meetings are recorded, so reports read a few pre-summed
+rows instead of rescanning every meeting's events:
+
+    python analytics.py rebuild --employees EmployeeData.db
+    python analytics.py report --by cost_center --period week --since 2024-01-01 -o costs.parquet
+
+A recurring meeting is identified by its room, weekday and start time
+rounded to 15 minutes, e.g. "Room 1 Mon 09:00".
+"""
+import argparse
+import csv
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+from cost_engine import MS_PER_HOUR
+from employee_repository import load_employees
+from meeting_history import DATE_FORMAT, MeetingHistory
+
+DIMENSIONS = {
+    # dimension -> Employees column index (None: not an employee attribute)
+    "department": 2,
+    "cost_center": 3,
+    "worksite_assignment": 4,
+    "series": None,
+    "total": None,
+}
+PERIODS = ("day", "week")
+SERIES_SLOT_MINUTES = 15
+UNKNOWN = "(unknown)"  # No longer in the Employees table
+UNASSIGNED = "(none)"  # In the table with an empty column
+APPLY_BATCH = 500  # Meetings per transaction when catching up
+REPORT_COLUMNS = ("period_start", "value", "meetings", "person_hours", "cost")
+
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_costs (
+    period TEXT NOT NULL,  -- 'day' or 'week'
+    dimension TEXT NOT NULL,
+    period_start TEXT NOT NULL,  -- YYYY-MM-DD, the Monday for weeks
+    value TEXT NOT NULL,
+    meetings INTEGER NOT NULL,
+    person_ms INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    PRIMARY KEY (period, dimension, period_start, value)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rollup_applied (
+    meeting_id INTEGER PRIMARY KEY REFERENCES meetings(id) ON DELETE CASCADE
+);
+"""
+
+
+def attribute_cost(participants, events, duration_ms, total_cost):
+    """{name: [person_ms, cost]} for one meeting.
+
+    participants are (name, wage) at the end and events are
+    (elapsed_ms, name, kind, rate_delta) in order. Walking the events
+    backwards from the end gives who was there at the start; replaying them
+    forwards gives each person's time in the meeting. When every wage is
+    known cost follows wage x time, otherwise (imported logs) the recorded
+    total is split by time.
+    """
+    wages = dict(participants)
+    for _, name, kind, rate_delta in reversed(events):
+        if kind == "join":
+            wages.pop(name, None)
+        else:
+            wages[name] = -rate_delta if rate_delta is not None else None
+
+    joined = dict.fromkeys(wages, 0)
+    shares = {}
+
+    def close(name, at_ms):
+        stint_ms = max(0, at_ms - joined.pop(name))
+        wage = wages.get(name)
+        share = shares.setdefault(name, [0, 0.0, True])
+        share[0] += stint_ms
+        if wage is None:
+            share[2] = False
+        else:
+            share[1] += wage * stint_ms / MS_PER_HOUR
+
+    for elapsed_ms, name, kind, rate_delta in events:
+        if kind == "join":
+            if name in joined:
+                close(name, elapsed_ms)
+            joined[name] = elapsed_ms
+            wages[name] = rate_delta
+        elif name in joined:
+            close(name, elapsed_ms)
+    for name in list(joined):
+        close(name, duration_ms)
+
+    if all(priced for _, _, priced in shares.values()):
+        return {name: [person_ms, cost] for name, (person_ms, cost, _) in shares.items()}
+    total_ms = sum(person_ms for person_ms, _, _ in shares.values())
+    return {name: [person_ms, total_cost * person_ms / total_ms if total_ms else 0.0]
+            for name, (person_ms, _, _) in shares.items()}
+
+
+def stint_shares(stints, duration_ms):
+    """{name: [person_ms, cost]} from a meeting's stored stints (name, join_ms, leave_ms, cost_cents).
+
+    These are the cents the meeting was priced and exported with, so the
+    rollups add up to the same totals; leave_ms is None for anyone still
+    there at the end.
+    """
+    shares = {}
+    for name, join_ms, leave_ms, cost_cents in stints:
+        share = shares.setdefault(name, [0, 0])
+        share[0] += (duration_ms if leave_ms is None else leave_ms) - join_ms
+        share[1] += cost_cents
+    return {name: [person_ms, cents / 100] for name, (person_ms, cents) in shares.items()}
+
+
+def period_starts(started):
+    day = started.date()
+    return {"day": day.isoformat(), "week": (day - timedelta(days=day.weekday())).isoformat()}
+
+
+def series_key(room, started):
+    slot = started.hour * 60 + started.minute
+    slot -= slot % SERIES_SLOT_MINUTES
+    return f"{room or 'Meeting'} {started.strftime('%a')} {slot // 60:02d}:{slot % 60:02d}"
+
+
+def rollup_rows(meeting, participants, events, employees, stints=()):
+    """Rollup increments for one meeting: (period, dimension, period_start, value, meetings, person_ms, cost).
+
+    Costs come from the meeting's stints when it has any, otherwise
+    (imported logs, meetings recorded before stints were kept) they are
+    attributed from its events.
+    """
+    started_at, ended_at, duration_ms, total_cost, room = meeting
+    started = datetime.strptime(started_at or ended_at, DATE_FORMAT)
+    if stints:
+        shares = stint_shares(stints, duration_ms)
+        total_cost = sum(cents for _, _, _, cents in stints) / 100
+    else:
+        shares = attribute_cost(participants, events, duration_ms, total_cost)
+    person_ms = sum(person_ms for person_ms, _ in shares.values())
+
+    groups = {("total", "all"): [person_ms, total_cost], ("series", series_key(room, started)): [person_ms, total_cost]}
+    for dimension, column in DIMENSIONS.items():
+        if column is None:
+            continue
+        for name, (share_ms, share_cost) in shares.items():
+            employee = employees.get(name)
+            value = UNKNOWN if employee is None else (employee[column] or UNASSIGNED)
+            group = groups.setdefault((dimension, value), [0, 0.0])
+            group[0] += share_ms
+            group[1] += share_cost
+
+    rows = []
+    for period, period_start in period_starts(started).items():
+        for (dimension, value), (group_ms, group_cost) in groups.items():
+            rows.append((period, dimension, period_start, value, 1, group_ms, group_cost))
+    return rows
+
+
+class CostAnalytics:
+    """Rollup tables kept next to the meetings they summarize in MeetingHistory.db."""
+
+    def __init__(self, history):
+        self.history = history
+        self.conn = history.conn
+        self.conn.executescript(ROLLUP_SCHEMA)
+
+    def apply_pending(self, employees):
+        """Add every meeting not yet in the rollups. employees maps name -> Employees row. Returns the count."""
+        pending = [row[0] for row in self.conn.execute(
+            "SELECT id FROM meetings WHERE id NOT IN (SELECT meeting_id FROM rollup_applied) ORDER BY id")]
+        for start in range(0, len(pending), APPLY_BATCH):
+            with self.conn:
+                for meeting_id in pending[start:start + APPLY_BATCH]:
+                    self._apply(meeting_id, employees)
+        return len(pending)
+
+    def _apply(self, meeting_id, employees):
+        conn = self.conn
+        meeting = conn.execute(
+            "SELECT started_at, ended_at, duration_ms, total_cost, room FROM meetings WHERE id = ?",
+            (meeting_id,)).fetchone()
+        participants = conn.execute(
+            "SELECT name, hourly_wage FROM meeting_participants WHERE meeting_id = ? ORDER BY rowid",
+            (meeting_id,)).fetchall()
+        events = conn.execute(
+            "SELECT elapsed_ms, name, kind, rate_delta FROM meeting_events WHERE meeting_id = ? ORDER BY seq",
+            (meeting_id,)).fetchall()
+        stints = conn.execute(
+            "SELECT name, join_ms, leave_ms, cost_cents FROM meeting_stints WHERE meeting_id = ? ORDER BY rowid",
+            (meeting_id,)).fetchall()
+        conn.executemany(
+            "INSERT INTO rollup_costs (period, dimension, period_start, value, meetings, person_ms, cost) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (period, dimension, period_start, value) DO UPDATE SET "
+            "meetings = meetings + excluded.meetings, person_ms = person_ms + excluded.person_ms, "
+            "cost = cost + excluded.cost",
+            rollup_rows(meeting, participants, [(ms or 0, name, kind, delta) for ms, name, kind, delta in events],
+                        employees, stints))
+        conn.execute("INSERT INTO rollup_applied (meeting_id) VALUES (?)", (meeting_id,))
+
+    def rebuild(self, employees):
+        """Recompute every rollup, e.g. after employees moved between departments."""
+        with self.conn:
+            self.conn.execute("DELETE FROM rollup_costs")
+            self.conn.execute("DELETE FROM rollup_applied")
+        return self.apply_pending(employees)
+
+    def report(self, dimension, period="week", since=None, until=None):
+        """Rows of REPORT_COLUMNS for periods overlapping [since, until), most expensive first per period."""
+        if dimension not in DIMENSIONS or period not in PERIODS:
+            raise ValueError(f"Unknown dimension or period: {dimension}, {period}")
+        clauses, params = ["period = ?", "dimension = ?"], [period, dimension]
+        if since:
+            if period == "week":
+                # Weeks are keyed by their Monday; keep the week since falls in
+                since = date.fromisoformat(since)
+                since = (since - timedelta(days=since.weekday())).isoformat()
+            clauses.append("period_start >= ?")
+            params.append(since)
+        if until:
+            clauses.append("period_start < ?")
+            params.append(until)
+        return [(period_start, value, meetings, person_ms / MS_PER_HOUR, cost)
+                for period_start, value, meetings, person_ms, cost in self.conn.execute(
+                    "SELECT period_start, value, meetings, person_ms, cost FROM rollup_costs "
+                    f"WHERE {' AND '.join(clauses)} ORDER BY period_start, cost DESC", params)]
+
+
+def write_csv(rows, f):
+    writer = csv.writer(f)
+    writer.writerow(REPORT_COLUMNS)
+    for period_start, value, meetings, person_hours, cost in rows:
+        writer.writerow([period_start, value, meetings, f"{person_hours:.2f}", f"{cost:.2f}"])
+
+
+def write_parquet(rows, path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)") from None
+    columns = list(zip(*rows)) if rows else [()] * len(REPORT_COLUMNS)
+    table = pa.table({
+        "period_start": pa.array(columns[0], pa.string()),
+        "value": pa.array(columns[1], pa.string()),
+        "meetings": pa.array(columns[2], pa.int64()),
+        "person_hours": pa.array(columns[3], pa.float64()),
+        "cost": pa.array(columns[4], pa.float64()),
+    })
+    pq.write_table(table, path)
+
+
+def export_report(rows, path):
+    """Write report rows as Parquet if path ends in .parquet, CSV otherwise."""
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        write_parquet(rows, path)
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            write_csv(rows, f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Meeting cost rollups by department, cost center and worksite")
+    parser.add_argument("--db", default="MeetingHistory.db", help="history database file")
+    parser.add_argument("--employees", default="EmployeeData.db", help="employee database with departments")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("update", help="add meetings recorded since the last update")
+    commands.add_parser("rebuild", help="recompute every rollup from scratch")
+
+    report_cmd = commands.add_parser("report", help="cost per period and group")
+    report_cmd.add_argument("--by", choices=DIMENSIONS, default="department")
+    report_cmd.add_argument("--period", choices=PERIODS, default="week")
+    report_cmd.add_argument("--since", help="YYYY-MM-DD, inclusive")
+    report_cmd.add_argument("--until", help="YYYY-MM-DD, exclusive")
+    report_cmd.add_argument("-o", "--output", help="write a .csv or .parquet file instead of printing")
+
+    args = parser.parse_args(argv)
+    with MeetingHistory(args.db) as history:
+        analytics = CostAnalytics(history)
+        if args.command == "update":
+            print(f"Applied {analytics.apply_pending(load_employees(args.employees)[0])} meetings")
+        elif args.command == "rebuild":
+            print(f"Rebuilt rollups from {analytics.rebuild(load_employees(args.employees)[0])} meetings")
+        elif args.command == "report":
+            rows = analytics.report(args.by, args.period, args.since, args.until)
+            if args.output:
+                try:
+                    export_report(rows, args.output)
+                except RuntimeError as e:
+                    sys.exit(str(e))
+                print(f"Wrote {len(rows)} rows to {args.output}")
+            else:
+                write_csv(rows, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Where TimeIsMoney keeps its databases and logs.
+
+Each path is resolved, highest priority first, from the command line, the
+environment, a config file, and finally the shared app directory:
+
+    --app-dir / --employee-db / --history-db / --log-dir / --journal
+    TIMEISMONEY_APP_DIR, TIMEISMONEY_EMPLOYEE_DB, TIMEISMONEY_HISTORY_DB,
+    TIMEISMONEY_LOG_DIR, TIMEISMONEY_JOURNAL
+    [paths] app_dir, employee_db, history_db, log_dir, journal
+
+The config file is --config, else TIMEISMONEY_CONFIG, else the first of
+timeismoney.ini next to the program and ~/.timeismoney.ini that exists.
+Relative paths in it are relative to the file.
+"""
+import argparse
+import configparser
+import os
+from dataclasses import dataclass
+
+DEFAULT_APP_DIR = "G:\\expo\\Software\\TimeIsMoney\\TimeIsMoney"
+CONFIG_NAME = "timeismoney.ini"
+# setting -> (environment variable, file name inside app_dir)
+PATH_SETTINGS = {
+    "employee_db": ("TIMEISMONEY_EMPLOYEE_DB", "EmployeeData.db"),
+    "history_db": ("TIMEISMONEY_HISTORY_DB", "MeetingHistory.db"),
+    "log_dir": ("TIMEISMONEY_LOG_DIR", "session logs"),
+    "journal": ("TIMEISMONEY_JOURNAL", "MeetingJournal.log"),
+}
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    app_dir: str
+    employee_db: str
+    history_db: str
+    log_dir: str
+    journal: str
+    config_file: str = None  # The file the settings came from, if any
+    profile_startup: bool = False
+
+
+def find_config_file(explicit=None):
+    if explicit:
+        return explicit
+    if os.environ.get("TIMEISMONEY_CONFIG"):
+        return os.environ["TIMEISMONEY_CONFIG"]
+    for candidate in (os.path.join(os.path.dirname(os.path.abspath(__file__)), CONFIG_NAME),
+                      os.path.join(os.path.expanduser("~"), f".{CONFIG_NAME}")):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def read_config_file(path):
+    parser = configparser.ConfigParser()
+    if not parser.read(path, encoding="utf-8"):
+        raise FileNotFoundError(f"Config file not found: {path}")
+    base = os.path.dirname(os.path.abspath(path))
+    return {key: os.path.join(base, os.path.expanduser(value))
+            for key, value in parser.items("paths") if value} if parser.has_section("paths") else {}
+
+
+def parse_args(argv):
+    """(namespace, remaining argv). Unknown options are left for Qt."""
+    parser = argparse.ArgumentParser(description="TimeIsMoney meeting cost tracker")
+    parser.add_argument("--config", help=f"settings file (default: {CONFIG_NAME} next to the app or in ~)")
+    parser.add_argument("--app-dir", help="directory holding the databases and logs")
+    parser.add_argument("--employee-db", help="employee database (EmployeeData.db)")
+    parser.add_argument("--history-db", help="meeting history database (MeetingHistory.db)")
+    parser.add_argument("--log-dir", help="directory for HTML/XML session logs")
+    parser.add_argument("--journal", help="crash-recovery journal file")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print import and init timings per startup phase, then exit")
+    return parser.parse_known_args(argv)
+
+
+def load_config(argv=()):
+    """AppConfig from argv (without the program name), the environment and the config file.
+
+    Also returns the arguments it didn't recognise, for QApplication.
+    """
+    args, remaining = parse_args(list(argv))
+    config_file = find_config_file(args.config)
+    settings = read_config_file(config_file) if config_file else {}
+
+    def pick(key, env_var):
+        return getattr(args, key) or os.environ.get(env_var) or settings.get(key)
+
+    app_dir = pick("app_dir", "TIMEISMONEY_APP_DIR") or DEFAULT_APP_DIR
+    paths = {key: pick(key, env_var) or os.path.join(app_dir, default_name)
+             for key, (env_var, default_name) in PATH_SETTINGS.items()}
+    return AppConfig(app_dir=app_dir, config_file=config_file, profile_startup=args.profile_startup,
+                     **paths), remaining
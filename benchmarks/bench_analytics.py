@@ -0,0 +1,98 @@
+"""Dashboard query latency: precomputed rollups vs rescanning raw meeting events.
+
+Builds a synthetic history of three years of meetings, applies the rollups
+and times a year-long weekly cost-center report both ways. Run from the
+repository root:
+    python -m benchmarks.bench_analytics
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from analytics import CostAnalytics, attribute_cost
+from meeting_history import DATE_FORMAT, MeetingHistory
+
+MEETINGS = 30000
+EMPLOYEES = 300
+DAYS = 3 * 365
+COST_CENTERS = ("LABOR", "GENERAL", "EXECUTIVE", "SALES", "SHOP")
+
+
+def build(history, rng, meetings=MEETINGS):
+    employees = {f"emp{i}": (f"emp{i}", rng.randint(15, 60), f"DEPT{i % 11}", COST_CENTERS[i % len(COST_CENTERS)],
+                             f"SITE{i % 3}", "yes") for i in range(EMPLOYEES)}
+    names = list(employees)
+    first_day = datetime(2022, 1, 3, 8)
+    records = []
+    for i in range(meetings):
+        started = first_day + timedelta(days=rng.randrange(DAYS), minutes=15 * rng.randrange(40))
+        duration_ms = rng.randrange(15, 120) * 60000
+        attendees = rng.sample(names, rng.randint(3, 12))
+        late = attendees.pop()
+        events = [(duration_ms // 3, late, "join", float(employees[late][1]))]
+        participants = [(name, float(employees[name][1])) for name in attendees + [late]]
+        cost = sum(wage * duration_ms for _, wage in participants[:-1]) / 3600000 \
+            + participants[-1][1] * (duration_ms - duration_ms // 3) / 3600000
+        records.append((started.strftime(DATE_FORMAT), (started + timedelta(milliseconds=duration_ms)).strftime(
+            DATE_FORMAT), duration_ms, cost, "app", f"synthetic_{i}", participants, events, f"Room {i % 4}"))
+    with history.conn:
+        for record in records:
+            history._insert(record)
+    return employees
+
+
+def raw_report(history, employees, since, until):
+    # What a report costs without rollups: every meeting's participants and events, attributed on the fly
+    totals = {}
+    meetings = history.conn.execute(
+        "SELECT id, started_at, duration_ms, total_cost FROM meetings WHERE started_at >= ? AND started_at < ?",
+        (since, until)).fetchall()
+    for meeting_id, started_at, duration_ms, total_cost in meetings:
+        participants = history.conn.execute(
+            "SELECT name, hourly_wage FROM meeting_participants WHERE meeting_id = ?", (meeting_id,)).fetchall()
+        events = history.conn.execute(
+            "SELECT elapsed_ms, name, kind, rate_delta FROM meeting_events WHERE meeting_id = ? ORDER BY seq",
+            (meeting_id,)).fetchall()
+        day = datetime.strptime(started_at, DATE_FORMAT).date()
+        week = (day - timedelta(days=day.weekday())).isoformat()
+        for name, (_, cost) in attribute_cost(participants, events, duration_ms, total_cost).items():
+            key = (week, employees[name][3])
+            totals[key] = totals.get(key, 0.0) + cost
+    return totals
+
+
+def run(seed=0):
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        with MeetingHistory(os.path.join(tmp, "history.db")) as history:
+            employees = build(history, rng)
+            analytics = CostAnalytics(history)
+
+            started = time.perf_counter()
+            analytics.apply_pending(employees)
+            apply_s = time.perf_counter() - started
+
+            since, until = "2023-01-02", "2024-01-01"
+            started = time.perf_counter()
+            rows = analytics.report("cost_center", "week", since, until)
+            rollup_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            totals = raw_report(history, employees, since, until)
+            raw_s = time.perf_counter() - started
+
+    assert abs(sum(row[4] for row in rows) - sum(totals.values())) < 0.01
+    return apply_s, rollup_s, raw_s, len(rows)
+
+
+def main():
+    apply_s, rollup_s, raw_s, rows = run()
+    print(f"Rollups for {MEETINGS:,} meetings applied in {apply_s:.2f} s ({MEETINGS / apply_s:,.0f} meetings/s)")
+    print(f"Weekly cost-center report for one year ({rows} rows): "
+          f"{rollup_s * 1e3:.1f} ms from rollups, {raw_s * 1e3:.0f} ms rescanning events")
+
+
+if __name__ == "__main__":
+    main()
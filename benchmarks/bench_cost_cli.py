@@ -0,0 +1,60 @@
+"""Headless batch pricing throughput: meetings per second through cost_cli.
+
+Run from the repository root:
+    python -m benchmarks.bench_cost_cli
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import cost_cli
+
+MEETINGS = 10000
+EMPLOYEES = 2000
+
+
+def write_calendar(path, meetings=MEETINGS, employees=EMPLOYEES, seed=0):
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 6, 8, 0)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["meeting_id", "title", "start", "end", "attendee", "joined", "left"])
+        for meeting in range(meetings):
+            start = base + timedelta(minutes=30 * meeting)
+            end = start + timedelta(minutes=rng.choice((15, 30, 45, 60, 90)))
+            for attendee in rng.sample(range(employees), rng.randint(2, 12)):
+                late = rng.random() < 0.2
+                joined = (start + timedelta(minutes=5)).isoformat() if late else ""
+                writer.writerow([f"m{meeting}", "Sync", start.isoformat(), end.isoformat(), f"emp{attendee}",
+                                 joined, ""])
+
+
+def run():
+    wages = {f"emp{i}": 15 + i % 45 for i in range(EMPLOYEES)}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "meetings.csv")
+        write_calendar(path)
+
+        started = time.perf_counter()
+        meetings = cost_cli.read_meetings(path)
+        parse_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = cost_cli.price_meetings(meetings, wages)
+        price_s = time.perf_counter() - started
+    return len(results), parse_s, price_s
+
+
+def main():
+    count, parse_s, price_s = run()
+    print(f"PyQt6 imported: {'PyQt6' in sys.modules}")
+    print(f"Parsed {count} meetings in {parse_s * 1e3:.1f} ms ({count / parse_s:,.0f} meetings/s)")
+    print(f"Priced {count} meetings in {price_s * 1e3:.1f} ms ({count / price_s:,.0f} meetings/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Tick cost of CostEngine vs. the old per-tick rescan, from 10 to 10,000 participants.
+
+Run from the repository root:
+    python -m benchmarks.bench_cost_engine
+"""
+import random
+import timeit
+
+from cost_engine import CostEngine
+
+SIZES = (10, 100, 1000, 10000)
+TICKS = 2000
+
+
+def legacy_total_cost(incurred_cost, participant_times, participant_wages, elapsed_ms):
+    # The calculate_total_cost loop that used to run on every 10 ms tick
+    total_cost = incurred_cost
+    for name in participant_times:
+        time_in_ms = elapsed_ms - participant_times[name]
+        total_cost += participant_wages[name] * (time_in_ms / 3600000.0)
+    return total_cost
+
+
+def run(sizes=SIZES, ticks=TICKS):
+    rng = random.Random(0)
+    results = []
+    for size in sizes:
+        wages = {f"emp{i}": rng.randint(15, 60) for i in range(size)}
+        join_times = {name: rng.randint(0, 60000) for name in wages}
+
+        engine = CostEngine()
+        for name, joined in sorted(join_times.items(), key=lambda item: item[1]):
+            engine.join(name, wages[name], joined)
+
+        elapsed = 120000
+        engine_s = timeit.timeit(lambda: engine.cost_at(elapsed), number=ticks)
+        legacy_s = timeit.timeit(lambda: legacy_total_cost(0.0, join_times, wages, elapsed), number=ticks)
+
+        expected = legacy_total_cost(0.0, join_times, wages, elapsed)
+        assert abs(engine.cost_at(elapsed) - expected) < 1e-6 * max(1.0, expected)
+
+        results.append({
+            "participants": size,
+            "engine_us_per_tick": engine_s / ticks * 1e6,
+            "legacy_us_per_tick": legacy_s / ticks * 1e6,
+        })
+    return results
+
+
+def main():
+    print(f"{'participants':>12} {'engine us/tick':>15} {'rescan us/tick':>15}")
+    for row in run():
+        print(f"{row['participants']:>12} {row['engine_us_per_tick']:>15.3f} {row['legacy_us_per_tick']:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
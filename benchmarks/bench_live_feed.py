@@ -0,0 +1,159 @@
+"""Live feed load test: many SSE and WebSocket subscribers on one LiveFeed.
+
+A publisher thread stands in for the GUI render loop, offering state at 30 Hz;
+the feed's rate limit and coalescing decide what is actually broadcast. Reports
+what publishing costs the publisher (which should not grow with subscribers),
+frames delivered and end-to-end latency. Run from the repository root:
+    python -m benchmarks.bench_live_feed --clients 500 --seconds 5
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import struct
+import threading
+import time
+
+from live_feed import LiveFeed
+
+TICK_HZ = 30
+
+
+def raise_fd_limit(clients):
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = clients * 2 + 64  # Both ends of every connection live in this process
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+
+def state(seq):
+    rooms = [{"room": f"Room {i}", "live": True, "elapsed_ms": seq * 33, "rate": 120.0 + i, "cost": seq * 0.01,
+              "participants": 6, "events": []} for i in range(3)]
+    return {"updated_at": time.time() * 1000, "live_rooms": 3, "rate": 363.0, "cost": seq * 0.03, "rooms": rooms}
+
+
+def publish_loop(feed, seconds, stop, timings):
+    interval = 1 / TICK_HZ
+    seq = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline and not stop.is_set():
+        started = time.perf_counter()
+        # Same shape as TimeIsMoney.publish_live_state
+        if feed.due():
+            feed.publish(state(seq))
+        timings.append(time.perf_counter() - started)
+        seq += 1
+        time.sleep(interval)
+
+
+async def sse_client(port, latencies, counts, index):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    await reader.readuntil(b"\r\n\r\n")
+    try:
+        while True:
+            message = await reader.readuntil(b"\n\n")
+            record(message[len(b"data: "):-2], latencies, counts, index)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def ws_client(port, latencies, counts, index):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write(f"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                 f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode())
+    await reader.readuntil(b"\r\n\r\n")
+    try:
+        while True:
+            _, size = await reader.readexactly(2)
+            if size == 126:
+                size = struct.unpack("!H", await reader.readexactly(2))[0]
+            elif size == 127:
+                size = struct.unpack("!Q", await reader.readexactly(8))[0]
+            record(await reader.readexactly(size), latencies, counts, index)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def record(payload, latencies, counts, index):
+    message = json.loads(payload)
+    if "updated_at" in message:
+        latencies.append(time.time() * 1000 - message["updated_at"])
+        counts[index] += 1
+
+
+async def run_clients(port, clients, seconds, stop):
+    latencies = []
+    counts = [0] * clients
+    tasks = []
+    for i in range(clients):
+        client = sse_client if i % 2 else ws_client
+        tasks.append(asyncio.ensure_future(client(port, latencies, counts, i)))
+        if i % 100 == 99:
+            await asyncio.sleep(0)  # Let the accept backlog drain
+    await asyncio.sleep(seconds)
+    stop.set()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return latencies, counts
+
+
+def run(clients=500, seconds=5.0, feed_hz=4):
+    raise_fd_limit(clients)
+    feed = LiveFeed(port=0, max_hz=feed_hz)
+    port = feed.start()
+    stop = threading.Event()
+    timings = []
+    publisher = threading.Thread(target=publish_loop, args=(feed, seconds + 1, stop, timings))
+    publisher.start()
+    latencies, counts = asyncio.run(run_clients(port, clients, seconds, stop))
+    publisher.join()
+    broadcasts = feed.stats()["broadcasts"]
+    feed.stop()
+    latencies.sort()
+    timings.sort()
+
+    def pct(values, p):
+        return values[min(len(values) - 1, int(len(values) * p))] if values else float("nan")
+
+    return {
+        "clients": clients,
+        "connected": sum(1 for count in counts if count),
+        "ticks": len(timings),
+        "broadcasts": broadcasts,
+        "frames": sum(counts),
+        "frames_per_client": sum(counts) / clients,
+        "publish_us_p50": pct(timings, 0.5) * 1e6,
+        "publish_us_p99": pct(timings, 0.99) * 1e6,
+        "latency_ms_p50": pct(latencies, 0.5),
+        "latency_ms_p99": pct(latencies, 0.99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--hz", type=float, default=4, help="Feed broadcast rate limit")
+    args = parser.parse_args()
+    for clients in sorted({1, args.clients}):
+        r = run(clients, args.seconds, args.hz)
+        print(f"{r['clients']:>5} clients ({r['connected']} received): {r['ticks']} ticks -> {r['broadcasts']} "
+              f"broadcasts, {r['frames']} frames ({r['frames_per_client']:.1f}/client); "
+              f"publisher {r['publish_us_p50']:.1f}/{r['publish_us_p99']:.1f} us p50/p99; "
+              f"latency {r['latency_ms_p50']:.1f}/{r['latency_ms_p99']:.1f} ms p50/p99")
+
+
+if __name__ == "__main__":
+    main()
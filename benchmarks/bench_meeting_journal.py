@@ -0,0 +1,54 @@
+"""Per-event cost of the meeting journal, and how many fsyncs the group commit saves.
+
+Run from the repository root:
+    python -m benchmarks.bench_meeting_journal
+"""
+import os
+import tempfile
+import time
+
+from meeting_journal import MeetingJournal, replay
+
+EVENTS = 20000
+
+
+def run(events=EVENTS):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "journal.log")
+        journal = MeetingJournal(path)
+        meeting_id = journal.start("Room 1", int(time.time() * 1000), [("emp0", 20.0)])
+
+        started = time.perf_counter()
+        for i in range(events):
+            journal.join(meeting_id, f"emp{i}", i, 20.0)
+        append_s = time.perf_counter() - started
+        journal.sync()
+        durable_s = time.perf_counter() - started
+        journal.close()
+
+        started = time.perf_counter()
+        meeting, = replay(path)
+        replay_s = time.perf_counter() - started
+        assert len(meeting.events) == events
+        cost = meeting.cost_engine().cost_at(events)
+
+        # Baseline: the same records with an fsync each
+        started = time.perf_counter()
+        with open(os.path.join(tmp, "naive.log"), "a", encoding="utf-8") as f:
+            for i in range(min(events, 500)):
+                f.write(f'{{"t":"join","n":"emp{i}","ms":{i},"w":20.0}}\n')
+                f.flush()
+                os.fsync(f.fileno())
+        naive_us = (time.perf_counter() - started) / min(events, 500) * 1e6
+    return append_s / events * 1e6, durable_s, replay_s, naive_us, cost
+
+
+def main():
+    append_us, durable_s, replay_s, naive_us, _ = run()
+    print(f"{EVENTS} journaled events: {append_us:.2f} us/append on the caller, durable after {durable_s * 1e3:.0f} ms")
+    print(f"fsync per event instead: {naive_us:.1f} us/event")
+    print(f"Replay: {replay_s * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
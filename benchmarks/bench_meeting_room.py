@@ -0,0 +1,229 @@
+"""Meeting room hot paths end to end, on synthetic employee databases of 100 to 100k rows.
+
+For each roster size a real TimeIsMoney window is opened headless (offscreen
+Qt) on a temporary app directory, and one meeting is driven through:
+
+    bulk_add     Add All Employees into a running meeting (cost engine, event log and journal joins)
+    tick         one render tick (update_timer, calculate_total_cost, label repaints), forced to repaint
+    search       one keystroke of update_search_results, typing names letter by letter
+    end/export   end_meeting on the GUI thread, then until save_meeting_data's export has finished
+
+stdout is discarded while measuring so console speed doesn't skew the numbers.
+Results can be written as JSON and compared against an earlier run:
+
+    python -m benchmarks.bench_meeting_room --json before.json
+    python -m benchmarks.bench_meeting_room --compare before.json --tolerance 0.25
+
+--profile DIR also writes one cProfile file per phase and size (slower, so
+the timings of a profiled run are not comparable); view them with
+`python -m pstats`, snakeviz or flameprof for a flame graph.
+"""
+import argparse
+import contextlib
+import cProfile
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import PYQT_VERSION_STR, QT_VERSION_STR, QEvent, QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from app_config import load_config
+from benchmarks.bench_employee_index import synthetic_names
+from main import TimeIsMoney
+
+SIZES = (100, 1000, 10000, 100000)
+TICKS = 500
+DEPARTMENTS = ("OFFICE", "DRIVER", "TABLETOP", "PARTY_RENTAL", "DISPATCH", "WAREHOUSE", "EXECUTIVE", "SALES",
+               "CREATIVE", "AUDIO_VISUAL", "TRADE_SHOW")
+COST_CENTERS = ("LABOR", "GENERAL", "EXECUTIVE", "SALES", "SHOP")
+MISS_QUERY = "qzx"  # Typed after the names: a keystroke sequence that stops matching
+
+
+def build_employee_db(path, size, seed=0):
+    names, seen = [], set()
+    for name in synthetic_names(size, seed):
+        unique, n = name, 1
+        while unique in seen:
+            n += 1
+            unique = f"{name} {n}"
+        seen.add(unique)
+        names.append(unique)
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE Employees (name TEXT, working_wage INTEGER, department TEXT, cost_center TEXT, "
+                     "worksite_assignment TEXT, has_benefits TEXT)")
+        conn.executemany("INSERT INTO Employees VALUES (?, ?, ?, ?, ?, ?)",
+                         ((name, 15 + i % 46, DEPARTMENTS[i % len(DEPARTMENTS)], COST_CENTERS[i % len(COST_CENTERS)],
+                           f"SITE{i % 3}", "yes" if i % 2 else "no") for i, name in enumerate(names)))
+    conn.close()
+    return names
+
+
+class Phases:
+    """Times (and optionally profiles) named phases for one roster size."""
+
+    def __init__(self, size, profile_dir=None):
+        self.size = size
+        self.profile_dir = profile_dir
+
+    @contextlib.contextmanager
+    def measure(self, phase, out):
+        profiler = cProfile.Profile() if self.profile_dir else None
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if profiler:
+                profiler.enable()
+            started = time.perf_counter()
+            yield
+            out.append(time.perf_counter() - started)
+            if profiler:
+                profiler.disable()
+        if profiler:
+            profiler.dump_stats(os.path.join(self.profile_dir, f"{phase}_{self.size}.prof"))
+
+
+def wait_for_pool(app):
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def run_size(app, size, ticks=TICKS, profile_dir=None):
+    phases = Phases(size, profile_dir)
+    with tempfile.TemporaryDirectory() as tmp:
+        names = build_employee_db(os.path.join(tmp, "EmployeeData.db"), size)
+        config, _ = load_config(["--app-dir", tmp])
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            window = TimeIsMoney(config)
+            window.show()
+            wait_for_pool(app)  # Employee load
+            room = window.current_room()
+            room.add_participant(names[0], "benchmark")
+            room.start_meeting()
+
+        bulk_add = []
+        with phases.measure("bulk_add", bulk_add):
+            room.add_all_employees()
+            app.processEvents()
+
+        tick = []
+        scheduler = window.render_scheduler
+        with phases.measure("tick", []):
+            for _ in range(ticks):
+                started = time.perf_counter()
+                scheduler.invalidate()
+                scheduler.tick()
+                app.processEvents()
+                tick.append(time.perf_counter() - started)
+
+        keystrokes = []
+        with phases.measure("search", []):
+            for query in (names[len(names) // 2], names[-1].split()[-1].lower(), MISS_QUERY):
+                for end in range(1, len(query) + 1):
+                    started = time.perf_counter()
+                    room.update_search_results(query[:end])
+                    app.processEvents()
+                    keystrokes.append(time.perf_counter() - started)
+
+        end_meeting, export = [], []
+        with phases.measure("end_meeting", end_meeting):
+            room.end_meeting()
+        with phases.measure("export", export):
+            wait_for_pool(app)  # History DB, rollups and HTML/XML on the thread pool
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            window.close()  # Also stops the roster watcher and reload timer before the next size
+            wait_for_pool(app)
+        participants = len(room.participants)
+        window.deleteLater()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)  # Gone before its temp dir is removed
+        app.processEvents()
+
+    return {
+        "participants": participants,
+        "bulk_add_ms": bulk_add[0] * 1e3,
+        "tick_us_mean": statistics.fmean(tick) * 1e6,
+        "tick_us_p95": statistics.quantiles(tick, n=20)[-1] * 1e6,
+        "search_keystroke_ms_mean": statistics.fmean(keystrokes) * 1e3,
+        "search_keystroke_ms_max": max(keystrokes) * 1e3,
+        "end_meeting_ms": end_meeting[0] * 1e3,
+        "export_ms": (end_meeting[0] + export[0]) * 1e3,
+    }
+
+
+def metadata():
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run(sizes=SIZES, ticks=TICKS, profile_dir=None):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    return {"meta": metadata(), "ticks": ticks,
+            "sizes": {str(size): run_size(app, size, ticks, profile_dir) for size in sizes}}
+
+
+def compare(results, baseline, tolerance):
+    """Print each metric against the baseline; returns the (size, metric) pairs slower by more than tolerance."""
+    regressions = []
+    print(f"{'size':>7}  {'metric':<26} {'baseline':>10} {'now':>10} {'change':>8}")
+    for size, metrics in results["sizes"].items():
+        before = baseline["sizes"].get(size)
+        if before is None:
+            continue
+        for metric, value in metrics.items():
+            if metric == "participants" or not before.get(metric):
+                continue
+            change = value / before[metric] - 1
+            flag = " REGRESSION" if change > tolerance else ""
+            if flag:
+                regressions.append((size, metric))
+            print(f"{size:>7}  {metric:<26} {before[metric]:>10.3f} {value:>10.3f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Meeting room hot-path benchmarks on synthetic rosters")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="employee rows per run")
+    parser.add_argument("--ticks", type=int, default=TICKS, help="render ticks timed per size")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="results file from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="slowdown that counts as a regression with --compare (default 0.2 = 20%%)")
+    parser.add_argument("--profile", metavar="DIR", help="write a cProfile .prof file per phase and size")
+    args = parser.parse_args(argv)
+    if args.profile and args.compare:
+        print("Note: profiling slows every phase down, expect spurious regressions", file=sys.stderr)
+
+    results = run(args.sizes, args.ticks, args.profile)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            sys.exit(f"{len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}")
+        return
+    print(f"{'size':>7} {'bulk add':>10} {'tick':>9} {'tick p95':>9} {'keystroke':>10} {'max key':>9} "
+          f"{'end':>8} {'export':>9}")
+    for size, row in results["sizes"].items():
+        print(f"{size:>7} {row['bulk_add_ms']:>8.1f}ms {row['tick_us_mean']:>7.0f}us {row['tick_us_p95']:>7.0f}us "
+              f"{row['search_keystroke_ms_mean']:>8.2f}ms {row['search_keystroke_ms_max']:>7.2f}ms "
+              f"{row['end_meeting_ms']:>6.1f}ms {row['export_ms']:>7.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
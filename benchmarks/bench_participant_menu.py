@@ -0,0 +1,82 @@
+"""Latency and Qt object growth over 1,000 Add Participant menu opens.
+
+Compares the cached, lazily filled DepartmentMenu with the old approach of
+building eleven QMenus and one QAction per employee, all parented to the
+window, on every click. Runs headless on the offscreen Qt platform:
+    python -m benchmarks.bench_participant_menu
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QAction
+from PyQt6.QtWidgets import QApplication, QMenu, QWidget
+
+from department_menu import DepartmentMenu
+
+OPENS = 1000
+EMPLOYEES = 500
+DEPARTMENTS = ("OFFICE", "DRIVER", "TABLETOP", "PARTY_RENTAL", "DISPATCH", "WAREHOUSE", "EXECUTIVE", "SALES",
+               "CREATIVE", "AUDIO_VISUAL", "TRADE_SHOW")
+
+
+def legacy_open(window, employees, on_select):
+    # The body of the old show_participant_menu, minus the blocking exec()
+    menu = QMenu(window)
+    departments = {dept: QMenu(dept.replace("_", " ").title(), window) for dept in DEPARTMENTS}
+    for employee in employees:
+        name, _, department, _, _, _ = employee
+        if department in departments:
+            action = QAction(name, window)
+            action.triggered.connect(lambda checked, n=name: on_select(n))
+            departments[department].addAction(action)
+    for submenu in departments.values():
+        if not submenu.isEmpty():
+            menu.addMenu(submenu)
+    return menu
+
+
+def cached_open(window, employees, on_select, cache):
+    if "menu" not in cache:
+        cache["menu"] = DepartmentMenu(window, employees, on_select)
+    menu = cache["menu"]
+    # Hover one department so lazy population is part of the measurement
+    menu.actions()[0].menu().aboutToShow.emit()
+    return menu
+
+
+def qt_objects(window):
+    return len(window.findChildren(QAction)) + len(window.findChildren(QMenu))
+
+
+def run(opens=OPENS, employees=EMPLOYEES):
+    app = QApplication.instance() or QApplication(sys.argv)
+    roster = [(f"emp{i}", 20, DEPARTMENTS[i % len(DEPARTMENTS)], "", "", "") for i in range(employees)]
+    results = {}
+    for label, opener in (("legacy", legacy_open), ("cached", None)):
+        window = QWidget()
+        cache = {}
+        started = time.perf_counter()
+        for _ in range(opens):
+            if opener is None:
+                cached_open(window, roster, print, cache)
+            else:
+                opener(window, roster, print)
+            app.processEvents()
+        elapsed = time.perf_counter() - started
+        results[label] = {"ms_per_open": elapsed / opens * 1e3, "qt_objects": qt_objects(window)}
+        window.deleteLater()
+    return results
+
+
+def main():
+    results = run()
+    print(f"{OPENS} opens with {EMPLOYEES} employees")
+    for label, row in results.items():
+        print(f"{label:>7}: {row['ms_per_open']:.3f} ms/open, {row['qt_objects']} QMenu/QAction objects alive")
+
+
+if __name__ == "__main__":
+    main()
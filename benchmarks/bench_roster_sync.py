@@ -0,0 +1,79 @@
+"""Roster sync time for a nightly HR export of 50,000 employees.
+
+Times the first import into an empty database, a nightly re-sync where 2% of
+wages and departments changed and a re-sync with no changes, against an
+import that commits each row on its own (timed on BASELINE_ROWS rows and
+scaled up). Run from the repository root:
+    python -m benchmarks.bench_roster_sync
+"""
+import csv
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from roster_sync import UPSERT, sync_roster
+
+EMPLOYEES = 50000
+CHANGED = 0.02
+BASELINE_ROWS = 2000
+DEPARTMENTS = ("OFFICE", "DRIVER", "TABLETOP", "PARTY_RENTAL", "DISPATCH", "WAREHOUSE", "EXECUTIVE", "SALES")
+
+
+def write_export(path, roster):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Employee Number", "Full Name", "Hourly Rate", "Department", "Cost Center"])
+        for employee_id, (name, wage, department) in roster.items():
+            writer.writerow([employee_id, name, f"{wage:.2f}", department, "LABOR"])
+
+
+def timed_sync(db_path, csv_path, effective):
+    started = time.perf_counter()
+    plan = sync_roster(db_path, csv_path, effective)
+    return time.perf_counter() - started, plan
+
+
+def run(employees=EMPLOYEES, seed=0):
+    rng = random.Random(seed)
+    roster = {f"E{i:06d}": (f"Employee {i}", rng.randint(1500, 6000) / 100, rng.choice(DEPARTMENTS))
+              for i in range(employees)}
+    changed = rng.sample(sorted(roster), int(employees * CHANGED))
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, csv_path = os.path.join(tmp, "EmployeeData.db"), os.path.join(tmp, "export.csv")
+        write_export(csv_path, roster)
+        initial_s, _ = timed_sync(db_path, csv_path, "2024-01-01")
+
+        for employee_id in changed:
+            name, wage, _ = roster[employee_id]
+            roster[employee_id] = (name, round(wage * 1.03, 2), rng.choice(DEPARTMENTS))
+        write_export(csv_path, roster)
+        nightly_s, plan = timed_sync(db_path, csv_path, "2024-07-01")
+        assert plan.updated == len(changed), plan.summary()
+        noop_s, _ = timed_sync(db_path, csv_path, "2024-07-02")
+
+        # Baseline: one upsert and commit per row, as a hand-rolled import loop would do
+        baseline_path = os.path.join(tmp, "baseline.db")
+        sync_roster(baseline_path, csv_path)  # Same schema, then start over with an empty table
+        conn = sqlite3.connect(baseline_path)
+        with conn:
+            conn.execute("DELETE FROM Employees")
+        started = time.perf_counter()
+        for employee_id, (name, wage, department) in list(roster.items())[:BASELINE_ROWS]:
+            with conn:
+                conn.execute(UPSERT, (employee_id, name, wage, department, "LABOR", "", ""))
+        per_row_s = (time.perf_counter() - started) * employees / BASELINE_ROWS
+        conn.close()
+    return initial_s, nightly_s, noop_s, per_row_s, len(changed)
+
+
+def main():
+    initial_s, nightly_s, noop_s, per_row_s, changed = run()
+    print(f"First import of {EMPLOYEES:,} employees: {initial_s:.2f} s")
+    print(f"Nightly sync with {changed:,} changed: {nightly_s * 1e3:.0f} ms, unchanged export: {noop_s * 1e3:.0f} ms")
+    print(f"First import committing one row at a time: {per_row_s:.1f} s (scaled from {BASELINE_ROWS:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""Batch meeting cost calculator that runs without PyQt.
+
+Reads calendar exports and prices every meeting with the same CostEngine the
+desktop app uses, taking wages from EmployeeData.db:
+
+    python cost_cli.py meetings.csv calendar.ics --db EmployeeData.db -o costs.csv
+
+CSV input has one row per attendee per meeting with the columns
+meeting_id, title, start, end, attendee and optionally joined, left (ISO
+times for partial attendance) and wage (overrides the database). ICS input
+uses each VEVENT's UID, SUMMARY, DTSTART, DTEND/DURATION and ATTENDEE lines.
+Employees with a wage history (see roster_sync.py) are priced at the wage in
+effect on the meeting's date.
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from cost_engine import meeting_cost
+from employee_repository import load_employees, wage_at
+
+
+@dataclass
+class Meeting:
+    meeting_id: str
+    title: str
+    start: datetime
+    end: datetime
+    attendees: list = field(default_factory=list)  # (name, joined or None, left or None, wage or None)
+
+    @property
+    def duration_ms(self):
+        return max(0, int((self.end - self.start).total_seconds() * 1000))
+
+
+@dataclass
+class MeetingCost:
+    meeting: Meeting
+    cost: float
+    priced: int  # Attendees with a known wage
+    unknown: list  # Attendee names with no wage
+
+
+def parse_time(value):
+    """ISO 8601 or ICS (YYYYMMDD[THHMMSS[Z]]) timestamp to a naive local datetime."""
+    value = value.strip()
+    if re.fullmatch(r"\d{8}(T\d{6}Z?)?", value):
+        if len(value) == 8:
+            return datetime.strptime(value, "%Y%m%d")
+        parsed = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+        if value.endswith("Z"):
+            parsed = parsed.replace(tzinfo=timezone.utc)
+    else:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def parse_ics_duration(value):
+    match = re.fullmatch(r"P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?", value.strip())
+    if not match:
+        raise ValueError(f"Unsupported DURATION {value!r}")
+    weeks, days, hours, minutes, seconds = (int(part or 0) for part in match.groups())
+    return timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds)
+
+
+def read_csv(path):
+    meetings = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            meeting_id = row["meeting_id"]
+            meeting = meetings.get(meeting_id)
+            if meeting is None:
+                meeting = meetings[meeting_id] = Meeting(
+                    meeting_id, row.get("title", ""), parse_time(row["start"]), parse_time(row["end"]))
+            joined = row.get("joined") or None
+            left = row.get("left") or None
+            wage = row.get("wage") or None
+            meeting.attendees.append((
+                row["attendee"].strip(),
+                parse_time(joined) if joined else None,
+                parse_time(left) if left else None,
+                float(wage) if wage else None,
+            ))
+    return list(meetings.values())
+
+
+def _ics_lines(f):
+    # Undo RFC 5545 line folding
+    line = None
+    for raw in f:
+        raw = raw.rstrip("\r\n")
+        if raw[:1] in (" ", "\t") and line is not None:
+            line += raw[1:]
+            continue
+        if line is not None:
+            yield line
+        line = raw
+    if line is not None:
+        yield line
+
+
+def read_ics(path):
+    meetings = []
+    with open(path, encoding="utf-8-sig") as f:
+        event = None
+        for line in _ics_lines(f):
+            if line == "BEGIN:VEVENT":
+                event = {"attendees": []}
+                continue
+            if event is None:
+                continue
+            if line == "END:VEVENT":
+                if "DTSTART" in event:
+                    start = parse_time(event["DTSTART"])
+                    if "DTEND" in event:
+                        end = parse_time(event["DTEND"])
+                    else:
+                        end = start + parse_ics_duration(event.get("DURATION", "PT0S"))
+                    meeting = Meeting(event.get("UID", f"ics-{len(meetings) + 1}"), event.get("SUMMARY", ""),
+                                      start, end)
+                    meeting.attendees = [(name, None, None, None) for name in event["attendees"]]
+                    meetings.append(meeting)
+                event = None
+                continue
+            head, _, value = line.partition(":")
+            prop, *params = head.split(";")
+            prop = prop.upper()
+            if prop == "ATTENDEE":
+                name = None
+                for param in params:
+                    key, _, param_value = param.partition("=")
+                    if key.upper() == "CN":
+                        name = param_value.strip('"')
+                if not name:
+                    name = value.split(":", 1)[-1].split("@", 1)[0]
+                event["attendees"].append(name)
+            elif prop in ("UID", "SUMMARY", "DTSTART", "DTEND", "DURATION"):
+                event[prop] = value
+    return meetings
+
+
+def read_meetings(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".ics":
+        return read_ics(path)
+    if ext == ".csv":
+        return read_csv(path)
+    raise ValueError(f"Unsupported calendar export {path!r} (expected .csv or .ics)")
+
+
+def price_meeting(meeting, wages, history=None):
+    """Cost one meeting. wages maps casefolded employee name -> hourly wage, history
+    casefolded name -> [(effective_from, wage), ...] for wages that changed over time."""
+    start = meeting.start
+    end_ms = meeting.duration_ms
+    day = start.date().isoformat()
+    stints = []
+    unknown = []
+    for name, joined, left, wage in meeting.attendees:
+        if wage is None:
+            key = name.casefold()
+            wage = wage_at(history.get(key), day, wages.get(key)) if history else wages.get(key)
+        if wage is None:
+            unknown.append(name)
+            continue
+        join_ms = max(0, int((joined - start).total_seconds() * 1000)) if joined else 0
+        leave_ms = int((left - start).total_seconds() * 1000) if left else None
+        stints.append((name, wage, join_ms, leave_ms))
+    return MeetingCost(meeting, meeting_cost(stints, end_ms), len(stints), unknown)
+
+
+def price_meetings(meetings, wages, history=None):
+    return [price_meeting(meeting, wages, history) for meeting in meetings]
+
+
+def load_wages(db_path):
+    """(current wages, wage histories), both keyed by casefolded name."""
+    employees, history = load_employees(db_path)
+    return ({name.casefold(): row[1] for name, row in employees.items()},
+            {name.casefold(): wages for name, wages in history.items()})
+
+
+def write_results(results, f):
+    writer = csv.writer(f)
+    writer.writerow(["meeting_id", "title", "start", "duration_min", "attendees", "unknown_attendees", "cost"])
+    for result in results:
+        meeting = result.meeting
+        writer.writerow([
+            meeting.meeting_id, meeting.title, meeting.start.isoformat(sep=" "),
+            f"{meeting.duration_ms / 60000:.1f}", result.priced, ";".join(result.unknown), f"{result.cost:.2f}",
+        ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute meeting costs from calendar exports without the GUI")
+    parser.add_argument("inputs", nargs="+", help="calendar exports (.csv or .ics)")
+    parser.add_argument("--db", default="EmployeeData.db", help="employee database with wages")
+    parser.add_argument("-o", "--output", help="write results to this CSV file instead of stdout")
+    args = parser.parse_args(argv)
+
+    wages, history = load_wages(args.db)
+    meetings = []
+    for path in args.inputs:
+        meetings.extend(read_meetings(path))
+    results = price_meetings(meetings, wages, history)
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            write_results(results, f)
+    else:
+        write_results(results, sys.stdout)
+    total = sum(result.cost for result in results)
+    print(f"{len(results)} meetings, total cost ${total:.2f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+
+MS_PER_HOUR = 3600000.0
+US_PER_MS = 1000
+US_PER_HOUR = 3_600_000_000
+CENTS = 100
+SIMULATION_BUFFER_MINUTES = 10  # Padding added to every simulated meeting length
+
+
+@dataclass(slots=True)
+class Stint:
+    """One continuous interval a participant spent in the meeting."""
+    join_ms: int
+    leave_ms: int | None  # None while still in the meeting
+    wage_cents: int  # Hourly wage in cents
+    cost_units: int = 0  # Cost of the closed stint in cent-microseconds per hour
+
+
+@dataclass(frozen=True)
+class ParticipantCost:
+    """Ledger entry for one participant: every stint and what it cost."""
+    name: str
+    department: str
+    stints: tuple  # (join_ms, leave_ms, cost_cents) per stint
+    time_ms: int
+    cost_cents: int
+
+    @property
+    def cost(self):
+        return self.cost_cents / CENTS
+
+
+def wage_cents(wage):
+    return round(wage * CENTS)
+
+
+def units_to_dollars(units):
+    return units / (CENTS * US_PER_HOUR)
+
+
+def units_to_cents(units):
+    # Round half up once, at the end, instead of accumulating float error along the way
+    return (units + US_PER_HOUR // 2) // US_PER_HOUR
+
+
+def allocate_cents(units):
+    """Whole cents for each amount in units that add up to the rounded total.
+
+    Each amount is rounded down, then the cents left over go to the amounts
+    with the largest remainders (earliest first on ties).
+    """
+    cents = [amount // US_PER_HOUR for amount in units]
+    leftover = units_to_cents(sum(units)) - sum(cents)
+    if leftover:
+        by_remainder = sorted(range(len(units)), key=lambda i: -(units[i] % US_PER_HOUR))
+        for i in by_remainder[:leftover]:
+            cents[i] += 1
+    return cents
+
+
+def department_subtotals(ledger):
+    """(department, cost) pairs summed from a ledger's cents, by department name."""
+    departments = {}
+    for entry in ledger:
+        departments[entry.department] = departments.get(entry.department, 0) + entry.cost_cents
+    return tuple((department, cents / CENTS) for department, cents in sorted(departments.items()))
+
+
+class CostEngine:
+    """Running meeting cost that stays O(1) per tick regardless of headcount.
+
+    Instead of rescanning every participant on each tick, the engine keeps the
+    summed hourly rate of everyone currently in the meeting and a checkpoint of
+    the cost accrued up to the last join/leave. The cost at any later moment is
+    then checkpoint + rate * time since checkpoint.
+
+    Everything is kept as integers (wages in cents, time in microseconds, cost
+    in cent-microseconds per hour) so hours of joins and leaves can't drift,
+    and converted to dollars only when read. Alongside the total the engine
+    keeps a ledger of every participant's stints and the same checkpoint per
+    department, each updated in O(1) per join/leave.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rate_cents = 0  # Sum of wages of participants currently in the meeting
+        self.checkpoint_us = 0  # Elapsed time of the last rate change
+        self.checkpoint_units = 0  # Cost accrued up to checkpoint_us
+        self.wages = {}  # Active participant -> hourly wage
+        self.join_times = {}  # Active participant -> elapsed ms at join
+        self.stints = {}  # Participant -> [Stint], everyone who has been in the meeting
+        self.departments = {}  # Participant -> department
+        self.department_totals = {}  # Department -> [rate_cents, checkpoint_us, checkpoint_units]
+
+    @property
+    def hourly_rate(self):
+        return self.rate_cents / CENTS
+
+    def _advance(self, elapsed_us):
+        self.checkpoint_units += self.rate_cents * (elapsed_us - self.checkpoint_us)
+        self.checkpoint_us = elapsed_us
+
+    def _department(self, department, elapsed_us):
+        totals = self.department_totals.get(department)
+        if totals is None:
+            totals = self.department_totals[department] = [0, elapsed_us, 0]
+        totals[2] += totals[0] * (elapsed_us - totals[1])
+        totals[1] = elapsed_us
+        return totals
+
+    def __contains__(self, name):
+        return name in self.wages
+
+    def __len__(self):
+        return len(self.wages)
+
+    def join(self, name, wage, elapsed_ms, department=""):
+        if name in self.wages:
+            return
+        elapsed_us = elapsed_ms * US_PER_MS
+        cents = wage_cents(wage)
+        self._advance(elapsed_us)
+        self.wages[name] = wage
+        self.join_times[name] = elapsed_ms
+        self.rate_cents += cents
+        self.stints.setdefault(name, []).append(Stint(elapsed_ms, None, cents))
+        self.departments[name] = department
+        self._department(department, elapsed_us)[0] += cents
+
+    def leave(self, name, elapsed_ms):
+        """Remove a participant and return the cost they incurred during this stint."""
+        if name not in self.wages:
+            return 0.0
+        elapsed_us = elapsed_ms * US_PER_MS
+        self._advance(elapsed_us)
+        del self.wages[name]
+        del self.join_times[name]
+        stint = self.stints[name][-1]
+        stint.leave_ms = elapsed_ms
+        stint.cost_units = stint.wage_cents * (elapsed_ms - stint.join_ms) * US_PER_MS
+        self.rate_cents -= stint.wage_cents
+        self._department(self.departments[name], elapsed_us)[0] -= stint.wage_cents
+        return units_to_dollars(stint.cost_units)
+
+    def units_at(self, elapsed_ms):
+        return self.checkpoint_units + self.rate_cents * (elapsed_ms * US_PER_MS - self.checkpoint_us)
+
+    def cost_at(self, elapsed_ms):
+        return units_to_dollars(self.units_at(elapsed_ms))
+
+    def cents_at(self, elapsed_ms):
+        """Cost at elapsed_ms rounded to whole cents; what ledger(elapsed_ms) adds up to."""
+        return units_to_cents(self.units_at(elapsed_ms))
+
+    def department_costs(self, elapsed_ms):
+        """(department, cost) pairs at elapsed_ms, by department name. O(departments)."""
+        elapsed_us = elapsed_ms * US_PER_MS
+        return [(department, units_to_dollars(units + rate * (elapsed_us - checkpoint_us)))
+                for department, (rate, checkpoint_us, units) in sorted(self.department_totals.items())]
+
+    def ledger(self, elapsed_ms):
+        """ParticipantCost for everyone who attended, open stints priced up to elapsed_ms. O(stints log stints).
+
+        Stint costs are allocated in whole cents that add up to cents_at(elapsed_ms),
+        so the exported participant costs sum to the exported total.
+        """
+        units = [stint.wage_cents * (elapsed_ms - stint.join_ms) * US_PER_MS if stint.leave_ms is None
+                 else stint.cost_units for stints in self.stints.values() for stint in stints]
+        cents = iter(allocate_cents(units))
+        entries = []
+        for name, stints in self.stints.items():
+            rows = tuple((stint.join_ms, stint.leave_ms, next(cents)) for stint in stints)
+            time_ms = sum((elapsed_ms if leave_ms is None else leave_ms) - join_ms for join_ms, leave_ms, _ in rows)
+            entries.append(ParticipantCost(name, self.departments[name], rows, time_ms,
+                                           sum(cost_cents for _, _, cost_cents in rows)))
+        return tuple(entries)
+
+
+def simulated_cost(hourly_rate, minutes, buffer_minutes=SIMULATION_BUFFER_MINUTES):
+    """Cost of a meeting of the given length at a fixed hourly rate, plus the usual buffer."""
+    return hourly_rate * ((minutes + buffer_minutes) / 60.0)
+
+
+def meeting_cost(stints, end_ms):
+    """Total cost of a finished meeting from (name, wage, join_ms, leave_ms or None) stints.
+
+    Stints are clamped to the meeting (join to [0, end_ms], leave to
+    [join, end_ms]); stints left with no time in it, e.g. joining after the end
+    or leaving before joining, are dropped. The rest are replayed through a
+    CostEngine in time order, so this is the same arithmetic the live window uses.
+    """
+    events = []
+    for name, wage, join_ms, leave_ms in stints:
+        join_ms = min(max(join_ms, 0), end_ms)
+        leave_ms = end_ms if leave_ms is None else min(max(leave_ms, join_ms), end_ms)
+        if leave_ms <= join_ms:
+            continue
+        events.append((join_ms, 1, name, wage))
+        events.append((leave_ms, 0, name, wage))
+    events.sort(key=lambda event: (event[0], event[1]))  # Leaves before joins at the same instant
+    engine = CostEngine()
+    for at_ms, is_join, name, wage in events:
+        if is_join:
+            engine.join(name, wage, at_ms)
+        else:
+            engine.leave(name, at_ms)
+    return engine.cost_at(end_ms)
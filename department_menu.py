@@ -0,0 +1,42 @@
+from PyQt6.QtWidgets import QMenu
+
+
+def department_label(department):
+    return department.replace("_", " ").title()
+
+
+class DepartmentMenu(QMenu):
+    """Add Participant menu with one submenu per department.
+
+    Departments come from the employees' department column. Submenus start
+    empty and get their employee actions the first time they are about to
+    show, so building the menu is O(departments) and the whole thing is meant
+    to be kept and reused until the employee data changes. Every action routes
+    through a single triggered connection instead of one lambda per employee.
+    """
+
+    def __init__(self, parent, employees, on_select):
+        super().__init__(parent)
+        self.on_select = on_select
+        self.members = {}  # department -> employee names, in roster order
+        for employee in employees:
+            name, department = employee[0], employee[2]
+            if department:
+                self.members.setdefault(department, []).append(name)
+
+        for department in sorted(self.members, key=department_label):
+            submenu = self.addMenu(department_label(department))
+            submenu.aboutToShow.connect(lambda submenu=submenu, department=department:
+                                        self.populate(submenu, department))
+        self.triggered.connect(self._on_triggered)
+
+    def populate(self, submenu, department):
+        if not submenu.isEmpty():
+            return
+        for name in self.members[department]:
+            submenu.addAction(name).setData(name)
+
+    def _on_triggered(self, action):
+        name = action.data()
+        if name is not None:
+            self.on_select(name)
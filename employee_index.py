@@ -0,0 +1,158 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+GRAM_SIZE = 3
+DEFAULT_LIMIT = 50
+
+
+def normalize(text):
+    return text.casefold()
+
+
+class EmployeeIndex:
+    """Ranked, capped substring search over employee names.
+
+    Names are normalized and sorted once at build time. Results come in tiers
+    (exact match, name prefix, word prefix, any other substring) and each tier
+    is read in sorted order straight from its structure, so a search stops
+    as soon as it has limit results instead of ranking every match:
+
+    * name and word prefixes are bisected out of sorted key lists,
+    * longer substrings walk the shortest trigram posting list of the query,
+    * one- and two-letter substrings are found with str.find over all names
+      joined into one string, stopping at limit.
+
+    When a search returns fewer than limit results its match set is complete,
+    so a follow-up query that only appends characters filters that set instead
+    of going back to the index.
+    """
+
+    def __init__(self, names=()):
+        self.build(names)
+
+    def build(self, names):
+        pairs = sorted((normalize(name), name) for name in names)
+        self.normalized = [key for key, _ in pairs]
+        self.names = [name for _, name in pairs]
+
+        # Every suffix of a name that starts a word other than the first one
+        word_starts = []
+        postings = defaultdict(list)
+        for idx, key in enumerate(self.normalized):
+            start = key.find(" ")
+            while start != -1:
+                if start + 1 < len(key) and key[start + 1] != " ":
+                    word_starts.append((key[start + 1:], idx))
+                start = key.find(" ", start + 1)
+            for gram in {key[i:i + GRAM_SIZE] for i in range(len(key) - GRAM_SIZE + 1)}:
+                postings[gram].append(idx)
+        word_starts.sort()
+        self.word_keys = [key for key, _ in word_starts]
+        self.word_ids = [idx for _, idx in word_starts]
+        self.postings = dict(postings)
+
+        self.corpus = "\n".join(self.normalized) + "\n"
+        self.offsets = []  # Start of each name in corpus, plus an end sentinel
+        offset = 0
+        for key in self.normalized:
+            self.offsets.append(offset)
+            offset += len(key) + 1
+        self.offsets.append(offset)
+        self.last_query = None
+        self.last_matches = None  # Complete ranked ids of last_query, if it was under the cap
+
+    def __len__(self):
+        return len(self.names)
+
+    def _prefixed(self, keys, query):
+        # Positions in a sorted key list whose key starts with query
+        pos = bisect_left(keys, query)
+        while pos < len(keys) and keys[pos].startswith(query):
+            yield pos
+            pos += 1
+
+    def _scan(self, query):
+        # Ids of names containing query, in order, via C-speed find over the corpus
+        corpus, offsets = self.corpus, self.offsets
+        pos = corpus.find(query)
+        while pos != -1:
+            idx = bisect_right(offsets, pos) - 1
+            yield idx
+            pos = corpus.find(query, offsets[idx + 1])
+
+    def _tier(self, idx, query):
+        key = self.normalized[idx]
+        if key == query:
+            return 0
+        if key.startswith(query):
+            return 1
+        if (" " + query) in key:
+            return 2
+        return 3
+
+    def _word_key(self, idx, query):
+        # Smallest word suffix of the name that starts with query: where a word-prefix match sits in word_keys
+        key = self.normalized[idx]
+        best = None
+        start = key.find(" ")
+        while start != -1:
+            suffix = key[start + 1:]
+            if suffix[:1] != " " and suffix.startswith(query) and (best is None or suffix < best):
+                best = suffix
+            start = key.find(" ", start + 1)
+        return best or ""
+
+    def _rank(self, idx, query):
+        # Same order _lookup reads the tiers in: prefixes and other substrings by name, word prefixes by word
+        tier = self._tier(idx, query)
+        return tier, self._word_key(idx, query) if tier == 2 else "", idx
+
+    def _lookup(self, query, limit):
+        seen = set()
+        found = []
+
+        def take(ids):
+            for idx in ids:
+                if idx not in seen:
+                    seen.add(idx)
+                    found.append(idx)
+                    if limit is not None and len(found) >= limit:
+                        return True
+            return False
+
+        if take(self._prefixed(self.normalized, query)):
+            return found
+        word_ids = self.word_ids
+        if take(word_ids[pos] for pos in self._prefixed(self.word_keys, query)):
+            return found
+
+        if len(query) >= GRAM_SIZE:
+            normalized = self.normalized
+            grams = {query[i:i + GRAM_SIZE] for i in range(len(query) - GRAM_SIZE + 1)}
+            candidates = min((self.postings.get(gram, ()) for gram in grams), key=len)
+            take(idx for idx in candidates if query in normalized[idx])
+        else:
+            take(self._scan(query))
+        return found
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """Return up to limit names containing text, best matches first."""
+        query = normalize(text)
+        if not query:
+            self.last_query = None
+            self.last_matches = None
+            return []
+
+        if self.last_matches is not None and query.startswith(self.last_query):
+            normalized = self.normalized
+            refined = [idx for idx in self.last_matches if query in normalized[idx]]
+            found = sorted(refined, key=lambda idx: self._rank(idx, query))
+            if limit is not None:
+                found = found[:limit]
+        else:
+            found = self._lookup(query, limit)
+
+        complete = limit is None or len(found) < limit
+        self.last_query = query
+        self.last_matches = found if complete else None
+        return [self.names[idx] for idx in found]
@@ -0,0 +1,130 @@
+import logging
+import os
+import sqlite3
+from bisect import bisect_right
+
+from schema_migrations import apply_migrations
+
+log = logging.getLogger(__name__)
+
+EMPLOYEE_COLUMNS = "name, working_wage, department, cost_center, worksite_assignment, has_benefits"
+
+# Schema migrations, applied in order and tracked with PRAGMA user_version
+MIGRATIONS = [
+    [
+        "CREATE INDEX IF NOT EXISTS idx_employees_name ON Employees(name)",
+        "CREATE INDEX IF NOT EXISTS idx_employees_department ON Employees(department)",
+    ],
+    [
+        # HR's employee number; rows entered by hand keep NULL until a roster sync matches them by name
+        "ALTER TABLE Employees ADD COLUMN employee_id TEXT",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_employees_employee_id ON Employees(employee_id)",
+        """CREATE TABLE IF NOT EXISTS wage_history (
+            employee_id TEXT NOT NULL,
+            effective_from TEXT NOT NULL,  -- YYYY-MM-DD
+            wage REAL NOT NULL,
+            PRIMARY KEY (employee_id, effective_from)
+        ) WITHOUT ROWID""",
+    ],
+]
+
+
+def migrate(conn):
+    """Bring the Employees schema up to date. Returns the resulting schema version."""
+    return apply_migrations(conn, MIGRATIONS)
+
+
+def wage_at(history, when, default=None):
+    """The wage in effect on date string when (YYYY-MM-DD...) from sorted (effective_from, wage) pairs.
+
+    Dates before the first entry get the earliest known wage.
+    """
+    if not history:
+        return default
+    index = bisect_right(history, (when[:10], float("inf")))
+    return history[max(index - 1, 0)][1]
+
+
+def load_employees(db_path):
+    """(rows by name, wage histories by name) read once for command-line tools, which don't migrate or cache."""
+    repo = EmployeeRepository(db_path, run_migrations=False)
+    try:
+        repo.refresh()
+        return repo.by_name, repo.wage_history()
+    finally:
+        repo.close()
+
+
+class EmployeeRepository:
+    """Single owner of the Employees table.
+
+    Rows are loaded once and keyed by name so wage lookups never touch SQLite.
+    refresh() reloads only when the DB changed underneath us, detected by the
+    file's mtime/size (edits from other processes) and PRAGMA data_version
+    (commits from other connections).
+    """
+
+    def __init__(self, db_path, run_migrations=True, check_same_thread=True):
+        self.db_path = db_path
+        # check_same_thread=False lets a loader thread open the repository and hand it over
+        self.conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+        if run_migrations:
+            try:
+                migrate(self.conn)
+            except sqlite3.OperationalError as e:
+                # Read-only share or locked DB: run unindexed rather than not at all
+                log.warning("Skipping employee schema migration: %s", e)
+        self.employees = []
+        self.by_name = {}
+        self.version = 0  # Bumped on every reload so callers can rebuild derived caches
+        self.closed = False
+        self._stamp = None
+
+    def _current_stamp(self):
+        try:
+            stat = os.stat(self.db_path)
+            file_stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_stamp = None
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return file_stamp, data_version
+
+    def refresh(self, force=False):
+        """Reload from SQLite if the DB changed. Returns True when a reload happened."""
+        stamp = self._current_stamp()
+        if not force and stamp == self._stamp:
+            return False
+        rows = self.conn.execute(f"SELECT {EMPLOYEE_COLUMNS} FROM Employees").fetchall()
+        self.employees = rows
+        self.by_name = {row[0]: row for row in rows}
+        self.version += 1
+        self._stamp = stamp
+        return True
+
+    def get(self, name):
+        row = self.by_name.get(name)
+        if row is None and self.refresh():
+            row = self.by_name.get(name)
+        if row is None:
+            raise KeyError(name)
+        return row
+
+    def wage(self, name):
+        return self.get(name)[1]
+
+    def wage_history(self):
+        """{name: [(effective_from, wage), ...] oldest first} for employees with a recorded history."""
+        history = {}
+        try:
+            rows = self.conn.execute(
+                "SELECT e.name, h.effective_from, h.wage FROM wage_history h "
+                "JOIN Employees e ON e.employee_id = h.employee_id ORDER BY e.name, h.effective_from").fetchall()
+        except sqlite3.OperationalError:
+            return history  # Schema predates wage history
+        for name, effective_from, wage in rows:
+            history.setdefault(name, []).append((effective_from, wage))
+        return history
+
+    def close(self):
+        self.closed = True
+        self.conn.close()
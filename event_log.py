@@ -0,0 +1,101 @@
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+
+JOIN = 0
+LEAVE = 1
+KIND_NAMES = ("join", "leave")
+KIND_VERBS = ("joined", "left")
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    elapsed_ms: int  # Offset from meeting start
+    participant_id: int
+    name: str
+    kind: int  # JOIN or LEAVE
+    rate_delta: float  # Change to the meeting's hourly rate
+
+    @property
+    def kind_name(self):
+        return KIND_NAMES[self.kind]
+
+
+def clock_str(wall_ms):
+    return datetime.fromtimestamp(wall_ms / 1000).strftime('%I:%M%p').lower()
+
+
+class EventLog:
+    """Append-only join/leave log stored as parallel typed columns.
+
+    Appending writes a few numbers into arrays; participant names are interned
+    to ids once. Event objects and human-readable sentences are only built
+    when iterating or exporting.
+    """
+
+    def __init__(self, start_ms=None):
+        self.reset(start_ms)
+
+    def reset(self, start_ms=None):
+        self.start_ms = start_ms  # Wall time of meeting start, for display only
+        self.elapsed_ms = array("q")
+        self.participant_ids = array("l")
+        self.kinds = array("b")
+        self.rate_deltas = array("d")
+        self.names = []  # participant id -> name
+        self._ids = {}  # name -> participant id
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __bool__(self):
+        return len(self.kinds) > 0
+
+    def intern(self, name):
+        participant_id = self._ids.get(name)
+        if participant_id is None:
+            participant_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return participant_id
+
+    def append(self, kind, name, elapsed_ms, rate_delta):
+        self.elapsed_ms.append(elapsed_ms)
+        self.participant_ids.append(self.intern(name))
+        self.kinds.append(kind)
+        self.rate_deltas.append(rate_delta)
+
+    def join(self, name, elapsed_ms, wage):
+        self.append(JOIN, name, elapsed_ms, wage)
+
+    def leave(self, name, elapsed_ms, wage):
+        self.append(LEAVE, name, elapsed_ms, -wage)
+
+    def snapshot(self):
+        """An independent copy, safe to hand to another thread."""
+        copy = EventLog(self.start_ms)
+        copy.elapsed_ms = array("q", self.elapsed_ms)
+        copy.participant_ids = array("l", self.participant_ids)
+        copy.kinds = array("b", self.kinds)
+        copy.rate_deltas = array("d", self.rate_deltas)
+        copy.names = list(self.names)
+        copy._ids = dict(self._ids)
+        return copy
+
+    def __getitem__(self, i):
+        participant_id = self.participant_ids[i]
+        return Event(self.elapsed_ms[i], participant_id, self.names[participant_id], self.kinds[i],
+                     self.rate_deltas[i])
+
+    def __iter__(self):
+        names = self.names
+        for elapsed_ms, participant_id, kind, rate_delta in zip(
+                self.elapsed_ms, self.participant_ids, self.kinds, self.rate_deltas):
+            yield Event(elapsed_ms, participant_id, names[participant_id], kind, rate_delta)
+
+    def describe(self, event):
+        """The export sentence for an event, e.g. 'Amber joined @ 09:15am; 5 minutes after ...'."""
+        start_ms = self.start_ms or 0
+        event_time = clock_str(start_ms + event.elapsed_ms)
+        minutes_elapsed = event.elapsed_ms // (1000 * 60)
+        return (f"{event.name} {KIND_VERBS[event.kind]} @ {event_time}; {minutes_elapsed} minutes after "
+                f"the meeting start ({clock_str(start_ms)})")
@@ -0,0 +1,260 @@
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import threading
+import time
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_FEED_HZ = 4
+CLIENT_TIMEOUT_S = 5.0  # A subscriber that can't take a frame for this long is dropped
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_TEXT = 0x1
+WS_CLOSE = 0x8
+WS_PING = 0x9
+WS_PONG = 0xA
+WS_MAX_CLIENT_PAYLOAD = 125  # Clients only send control frames (close, ping, pong), which RFC 6455 caps at 125
+WS_PROTOCOL_ERROR = 1002
+WS_TOO_BIG = 1009
+
+
+class WsProtocolError(ValueError):
+    """A client frame the feed won't read; status is the close code to send back."""
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+def ws_frame(payload, opcode=WS_TEXT):
+    """A single unmasked server-to-client WebSocket frame."""
+    size = len(payload)
+    if size < 126:
+        header = struct.pack("!BB", 0x80 | opcode, size)
+    elif size < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, size)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, size)
+    return header + payload
+
+
+def ws_accept(key):
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+
+
+async def read_ws_frame(reader):
+    """(opcode, payload) of the next client frame.
+
+    Raises WsProtocolError, before reading the payload, for an unmasked frame
+    (RFC 6455 requires clients to mask) or one over WS_MAX_CLIENT_PAYLOAD.
+    """
+    first, second = await reader.readexactly(2)
+    if not second & 0x80:
+        raise WsProtocolError("unmasked client frame", WS_PROTOCOL_ERROR)
+    size = second & 0x7F
+    if size == 126:
+        size = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif size == 127:
+        size = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if size > WS_MAX_CLIENT_PAYLOAD:
+        raise WsProtocolError(f"{size} byte client frame", WS_TOO_BIG)
+    mask = await reader.readexactly(4)
+    payload = await reader.readexactly(size)
+    return first & 0x0F, bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+
+
+class LiveFeed:
+    """Pushes live meeting state to lobby screens and bots over HTTP.
+
+    The server is an asyncio loop on its own daemon thread. The GUI thread
+    hands publish() a fresh dict at most max_hz times a second; only the
+    newest one is kept, serialized once per broadcast, and the same bytes are
+    written to every subscriber, so the GUI side costs the same with one
+    subscriber or hundreds. A subscriber that falls behind skips straight to
+    the newest state instead of queueing stale ones.
+
+    GET /state    current state as JSON
+    GET /events   Server-Sent Events stream of states
+    GET /ws       WebSocket stream of states as text frames
+    GET /metrics  Prometheus metrics, when a metrics callable is given
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=0, max_hz=DEFAULT_FEED_HZ, metrics=None):
+        self.host = host
+        self.port = port  # 0 picks a free port; the real one is set by start()
+        self.min_interval = 1.0 / max(0.1, float(max_hz))
+        self.metrics = metrics  # Returns the /metrics body as bytes; called on the feed thread
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.ready = threading.Event()
+        self.error = None
+        self.lock = threading.Lock()  # Guards pending/scheduled, shared with the GUI thread
+        self.pending = None  # Newest state not yet broadcast
+        self.scheduled = False
+        self.last_publish = float("-inf")
+        self.changed = None  # asyncio.Event, swapped for a fresh one on every broadcast
+        self.version = 0
+        self.clients = 0
+        self.broadcasts = 0
+        self._set_payload(b"{}")
+
+    def start(self):
+        """Start serving on a background thread. Returns the bound port; raises OSError if it can't bind."""
+        self.thread = threading.Thread(target=self._run, name="live-feed", daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+        return self.port
+
+    def stop(self):
+        if self.loop is not None and self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(CLIENT_TIMEOUT_S)
+
+    def due(self):
+        """True when a publish would be accepted, so callers can skip building state in between."""
+        return time.monotonic() - self.last_publish >= self.min_interval
+
+    def publish(self, state, force=False):
+        """Queue state (a dict the caller won't mutate) for broadcast. Returns False if rate limited."""
+        if self.loop is None:
+            return False
+        now = time.monotonic()
+        if not force and now - self.last_publish < self.min_interval:
+            return False
+        self.last_publish = now
+        with self.lock:
+            self.pending = state
+            if self.scheduled:
+                return True  # A broadcast is already queued and will pick up this state
+            self.scheduled = True
+        self.loop.call_soon_threadsafe(self._broadcast)
+        return True
+
+    def stats(self):
+        return {"clients": self.clients, "broadcasts": self.broadcasts}
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.changed = asyncio.Event()
+        try:
+            self.server = self.loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            self.error = e
+            self.loop.close()
+            self.loop = None
+            self.ready.set()
+            return
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.server.close()
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    def _set_payload(self, data):
+        self.state_json = data
+        self.sse_payload = b"data: " + data + b"\n\n"
+        self.ws_payload = ws_frame(data)
+
+    def _broadcast(self):
+        with self.lock:
+            state = self.pending
+            self.pending = None
+            self.scheduled = False
+        self._set_payload(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+        self.version += 1
+        self.broadcasts += 1
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), CLIENT_TIMEOUT_S)
+            lines = request.decode("latin-1").split("\r\n")
+            method, _, target = lines[0].partition(" ")
+            path = target.split(" ", 1)[0].split("?", 1)[0]
+            headers = {}
+            for line in lines[1:]:
+                key, sep, value = line.partition(":")
+                if sep:
+                    headers[key.strip().lower()] = value.strip()
+
+            if method != "GET":
+                await self._respond(writer, "405 Method Not Allowed", b"")
+            elif path == "/state":
+                await self._respond(writer, "200 OK", self.state_json, "application/json")
+            elif path == "/metrics" and self.metrics is not None:
+                await self._respond(writer, "200 OK", self.metrics(), "text/plain; version=0.0.4")
+            elif path == "/events":
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                             b"Access-Control-Allow-Origin: *\r\n\r\n")
+                await self._subscribe(reader, writer, "sse_payload", self._watch_eof(reader))
+            elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket" \
+                    and "sec-websocket-key" in headers:
+                writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                              f"Sec-WebSocket-Accept: {ws_accept(headers['sec-websocket-key'])}\r\n\r\n"
+                              ).encode("ascii"))
+                await self._subscribe(reader, writer, "ws_payload", self._watch_ws(reader, writer))
+            else:
+                await self._respond(writer, "404 Not Found", b"")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            pass  # Feed shutting down; end quietly rather than leave the stream callback a cancelled task
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, body, content_type="text/plain"):
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+                     f"Access-Control-Allow-Origin: *\r\nConnection: close\r\n\r\n".encode("ascii") + body)
+        await asyncio.wait_for(writer.drain(), CLIENT_TIMEOUT_S)
+
+    async def _subscribe(self, reader, writer, payload_attr, watcher):
+        # Stream until the client goes away (watcher returns) or stops draining (timeout)
+        self.clients += 1
+        pusher = asyncio.ensure_future(self._push(writer, payload_attr))
+        watch = asyncio.ensure_future(watcher)
+        try:
+            done, _ = await asyncio.wait((pusher, watch), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.exception()  # Disconnects end the stream; nothing to report
+        finally:
+            pusher.cancel()
+            watch.cancel()
+            self.clients -= 1
+
+    async def _push(self, writer, payload_attr):
+        version = None
+        while True:
+            if version == self.version:
+                await self.changed.wait()
+            version = self.version
+            writer.write(getattr(self, payload_attr))
+            await asyncio.wait_for(writer.drain(), CLIENT_TIMEOUT_S)
+
+    async def _watch_eof(self, reader):
+        while await reader.read(4096):
+            pass
+
+    async def _watch_ws(self, reader, writer):
+        while True:
+            try:
+                opcode, payload = await read_ws_frame(reader)
+            except WsProtocolError as e:
+                writer.write(ws_frame(struct.pack("!H", e.status), WS_CLOSE))
+                return
+            if opcode == WS_CLOSE:
+                writer.write(ws_frame(payload[:2], WS_CLOSE))
+                return
+            if opcode == WS_PING:
+                writer.write(ws_frame(payload, WS_PONG))
@@ -1,502 +1,450 @@
+import logging
 import sys
-import sqlite3
 import os
-from datetime import datetime
+import time
+
+from startup_profile import StartupProfile
+
+# Started before the heavy imports so --profile-startup can time them
+PROFILE = StartupProfile(enabled="--profile-startup" in sys.argv)
+
 from PyQt6.QtWidgets import QApplication, QMainWindow, QPushButton, \
-    QLabel, QVBoxLayout, QHBoxLayout, QWidget, QListWidget, QMessageBox, QMenu, QLineEdit, QListWidgetItem, QComboBox
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QAction
-import xml.etree.ElementTree as ET
+    QLabel, QVBoxLayout, QHBoxLayout, QWidget, QMessageBox, QTabWidget
+from PyQt6.QtCore import Qt, QFileSystemWatcher, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont
+
+PROFILE.mark("import PyQt6")
+
+# Reports, history, analytics, export rendering and the live feed are imported on first use
+from app_config import load_config
+from department_menu import DepartmentMenu
+from employee_index import EmployeeIndex
+from employee_repository import EmployeeRepository
+from meeting_clock import format_time
+from meeting_journal import CHECKPOINT_MS, MeetingJournal
+from meeting_room import MeetingRoom
+from meeting_sessions import SessionManager
+from render_scheduler import RenderScheduler, DEFAULT_REFRESH_HZ
+import telemetry
+from telemetry import METRICS
+
+log = logging.getLogger(__name__)
+EXPORT_SECONDS = METRICS.histogram("timeismoney_export_seconds",
+                                   "Meeting end to saved in the history DB and session logs, queueing included")
+EXPORT_FAILURES = METRICS.counter("timeismoney_export_failures_total", "Meeting saves that failed")
+
+PROFILE.mark("import app modules")
+
+
+class ExportSignals(QObject):
+    finished = pyqtSignal(str, str)
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Records a meeting snapshot in the history DB and its cost rollups, and optionally its HTML/XML logs,
+    on the thread pool."""
+
+    def __init__(self, snapshot, history_path, log_dir=None, journal=None, meeting_id=None, employees=None):
+        super().__init__()
+        self.snapshot = snapshot
+        self.history_path = history_path
+        self.log_dir = log_dir  # None skips the HTML/XML files
+        self.journal = journal
+        self.meeting_id = meeting_id
+        self.employees = employees  # name -> Employees row for the cost rollups, None skips them
+        self.signals = ExportSignals()
+        self.queued_at = time.perf_counter()
+
+    def run(self):
+        from analytics import CostAnalytics
+        from meeting_export import export_meeting
+        from meeting_history import MeetingHistory
+        try:
+            with MeetingHistory(self.history_path) as history:
+                history.record_meeting(self.snapshot)
+                if self.employees is not None:
+                    CostAnalytics(history).apply_pending(self.employees)
+            if self.journal is not None and self.meeting_id is not None:
+                self.journal.saved(self.meeting_id)  # In the history DB, so the journal can let it go
+            html_filename = xml_filename = ""
+            if self.log_dir:
+                html_filename, xml_filename = export_meeting(self.snapshot, self.log_dir)
+        except Exception as e:
+            EXPORT_FAILURES.inc()
+            log.exception("Saving meeting log failed", extra={"room": self.snapshot.room})
+            self.signals.failed.emit(str(e))
+            return
+        EXPORT_SECONDS.observe(time.perf_counter() - self.queued_at)
+        self.signals.finished.emit(html_filename, xml_filename)
+
+
+class StartupSignals(QObject):
+    loaded = pyqtSignal(object, object, object, str, list)  # repository, index, journal, journal error, timings
+    failed = pyqtSignal(str)
+
+
+class StartupTask(QRunnable):
+    """Loads the employees, builds the search index and replays the journal on the thread pool,
+    so the window can show before any of it is ready."""
+
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+        self.signals = StartupSignals()
+
+    def run(self):
+        timings = []  # (phase, seconds) for --profile-startup
+        started = time.perf_counter()
+
+        def mark(phase):
+            nonlocal started
+            now = time.perf_counter()
+            timings.append((phase, now - started))
+            started = now
+
+        try:
+            # Handed over to the GUI thread once loaded, never used from two threads at once
+            repo = EmployeeRepository(self.config.employee_db, check_same_thread=False)
+            repo.refresh()
+            mark("load employee DB")
+            index = EmployeeIndex(emp[0] for emp in repo.employees)
+            mark("build search index")
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        # Write-ahead journal of live meetings, replayed once loaded if the app died mid-meeting
+        journal_error = ""
+        try:
+            journal = MeetingJournal(self.config.journal)
+        except OSError as e:
+            # JournalLocked: another instance is running, its live meetings are not ours to resume
+            log.warning("Meeting journal disabled: %s", e)
+            journal, journal_error = None, str(e)
+        mark("replay journal")
+        self.signals.loaded.emit(repo, index, journal, journal_error, timings)
 
 
 class TimeIsMoney(QMainWindow):
-    def __init__(self):
+    """Main window: one tab per meeting room, sharing employee data, the render loop and exports."""
+
+    ready = pyqtSignal()  # Employees loaded and journaled meetings recovered
+    ROSTER_RELOAD_DELAY_MS = 500  # One reload per burst of DB writes
+
+    def __init__(self, config=None, profile=None):
         super().__init__()
         self.setWindowTitle("TimeIsMoney")
         self.resize(800, 800)
-
-        # Database connection
-        self.db_path = "G:\\expo\\Software\\TimeIsMoney\\TimeIsMoney\\EmployeeData.db"
-        self.conn = sqlite3.connect(self.db_path)
-        self.cursor = self.conn.cursor()
+        self.config = config or load_config()[0]
+        self.profile = profile or StartupProfile()
+
+        # Database paths; the employee DB and journal are opened by a StartupTask
+        self.employee_repo = None
+        self.journal = None
+        self.history_path = self.config.history_db
+        self.log_dir = self.config.log_dir
+        # HTML/XML logs are optional renderings of the history DB
+        self.export_files = os.environ.get("TIMEISMONEY_FILE_EXPORT", "1") != "0"
+        self.pending_exports = set()  # Signal objects of exports still running
+
+        # Store employee data for menu and search, shared by every room
+        self.employee_data = []
+        self.employee_index = None
+        self.participant_menu = None
+        self.participant_menu_version = None
+        # Reloads the roster when another process (e.g. roster_sync.py) commits to the employee DB
+        self.roster_watcher = None
+        self.roster_reload_timer = QTimer(self)
+        self.roster_reload_timer.setSingleShot(True)
+        self.roster_reload_timer.setInterval(self.ROSTER_RELOAD_DELAY_MS)
+        self.roster_reload_timer.timeout.connect(self.reload_roster)
+        # Journals how far live meetings have run, so a crash resumes close to where it happened
+        self.checkpoint_timer = QTimer(self)
+        self.checkpoint_timer.setInterval(CHECKPOINT_MS)
+        self.checkpoint_timer.timeout.connect(self.checkpoint_meetings)
+
+        # One render loop repaints every live room; rooms bind their own labels to it
+        self.render_scheduler = RenderScheduler(
+            self, refresh_hz=int(os.environ.get("TIMEISMONEY_REFRESH_HZ", DEFAULT_REFRESH_HZ)))
+        self.sessions = SessionManager()
+
+        # Optional live-cost feed for wall displays; off unless a port is configured
+        self.live_feed = None
+        feed_port = os.environ.get("TIMEISMONEY_LIVE_FEED_PORT")
+        if feed_port:
+            from live_feed import DEFAULT_FEED_HZ, DEFAULT_HOST, LiveFeed
+            feed = LiveFeed(os.environ.get("TIMEISMONEY_LIVE_FEED_HOST", DEFAULT_HOST), int(feed_port),
+                            max_hz=float(os.environ.get("TIMEISMONEY_LIVE_FEED_HZ", DEFAULT_FEED_HZ)),
+                            metrics=METRICS.prometheus if METRICS.enabled else None)
+            try:
+                log.info("Live feed on http://%s:%d/", feed.host, feed.start())
+                self.live_feed = feed
+                self.render_scheduler.on_tick(self.publish_live_state)
+            except OSError as e:
+                log.warning("Live feed disabled: %s", e)
 
         # Main widget and vertical layout
         self.central_widget = QWidget(self)
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
 
-        # Top layout for sidebar and Reset button
-        self.top_layout = QHBoxLayout()
-
-        # Left sidebar (vertical layout for controls) - acting as toolbar
-        self.sidebar = QWidget(self)
-        self.sidebar_layout = QVBoxLayout(self.sidebar)
-        self.sidebar.setMaximumWidth(200)
-
-        # Search box for employees
-        self.search_box = QLineEdit(self)
-        self.search_box.setPlaceholderText("Search Employees...")
-        self.search_box.textChanged.connect(self.update_search_results)
-        self.sidebar_layout.addWidget(self.search_box)
-
-        # Search results list
-        self.search_results = QListWidget(self)
-        self.search_results.itemClicked.connect(self.add_participant_from_search)
-        self.search_results.setMaximumHeight(100)
-        self.sidebar_layout.addWidget(self.search_results)
-
-        # Add Participant button (Red)
-        self.add_participant_button = QPushButton("Add Participant", self)
-        self.add_participant_button.clicked.connect(self.show_participant_menu)
-        self.add_participant_button.setStyleSheet("background-color: red; color: white;")
-        self.sidebar_layout.addWidget(self.add_participant_button)
-
-        # Remove Participant button (Green)
-        self.remove_participant_button = QPushButton("Remove Participant", self)
-        self.remove_participant_button.clicked.connect(self.remove_participant)
-        self.remove_participant_button.setStyleSheet("background-color: green; color: white;")
-        self.sidebar_layout.addWidget(self.remove_participant_button)
-
-        # Add All Employees button (Purple)
-        self.add_all_button = QPushButton("Add All Employees", self)
-        self.add_all_button.clicked.connect(self.add_all_employees)
-        self.add_all_button.setStyleSheet("background-color: purple; color: white;")
-        self.sidebar_layout.addWidget(self.add_all_button)
-
-        # Participants list
-        self.participants_list = QListWidget(self)
-        self.sidebar_layout.addWidget(self.participants_list)
-
-        # Timer display label
-        self.timer_label = QLabel("Time Elapsed: 00:00:00:000", self)
-        self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.sidebar_layout.addWidget(self.timer_label)
-
-        # Meeting Start button (Blue when active, Grey when inactive)
-        self.start_button = QPushButton("Meeting Start", self)
-        self.start_button.clicked.connect(self.start_meeting)
-        self.start_button.setStyleSheet("background-color: blue; color: white;")
-        self.sidebar_layout.addWidget(self.start_button)
-
-        # End Meeting button (Grey initially, Blue when active)
-        self.end_button = QPushButton("End Meeting", self)
-        self.end_button.clicked.connect(self.end_meeting)
-        self.end_button.setEnabled(False)
-        self.end_button.setStyleSheet("background-color: grey; color: white;")
-        self.sidebar_layout.addWidget(self.end_button)
-
-        # Meeting duration label
-        self.duration_label = QLabel("", self)
-        self.duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.sidebar_layout.addWidget(self.duration_label)
-
-        # Meeting cost label
-        self.cost_label = QLabel("Meeting Cost: $0.00", self)
-        self.cost_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cost_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        self.sidebar_layout.addWidget(self.cost_label)
-
-        # Set meeting length label
-        self.simulate_label = QLabel("Set Meeting Length:", self)
-        self.sidebar_layout.addWidget(self.simulate_label)
-
-        # Simulate combo box
-        self.simulate_combo = QComboBox(self)
-        self.simulate_combo.addItems(["15 min", "30 min", "45 min", "60 min", "75 min", "90 min", "105 min", "120 min"])
-        self.simulate_combo.currentTextChanged.connect(self.update_simulated_cost)
-        self.sidebar_layout.addWidget(self.simulate_combo)
-
-        # Simulated cost label
-        self.simulated_cost_label = QLabel("Simulated Cost: $0.00", self)
-        self.simulated_cost_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.sidebar_layout.addWidget(self.simulated_cost_label)
-
-        # Add stretch to push controls to top and separate reset button
-        self.sidebar_layout.addStretch()
-
-        # Reset button (now at bottom of toolbar)
-        self.reset_button = QPushButton("Reset Meeting", self)
-        self.reset_button.clicked.connect(self.reset_meeting)
-        self.reset_button.setStyleSheet("background-color: orange; color: black;")
-        self.sidebar_layout.addWidget(self.reset_button)
-
-        # Add sidebar to top layout
-        self.top_layout.addWidget(self.sidebar)
-
-        # Add top layout to main layout
-        self.main_layout.addLayout(self.top_layout)
-
-        # Add stretch to main layout for additional space
-        self.main_layout.addStretch()
-
-        # Timer setup
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_timer)
-        self.start_time = None
-        self.elapsed_ms = 0
-        self.total_hourly_rate = 0.0  # Current hourly rate for active participants
-        self.incurred_cost = 0.0  # Accumulated cost from past participation
-        self.participant_wages = {}  # Tracks wages for each participant
-        self.participant_events = []
-        self.meeting_start_str = ""
-        self.participant_times = {}  # Tracks join times for cost calculation
-
-        # Store employee data for menu and search
-        self.employee_data = self.get_employees()
-
-    def show_participant_menu(self):
-        menu = QMenu(self)
-        departments = {
-            "OFFICE": QMenu("Office", self),
-            "DRIVER": QMenu("Driver", self),
-            "TABLETOP": QMenu("Tabletop", self),
-            "PARTY_RENTAL": QMenu("Party Rental", self),
-            "DISPATCH": QMenu("Dispatch", self),
-            "WAREHOUSE": QMenu("Warehouse", self),
-            "EXECUTIVE": QMenu("Executive", self),
-            "SALES": QMenu("Sales", self),
-            "CREATIVE": QMenu("Creative", self),
-            "AUDIO_VISUAL": QMenu("Audio Visual", self),
-            "TRADE_SHOW": QMenu("Trade Show", self)
-        }
-
-        for employee in self.employee_data:
-            name, _, department, _, _, _ = employee
-            if department in departments:
-                action = QAction(name, self)
-                action.triggered.connect(lambda checked, n=name: self.add_participant_from_menu(n))
-                departments[department].addAction(action)
-
-        for dept, submenu in departments.items():
-            if not submenu.isEmpty():
-                menu.addMenu(submenu)
-
-        menu.exec(self.add_participant_button.mapToGlobal(self.add_participant_button.rect().bottomLeft()))
-
-    def add_participant_from_menu(self, name):
-        if name not in [self.participants_list.item(i).text() for i in range(self.participants_list.count())]:
-            self.participants_list.addItem(name)
-            self.cursor.execute("SELECT working_wage FROM Employees WHERE name = ?", (name,))
-            wage = self.cursor.fetchone()[0]
-            self.participant_wages[name] = wage
-            self.total_hourly_rate += wage
-            print(f"EASTER EGG: {name} joined the money-making party via menu!")
-            if self.timer.isActive():
-                event_time = datetime.fromtimestamp((self.start_time + self.elapsed_ms) / 1000).strftime(
-                    '%I:%M%p').lower()
-                minutes_elapsed = self.elapsed_ms // (1000 * 60)
-                self.participant_events.append(
-                    f"{name} joined @ {event_time}; {minutes_elapsed} minutes after the meeting start ({self.meeting_start_str})"
-                )
-                self.participant_times[name] = self.elapsed_ms  # Record join time
-                # Update cost label immediately
-                total_cost = self.calculate_total_cost()
-                self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
-            # Update simulated cost
-            self.update_simulated_cost(self.simulate_combo.currentText())
-
-    def update_search_results(self, text):
-        self.search_results.clear()
-        if text:
-            matches = [emp[0] for emp in self.employee_data if text.lower() in emp[0].lower()]
-            for name in matches:
-                self.search_results.addItem(name)
+        # Dashboard row: combined cost of every live room, plus a button to open another room
+        self.dashboard_layout = QHBoxLayout()
+        self.dashboard_label = QLabel("No meetings running", self)
+        self.dashboard_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.dashboard_layout.addWidget(self.dashboard_label)
+        self.dashboard_layout.addStretch()
+        self.reports_button = QPushButton("Reports", self)
+        self.reports_button.clicked.connect(self.show_reports)
+        self.dashboard_layout.addWidget(self.reports_button)
+        self.new_room_button = QPushButton("New Room", self)
+        self.new_room_button.clicked.connect(self.add_room)
+        self.dashboard_layout.addWidget(self.new_room_button)
+        self.main_layout.addLayout(self.dashboard_layout)
+        self.render_scheduler.bind(self.dashboard_label, self.dashboard_text)
+
+        # One tab per meeting room
+        self.rooms_tabs = QTabWidget(self)
+        self.rooms_tabs.setTabsClosable(True)
+        self.rooms_tabs.tabCloseRequested.connect(self.close_room)
+        self.main_layout.addWidget(self.rooms_tabs)
+        self.add_room()
+
+        # Rooms stay disabled until their employee data is in
+        self.rooms_tabs.setEnabled(False)
+        self.new_room_button.setEnabled(False)
+        self.statusBar().showMessage("Loading employees...")
+        self.startup_task = StartupTask(self.config)
+        self.startup_task.signals.loaded.connect(self.on_employees_loaded)
+        self.startup_task.signals.failed.connect(self.on_employees_failed)
+        QThreadPool.globalInstance().start(self.startup_task)
+
+    def on_employees_loaded(self, repo, index, journal, journal_error, timings):
+        self.profile.mark("load employees (background)")
+        for phase, seconds in timings:
+            self.profile.add(f"  {phase}", seconds)
+        self.employee_repo = repo
+        self.employee_data = repo.employees
+        self.employee_index = index
+        self.journal = journal
+        if journal is not None:
+            self.checkpoint_timer.start()
+        self.roster_watcher = QFileSystemWatcher([self.config.employee_db], self)
+        self.roster_watcher.fileChanged.connect(self.roster_reload_timer.start)
+        self.rooms_tabs.setEnabled(True)
+        self.new_room_button.setEnabled(True)
+        if journal_error:
+            self.statusBar().showMessage(f"Crash recovery off: {journal_error}")
         else:
-            self.search_results.clear()
-
-    def add_participant_from_search(self, item):
-        name = item.text()
-        if name not in [self.participants_list.item(i).text() for i in range(self.participants_list.count())]:
-            self.participants_list.addItem(name)
-            self.cursor.execute("SELECT working_wage FROM Employees WHERE name = ?", (name,))
-            wage = self.cursor.fetchone()[0]
-            self.participant_wages[name] = wage
-            self.total_hourly_rate += wage
-            print(f"EASTER EGG: {name} joined the money-making party via search!")
-            if self.timer.isActive():
-                event_time = datetime.fromtimestamp((self.start_time + self.elapsed_ms) / 1000).strftime(
-                    '%I:%M%p').lower()
-                minutes_elapsed = self.elapsed_ms // (1000 * 60)
-                self.participant_events.append(
-                    f"{name} joined @ {event_time}; {minutes_elapsed} minutes after the meeting start ({self.meeting_start_str})"
-                )
-                self.participant_times[name] = self.elapsed_ms  # Record join time
-                # Update cost label immediately
-                total_cost = self.calculate_total_cost()
-                self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
-            # Update simulated cost
-            self.update_simulated_cost(self.simulate_combo.currentText())
-
-    def remove_participant(self):
-        selected_items = self.participants_list.selectedItems()
-        if not selected_items:
-            print("DEBUG: No participant selected for removal.")
+            self.statusBar().showMessage(f"Loaded {len(self.employee_data)} employees", 3000)
+        self.recover_meetings()
+        self.profile.mark("recover meetings")
+        self.ready.emit()
+
+    def on_employees_failed(self, error):
+        self.statusBar().showMessage(f"Loading employees failed: {error}")
+        QMessageBox.warning(self, "Employee Data Unavailable",
+                            f"Could not load employees from {self.config.employee_db}:\n{error}")
+        self.ready.emit()
+
+    def reload_roster(self):
+        if self.roster_watcher is None or self.employee_repo is None or self.employee_repo.closed:
+            return  # Not loaded yet, or the window has closed
+        path = self.config.employee_db
+        if path not in self.roster_watcher.files() and os.path.exists(path):
+            self.roster_watcher.addPath(path)  # The file was replaced rather than written in place
+        version = self.employee_repo.version
+        self.get_employees()
+        if self.employee_repo.version != version:
+            # Live meetings keep the wages people joined at; new joins and searches use the new roster
+            log.info("Employee roster reloaded", extra={"employees": len(self.employee_data)})
+            self.statusBar().showMessage(f"Employee roster updated: {len(self.employee_data)} employees", 5000)
+            # Results and menu entries built from the old roster may name people who are gone
+            if self.participant_menu is not None and self.participant_menu.isVisible():
+                self.participant_menu.close()
+            for room in self.sessions.rooms:
+                room.refresh_search()
+
+    def checkpoint_meetings(self):
+        for room in self.sessions.live_rooms():
+            self.journal.checkpoint(room.meeting_id, room.elapsed_ms)
+
+    def recover_meetings(self):
+        if self.journal is None:
             return
-        selected_name = selected_items[0].text()
-        self.participants_list.takeItem(self.participants_list.row(selected_items[0]))
-
-        wage = self.participant_wages[selected_name]
-        print(f"DEBUG: Removing {selected_name} with hourly wage ${wage}")
-
-        # Calculate cost incurred by this participant before removal
-        if self.timer.isActive() and selected_name in self.participant_times:
-            time_in_meeting_ms = self.elapsed_ms - self.participant_times[selected_name]
-            cost_incurred = wage * (time_in_meeting_ms / 3600000.0)  # Convert ms to hours
-            self.incurred_cost += cost_incurred
-            print(
-                f"DEBUG: {selected_name} was in meeting for {time_in_meeting_ms}ms, incurred cost: ${cost_incurred:.2f}")
-            del self.participant_times[selected_name]  # Remove from tracking
-
-        # Reduce total_hourly_rate for future cost calculation
-        self.total_hourly_rate -= wage
-        del self.participant_wages[selected_name]
-        print(
-            f"DEBUG: New total hourly rate: ${self.total_hourly_rate}, Incurred cost so far: ${self.incurred_cost:.2f}")
-
-        print(f"EASTER EGG: {selected_name} has left the money-making party!")
-        if self.timer.isActive():
-            event_time = datetime.fromtimestamp((self.start_time + self.elapsed_ms) / 1000).strftime('%I:%M%p').lower()
-            minutes_elapsed = self.elapsed_ms // (1000 * 60)
-            self.participant_events.append(
-                f"{selected_name} left @ {event_time}; {minutes_elapsed} minutes after the meeting start ({self.meeting_start_str})"
-            )
-            total_cost = self.calculate_total_cost()
-            self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
-            print(f"DEBUG: Updated total cost after removal: ${total_cost:.2f}")
-        # Update simulated cost
-        self.update_simulated_cost(self.simulate_combo.currentText())
-
-    def add_all_employees(self):
-        employees = self.get_employees()
-        current_participants = [self.participants_list.item(i).text() for i in range(self.participants_list.count())]
-
-        for employee in employees:
-            name, wage = employee[0], employee[1]
-            if name not in current_participants:
-                self.participants_list.addItem(name)
-                self.participant_wages[name] = wage
-                self.total_hourly_rate += wage
-                print(f"EASTER EGG: {name} joined the company-wide cash bash!")
-                if self.timer.isActive():
-                    event_time = datetime.fromtimestamp((self.start_time + self.elapsed_ms) / 1000).strftime(
-                        '%I:%M%p').lower()
-                    minutes_elapsed = self.elapsed_ms // (1000 * 60)
-                    self.participant_events.append(
-                        f"{name} joined @ {event_time}; {minutes_elapsed} minutes after the meeting start ({self.meeting_start_str})"
-                    )
-                    self.participant_times[name] = self.elapsed_ms  # Record join time
-
-        if self.timer.isActive():
-            total_cost = self.calculate_total_cost()
-            self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
-        # Update simulated cost
-        self.update_simulated_cost(self.simulate_combo.currentText())
-
-    def calculate_total_cost(self):
-        total_cost = self.incurred_cost
-        for name in self.participant_times:
-            time_in_ms = self.elapsed_ms - self.participant_times[name]
-            cost = self.participant_wages[name] * (time_in_ms / 3600000.0)
-            total_cost += cost
-        return total_cost
-
-    def update_simulated_cost(self, text):
-        if not text:
-            self.simulated_cost_label.setText("Simulated Cost: $0.00")
-            return
-        try:
-            minutes = int(text.split()[0])
-            total_minutes = minutes + 10  # Add 10 min buffer
-            hours = total_minutes / 60.0
-            total_wage = sum(self.participant_wages.values())
-            cost = total_wage * hours
-            self.simulated_cost_label.setText(f"Simulated Cost: ${cost:.2f}")
-        except ValueError:
-            self.simulated_cost_label.setText("Simulated Cost: $0.00")
-
-    def start_meeting(self):
-        if self.participants_list.count() == 0:
-            QMessageBox.warning(self, "No Participants", "MEETINGS ARE FOR PEOPLE")
+        downtime_ms = 0
+        for meeting in self.journal.pending:
+            if meeting.live:
+                idle = [room for room in self.sessions.rooms
+                        if room.room_name == meeting.room and not room.clock.running]
+                room = idle[0] if idle else self.add_room(meeting.room)
+                downtime_ms = max(downtime_ms, room.resume_meeting(meeting))
+            else:
+                # Ended but never made it into the history DB
+                self.export_snapshot(meeting.snapshot(format_time(meeting.last_ms), self.department_of),
+                                     meeting.meeting_id)
+        if self.journal.pending:
+            message = f"Recovered {len(self.journal.pending)} meeting(s) from the journal"
+            if downtime_ms >= 60000:
+                message += f"; the {downtime_ms // 60000} min the app was down are not counted"
+            self.statusBar().showMessage(message, 10000)
+
+    def add_room(self, room_name=None):
+        if room_name is None:
+            taken = {room.room_name for room in self.sessions.rooms}
+            number = 1
+            while f"Room {number}" in taken:
+                number += 1
+            room_name = f"Room {number}"
+        room = MeetingRoom(self, room_name)
+        self.sessions.add_room(room)
+        self.rooms_tabs.addTab(room, room.room_name)
+        self.rooms_tabs.setCurrentWidget(room)
+        return room
+
+    def close_room(self, index):
+        room = self.rooms_tabs.widget(index)
+        if room.clock.running:
+            QMessageBox.warning(self, "Meeting Running", f"End the meeting in {room.room_name} before closing it.")
             return
+        if self.rooms_tabs.count() == 1:
+            return  # Always keep one room open
+        self.rooms_tabs.removeTab(index)
+        room.detach()
+        room.deleteLater()
+        self.publish_live_state(force=True)
+
+    def current_room(self):
+        return self.rooms_tabs.currentWidget()
+
+    def room_state_changed(self, room):
+        # Rooms call this when their meeting starts, ends or resets
+        live = room.clock.running
+        self.rooms_tabs.setTabText(self.rooms_tabs.indexOf(room), f"{room.room_name} (live)" if live else room.room_name)
+        if self.sessions.live_rooms():
+            if not self.render_scheduler.isActive():
+                self.render_scheduler.start()
+            else:
+                self.render_scheduler.refresh()
+        elif self.render_scheduler.isActive():
+            self.render_scheduler.stop()
+            log.debug("Render loop stopped", extra=self.render_scheduler.stats())
+            self.dashboard_label.setText(self.dashboard_text())
+        self.publish_live_state(force=True)
+
+    def live_state(self):
+        rooms = [room.live_state() for room in self.sessions.rooms]
+        live = [room for room in rooms if room["live"]]
+        return {
+            "updated_at": int(time.time() * 1000),
+            "live_rooms": len(live),
+            "rate": sum(room["rate"] for room in live),
+            "cost": round(sum(room["cost"] for room in live), 2),
+            "rooms": rooms,
+        }
 
-        if not self.timer.isActive():
-            import time
-            self.start_time = int(time.time() * 1000)
-            self.meeting_start_str = datetime.fromtimestamp(self.start_time / 1000).strftime('%I:%M%p').lower()
-            self.timer.start(10)
-            self.start_button.setText("Meeting Started")
-            self.start_button.setEnabled(False)
-            self.start_button.setStyleSheet("background-color: grey; color: white;")
-            self.end_button.setEnabled(True)
-            self.end_button.setStyleSheet("background-color: blue; color: white;")
-            self.duration_label.setText("")
-            self.cost_label.setText("Meeting Cost: $0.00")
-            self.participant_events = []
-            self.incurred_cost = 0.0
-            self.participant_times = {}
-            # Set join times for initial participants
-            for i in range(self.participants_list.count()):
-                name = self.participants_list.item(i).text()
-                self.participant_times[name] = 0
-            print("EASTER EGG: Meeting initiated! Time to make some money, honey!")
-
-    def end_meeting(self):
-        if self.timer.isActive():
-            self.timer.stop()
-            self.end_button.setEnabled(False)
-            self.end_button.setStyleSheet("background-color: grey; color: white;")
-            self.start_button.setEnabled(True)
-            self.start_button.setStyleSheet("background-color: blue; color: white;")
-            self.start_button.setText("Meeting Start")
-            duration_str = self.format_time(self.elapsed_ms)
-            self.duration_label.setText(f"Meeting Duration: {duration_str}")
-            total_cost = self.calculate_total_cost()
-            self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
-            print(f"EASTER EGG: Meeting over! Time banked: {duration_str}. Cash it in!")
-            self.save_meeting_data(self.participants_list, duration_str, total_cost)
-
-    def save_meeting_data(self, participants, duration, cost):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_dir = os.path.join("G:\\expo\\Software\\TimeIsMoney\\TimeIsMoney", "session logs")
-        html_dir = os.path.join(log_dir, "HTML")
-        xml_dir = os.path.join(log_dir, "XML")
-        os.makedirs(html_dir, exist_ok=True)
-        os.makedirs(xml_dir, exist_ok=True)
-
-        # HTML Export
-        html_filename = os.path.join(html_dir, f"meeting_log_{timestamp}.html")
-        participants_list = [self.participants_list.item(i).text() for i in range(self.participants_list.count())]
-
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Meeting Log</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                h1, h2 { color: #333; }
-                .summary { margin-bottom: 20px; }
-                .event { margin: 5px 0; }
-                .swatch { display: inline-block; width: 15px; height: 15px; margin-right: 10px; vertical-align: middle; }
-                .join { background-color: red; }
-                .leave { background-color: green; }
-            </style>
-        </head>
-        <body>
-            <h1>Meeting Summary</h1>
-            <div class="summary">
-        """
-        html_content += f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>"
-        html_content += f"Participants (at end): {', '.join(participants_list)}<br>"
-        html_content += f"Duration: {duration}<br>"
-        html_content += f"Total Cost: ${cost:.2f}<br>"
-        html_content += "</div><h2>Participant Events</h2>"
-
-        if self.participant_events:
-            for event in self.participant_events:
-                if "joined" in event:
-                    swatch_class = "join"
-                elif "left" in event:
-                    swatch_class = "leave"
-                else:
-                    swatch_class = ""
-                html_content += f'<div class="event"><span class="swatch {swatch_class}"></span>{event}</div>'
+    def publish_live_state(self, force=False):
+        # Runs on every render tick; the feed's rate limit decides whether state is built at all
+        if self.live_feed is not None and (force or self.live_feed.due()):
+            self.live_feed.publish(self.live_state(), force=force)
+
+    def dashboard_text(self):
+        live = self.sessions.live_rooms()
+        if not live:
+            return "No meetings running"
+        return (f"{len(live)} live {'meeting' if len(live) == 1 else 'meetings'}: "
+                f"${self.sessions.live_rate():.2f}/hr, ${self.sessions.live_cost():.2f} so far")
+
+    def department_of(self, name):
+        if self.employee_repo is None:
+            return ""
+        employee = self.employee_repo.by_name.get(name)
+        return (employee[2] or "") if employee else ""
+
+    def get_participant_menu(self):
+        # Built once and reused; rebuilt only when the employee data has been reloaded
+        self.get_employees()
+        if self.participant_menu is None or self.participant_menu_version != self.employee_repo.version:
+            if self.participant_menu is not None:
+                self.participant_menu.deleteLater()
+            self.participant_menu = DepartmentMenu(
+                self, self.employee_data, lambda name: self.current_room().add_participant_from_menu(name))
+            self.participant_menu_version = self.employee_repo.version
+        return self.participant_menu
+
+    def show_reports(self):
+        from report_view import CostReportDialog
+        CostReportDialog(self, self.history_path).exec()
+
+    def export_snapshot(self, snapshot, meeting_id=None):
+        task = ExportTask(snapshot, self.history_path, self.log_dir if self.export_files else None,
+                          self.journal, meeting_id, self.employee_repo.by_name if self.employee_repo else None)
+        self.pending_exports.add(task.signals)
+        task.signals.finished.connect(self.on_export_finished)
+        task.signals.failed.connect(self.on_export_failed)
+        self.statusBar().showMessage("Saving meeting log...")
+        QThreadPool.globalInstance().start(task)
+
+    def on_export_finished(self, html_filename, xml_filename):
+        self.pending_exports.discard(self.sender())
+        self.statusBar().showMessage("Meeting log saved", 5000)
+        if html_filename:
+            log.info("Meeting data saved to %s (HTML) and %s (XML)! Metadata galore!", html_filename, xml_filename)
         else:
-            html_content += '<div class="event">No participant changes during the meeting.</div>'
-
-        html_content += """
-        </body>
-        </html>
-        """
-
-        with open(html_filename, "w") as f:
-            f.write(html_content)
-
-        # XML Export
-        xml_filename = os.path.join(xml_dir, f"meeting_log_{timestamp}.xml")
-        root = ET.Element("MeetingLog")
-
-        summary = ET.SubElement(root, "Summary")
-        ET.SubElement(summary, "Date").text = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ET.SubElement(summary, "Participants").text = ','.join(participants_list)
-        ET.SubElement(summary, "Duration").text = duration
-        ET.SubElement(summary, "TotalCost").text = f"{cost:.2f}"
-
-        events = ET.SubElement(root, "ParticipantEvents")
-        if self.participant_events:
-            for event in self.participant_events:
-                event_elem = ET.SubElement(events, "Event")
-                if "joined" in event:
-                    event_elem.set("type", "join")
-                elif "left" in event:
-                    event_elem.set("type", "leave")
-                event_elem.text = event
-        else:
-            ET.SubElement(events, "Event").text = "No participant changes during the meeting."
-
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="  ")
-        tree.write(xml_filename, encoding="utf-8", xml_declaration=True)
-
-        print(
-            f"EASTER EGG: Meeting data saved to {html_filename} (HTML) and {xml_filename} (XML)! Metadata galore!")
-
-    def reset_meeting(self):
-        if self.timer.isActive():
-            self.timer.stop()
-        self.participants_list.clear()
-        self.total_hourly_rate = 0.0
-        self.incurred_cost = 0.0
-        self.elapsed_ms = 0
-        self.participant_events = []
-        self.participant_times = {}
-        self.participant_wages = {}
-        self.timer_label.setText("Time Elapsed: 00:00:00:000")
-        self.duration_label.setText("")
-        self.cost_label.setText("Meeting Cost: $0.00")
-        self.simulated_cost_label.setText("Simulated Cost: $0.00")
-        self.start_button.setText("Meeting Start")
-        self.start_button.setEnabled(True)
-        self.start_button.setStyleSheet("background-color: blue; color: white;")
-        self.end_button.setEnabled(False)
-        self.end_button.setStyleSheet("background-color: grey; color: white;")
-        print("EASTER EGG: Resetting the money clock—cha-ching!")
-
-    def update_timer(self):
-        import time
-        current_time = int(time.time() * 1000)
-        self.elapsed_ms = current_time - self.start_time
-        time_str = self.format_time(self.elapsed_ms)
-        self.timer_label.setText(f"Time Elapsed: {time_str}")
-        total_cost = self.calculate_total_cost()
-        self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
-        if self.elapsed_ms % 10000 < 10:
-            print("EASTER EGG: Tick-tock! Time’s money, and you’re racking it up!")
-
-    def format_time(self, milliseconds):
-        hours = milliseconds // (1000 * 60 * 60)
-        minutes = (milliseconds // (1000 * 60)) % 60
-        seconds = (milliseconds // 1000) % 60
-        ms = milliseconds % 1000
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{ms:03d}"
+            log.info("Meeting data saved to %s! Metadata galore!", self.history_path)
+
+    def on_export_failed(self, error):
+        self.pending_exports.discard(self.sender())
+        self.statusBar().showMessage(f"Saving meeting log failed: {error}")
+        QMessageBox.warning(self, "Export Failed", f"The meeting log could not be saved:\n{error}")
 
     def get_employees(self):
-        self.cursor.execute(
-            "SELECT name, working_wage, department, cost_center, worksite_assignment, has_benefits FROM Employees")
-        return self.cursor.fetchall()
+        # Served from the repository cache; only reloads when the DB file changed
+        if self.employee_repo is None:
+            return self.employee_data  # Still loading
+        if self.employee_repo.refresh() or self.employee_index is None:
+            self.employee_data = self.employee_repo.employees
+            self.employee_index = EmployeeIndex(emp[0] for emp in self.employee_data)
+        return self.employee_data
 
     def closeEvent(self, event):
-        self.conn.close()
+        QThreadPool.globalInstance().waitForDone()  # Let in-flight exports finish writing
+        # No roster reloads once the repository below is closed
+        self.roster_reload_timer.stop()
+        if self.roster_watcher is not None:
+            self.roster_watcher.fileChanged.disconnect(self.roster_reload_timer.start)
+            if self.roster_watcher.files():
+                self.roster_watcher.removePaths(self.roster_watcher.files())
+            self.roster_watcher = None
+        if self.live_feed is not None:
+            self.live_feed.stop()
+        self.checkpoint_timer.stop()
+        if self.journal is not None:
+            self.checkpoint_meetings()
+            self.journal.close()  # Live meetings stay journaled and resume from here on next start
+        if self.employee_repo is not None:
+            self.employee_repo.close()
         super().closeEvent(event)
 
 
 def main():
+    config, qt_args = load_config(sys.argv[1:])
+    telemetry.configure()
+    PROFILE.mark("load config")
     QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-    app = QApplication(sys.argv)
-    window = TimeIsMoney()
+    app = QApplication(sys.argv[:1] + qt_args)
+    PROFILE.mark("create QApplication")
+    window = TimeIsMoney(config, PROFILE)
+    PROFILE.mark("build window")
     window.show()
+    QTimer.singleShot(0, lambda: PROFILE.mark("show window"))
+    if config.profile_startup:
+        def report():
+            print(PROFILE.report())
+            app.quit()
+        window.ready.connect(lambda: QTimer.singleShot(0, report))
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,58 @@
+import time
+
+NS_PER_MS = 1_000_000
+
+
+def format_time(milliseconds):
+    """Elapsed milliseconds as 'HH:MM:SS:mmm', the meeting duration format shown and stored everywhere."""
+    hours = milliseconds // (1000 * 60 * 60)
+    minutes = (milliseconds // (1000 * 60)) % 60
+    seconds = (milliseconds // 1000) % 60
+    ms = milliseconds % 1000
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}:{ms:03d}"
+
+
+class MeetingClock:
+    """Meeting time computed on demand instead of per tick.
+
+    Elapsed time comes from time.monotonic_ns, so wall-clock changes (NTP,
+    DST, the user fixing the clock) never make a meeting jump. Wall time is
+    only recorded at start, for display and logs.
+    """
+
+    def __init__(self):
+        self.start_ns = None  # Monotonic anchor, None when stopped
+        self.start_ms = None  # Wall time the meeting started, for display
+        self.stopped_ms = 0  # Elapsed time frozen at the last stop
+
+    @property
+    def running(self):
+        return self.start_ns is not None
+
+    def start(self):
+        self.start_ns = time.monotonic_ns()
+        self.start_ms = time.time_ns() // NS_PER_MS
+        self.stopped_ms = 0
+        return self.start_ms
+
+    def resume(self, start_ms, elapsed_ms):
+        """Continue a meeting that started at wall time start_ms and has run for elapsed_ms."""
+        self.start_ns = time.monotonic_ns() - elapsed_ms * NS_PER_MS
+        self.start_ms = start_ms
+        self.stopped_ms = 0
+        return self.start_ms
+
+    def stop(self):
+        self.stopped_ms = self.elapsed_ms()
+        self.start_ns = None
+        return self.stopped_ms
+
+    def reset(self):
+        self.start_ns = None
+        self.start_ms = None
+        self.stopped_ms = 0
+
+    def elapsed_ms(self):
+        if self.start_ns is None:
+            return self.stopped_ms
+        return (time.monotonic_ns() - self.start_ns) // NS_PER_MS
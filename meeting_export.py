@@ -0,0 +1,188 @@
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from html import escape as html_escape
+
+NO_EVENTS = "No participant changes during the meeting."
+
+HTML_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <title>Meeting Log</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                h1, h2 { color: #333; }
+                .summary { margin-bottom: 20px; }
+                .event { margin: 5px 0; }
+                .swatch { display: inline-block; width: 15px; height: 15px; margin-right: 10px; vertical-align: middle; }
+                .join { background-color: red; }
+                .leave { background-color: green; }
+                table { border-collapse: collapse; }
+                th, td { text-align: left; padding: 2px 12px 2px 0; }
+            </style>
+        </head>
+        <body>
+            <h1>Meeting Summary</h1>
+            <div class="summary">
+        """
+
+HTML_TAIL = """
+        </body>
+        </html>
+        """
+
+
+def offset_str(elapsed_ms):
+    """H:MM:SS from the meeting start."""
+    seconds = elapsed_ms // 1000
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def stint_str(stint, duration_ms):
+    join_ms, leave_ms, _ = stint
+    return f"{offset_str(join_ms)}-{offset_str(duration_ms if leave_ms is None else leave_ms)}"
+
+
+@dataclass(frozen=True)
+class MeetingSnapshot:
+    """Everything an export needs, copied off the live window state at end_meeting."""
+    ended_at: datetime
+    participants: tuple
+    duration: str
+    cost: float
+    events: object  # EventLog snapshot
+    duration_ms: int = 0
+    wages: tuple = ()  # Hourly wage per entry in participants
+    room: str = ""  # Meeting room name when several meetings run at once
+    ledger: tuple = ()  # ParticipantCost for everyone who attended, every stint
+    departments: tuple = ()  # (department, cost) subtotals
+
+    @property
+    def timestamp(self):
+        return self.ended_at.strftime("%Y%m%d_%H%M%S")
+
+    @property
+    def log_name(self):
+        # Two rooms can end in the same second, so the room keeps their logs apart
+        if self.room:
+            return f"meeting_log_{self.timestamp}_{re.sub(r'[^A-Za-z0-9]+', '_', self.room).strip('_')}"
+        return f"meeting_log_{self.timestamp}"
+
+    @property
+    def date_str(self):
+        return self.ended_at.strftime('%Y-%m-%d %H:%M:%S')
+
+
+@contextmanager
+def atomic_write(path, encoding="utf-8"):
+    """Write to a temp file next to path and rename it into place on success.
+
+    Readers never see a half-written log, and a failed export leaves no stray
+    partial file behind.
+    """
+    # Plain open() rather than mkstemp so the log keeps the usual umask permissions
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding=encoding, newline="") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_html(snapshot, f):
+    write = f.write
+    write(HTML_HEAD)
+    write(f"Date: {snapshot.date_str}<br>")
+    if snapshot.room:
+        write(f"Room: {html_escape(snapshot.room)}<br>")
+    write(f"Participants (at end): {html_escape(', '.join(snapshot.participants))}<br>")
+    write(f"Duration: {snapshot.duration}<br>")
+    write(f"Total Cost: ${snapshot.cost:.2f}<br>")
+    write("</div><h2>Participant Events</h2>")
+    events = snapshot.events
+    if events:
+        for event in events:
+            write(f'<div class="event"><span class="swatch {event.kind_name}"></span>'
+                  f'{html_escape(events.describe(event))}</div>')
+    else:
+        write(f'<div class="event">{NO_EVENTS}</div>')
+    if snapshot.ledger:
+        write("<h2>Participant Costs</h2><table><tr><th>Participant</th><th>Department</th><th>Time In Meeting</th>"
+              "<th>Cost</th></tr>")
+        for entry in snapshot.ledger:
+            stints = ", ".join(stint_str(stint, snapshot.duration_ms) for stint in entry.stints)
+            write(f"<tr><td>{html_escape(entry.name)}</td><td>{html_escape(entry.department)}</td>"
+                  f"<td>{stints}</td><td>${entry.cost:.2f}</td></tr>")
+        write("</table>")
+    if snapshot.departments:
+        write("<h2>Department Subtotals</h2><table>")
+        for department, cost in snapshot.departments:
+            write(f"<tr><td>{html_escape(department)}</td><td>${cost:.2f}</td></tr>")
+        write("</table>")
+    write(HTML_TAIL)
+
+
+def write_xml(snapshot, f):
+    # Streams the same document ElementTree + ET.indent used to build in memory
+    from xml.sax.saxutils import escape as xml_escape, quoteattr  # Pulls in urllib; only load it to export
+    write = f.write
+    write("<?xml version='1.0' encoding='utf-8'?>\n<MeetingLog>\n  <Summary>\n")
+    write(f"    <Date>{snapshot.date_str}</Date>\n")
+    if snapshot.room:
+        write(f"    <Room>{xml_escape(snapshot.room)}</Room>\n")
+    write(f"    <Participants>{xml_escape(','.join(snapshot.participants))}</Participants>\n")
+    write(f"    <Duration>{xml_escape(snapshot.duration)}</Duration>\n")
+    write(f"    <TotalCost>{snapshot.cost:.2f}</TotalCost>\n")
+    write("  </Summary>\n  <ParticipantEvents>\n")
+    events = snapshot.events
+    if events:
+        for event in events:
+            write(f"    <Event type={quoteattr(event.kind_name)}>{xml_escape(events.describe(event))}</Event>\n")
+    else:
+        write(f"    <Event>{NO_EVENTS}</Event>\n")
+    write("  </ParticipantEvents>\n")
+    if snapshot.ledger:
+        write("  <ParticipantCosts>\n")
+        for entry in snapshot.ledger:
+            write(f"    <Participant name={quoteattr(entry.name)} department={quoteattr(entry.department)} "
+                  f"timeMs=\"{entry.time_ms}\" cost=\"{entry.cost:.2f}\">\n")
+            for join_ms, leave_ms, cost_cents in entry.stints:
+                leave_ms = snapshot.duration_ms if leave_ms is None else leave_ms
+                write(f"      <Stint joinMs=\"{join_ms}\" leaveMs=\"{leave_ms}\" cost=\"{cost_cents / 100:.2f}\"/>\n")
+            write("    </Participant>\n")
+        write("  </ParticipantCosts>\n")
+    if snapshot.departments:
+        write("  <DepartmentSubtotals>\n")
+        for department, cost in snapshot.departments:
+            write(f"    <Department name={quoteattr(department)} cost=\"{cost:.2f}\"/>\n")
+        write("  </DepartmentSubtotals>\n")
+    write("</MeetingLog>\n")
+
+
+def export_meeting(snapshot, log_dir):
+    """Write the HTML and XML logs for a meeting. Returns (html_path, xml_path)."""
+    html_dir = os.path.join(log_dir, "HTML")
+    xml_dir = os.path.join(log_dir, "XML")
+    os.makedirs(html_dir, exist_ok=True)
+    os.makedirs(xml_dir, exist_ok=True)
+
+    html_filename = os.path.join(html_dir, f"{snapshot.log_name}.html")
+    with atomic_write(html_filename) as f:
+        write_html(snapshot, f)
+
+    xml_filename = os.path.join(xml_dir, f"{snapshot.log_name}.xml")
+    with atomic_write(xml_filename) as f:
+        write_xml(snapshot, f)
+    return html_filename, xml_filename
@@ -0,0 +1,385 @@
+import argparse
+import glob
+import html
+import logging
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+
+from cost_engine import ParticipantCost, department_subtotals
+from event_log import EventLog, KIND_NAMES
+from meeting_clock import format_time
+from meeting_export import MeetingSnapshot, export_meeting
+from schema_migrations import apply_migrations
+
+log = logging.getLogger(__name__)
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+IMPORT_BATCH = 500  # Files per transaction when bulk importing
+# Linux filesystem types where SQLite's WAL shared memory doesn't work across clients
+NETWORK_FILESYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs", "fuse.sshfs"}
+DRIVE_REMOTE = 4  # GetDriveTypeW
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT,
+    ended_at TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    total_cost REAL NOT NULL,
+    source TEXT NOT NULL DEFAULT 'app',
+    log_name TEXT UNIQUE  -- meeting_log_<timestamp>, shared by the .txt/.html/.xml renderings
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_ended_at ON meetings(ended_at);
+
+CREATE TABLE IF NOT EXISTS meeting_participants (
+    meeting_id INTEGER NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    hourly_wage REAL
+);
+CREATE INDEX IF NOT EXISTS idx_meeting_participants_meeting ON meeting_participants(meeting_id);
+CREATE INDEX IF NOT EXISTS idx_meeting_participants_name ON meeting_participants(name);
+
+CREATE TABLE IF NOT EXISTS meeting_events (
+    meeting_id INTEGER NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    elapsed_ms INTEGER,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    rate_delta REAL,
+    PRIMARY KEY (meeting_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_meeting_events_name ON meeting_events(name);
+"""
+
+# Applied in order on top of SCHEMA; PRAGMA user_version counts how many have run
+MIGRATIONS = [
+    [
+        "ALTER TABLE meetings ADD COLUMN room TEXT",
+    ],
+    [
+        # Every interval each participant spent in the meeting, including people who left before the end
+        "CREATE TABLE meeting_stints ("
+        " meeting_id INTEGER NOT NULL REFERENCES meetings(id) ON DELETE CASCADE,"
+        " name TEXT NOT NULL, department TEXT, join_ms INTEGER NOT NULL, leave_ms INTEGER,"
+        " cost_cents INTEGER NOT NULL)",
+        "CREATE INDEX idx_meeting_stints_meeting ON meeting_stints(meeting_id)",
+    ],
+]
+
+EVENT_RE = re.compile(r"^(?P<name>.*) (?P<verb>joined|left) @ .*?; (?P<minutes>\d+) minutes after")
+
+
+def parse_duration(duration):
+    """'HH:MM:SS:mmm' (format_time output) to milliseconds."""
+    hours, minutes, seconds, ms = (int(part) for part in duration.strip().split(":"))
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + ms
+
+
+def is_network_path(path):
+    """True if path is on a network share (UNC path or mapped drive on Windows, NFS/SMB mount on Linux)."""
+    path = os.path.abspath(path)
+    if os.name == "nt":
+        if path.startswith("\\\\"):
+            return True
+        import ctypes
+        return ctypes.windll.kernel32.GetDriveTypeW(os.path.splitdrive(path)[0] + "\\") == DRIVE_REMOTE
+    if not sys.platform.startswith("linux"):
+        return False
+    best, fstype = "", None
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace("\\040", " ")
+                if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) \
+                        and len(mount_point) > len(best):
+                    best, fstype = mount_point, fields[2]
+    except OSError:
+        return False
+    return fstype in NETWORK_FILESYSTEMS
+
+
+class MeetingHistory:
+    """Meetings, their participants and join/leave events in an indexed SQLite file.
+
+    On a local disk the database runs in WAL mode so the app can append while
+    reports read. WAL needs shared memory that network filesystems don't
+    provide, so a history DB on a share (the default app directory is one)
+    uses SQLite's rollback journal instead, which is safe with several
+    clients. Every meeting (or batch of imported files) is a single
+    transaction. One instance per thread: SQLite connections are not shared.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        if is_network_path(path):
+            # Also takes a DB created in WAL mode by an older version back out of it
+            mode = self.conn.execute("PRAGMA journal_mode=DELETE").fetchone()[0]
+            if mode.lower() == "wal":
+                log.warning("%s is on a network share but still in WAL mode; close other clients to switch", path)
+            self.conn.execute("PRAGMA synchronous=FULL")
+        else:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self.migrate()
+
+    def migrate(self):
+        apply_migrations(self.conn, MIGRATIONS)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _insert(self, record):
+        # record: (started_at, ended_at, duration_ms, total_cost, source, log_name, participants, events, room)
+        started_at, ended_at, duration_ms, total_cost, source, log_name, participants, events, room = record
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO meetings (started_at, ended_at, duration_ms, total_cost, source, log_name, room) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (started_at, ended_at, duration_ms, total_cost, source, log_name, room or None))
+        if not cur.rowcount:
+            return None  # Already imported
+        meeting_id = cur.lastrowid
+        self.conn.executemany(
+            "INSERT INTO meeting_participants (meeting_id, name, hourly_wage) VALUES (?, ?, ?)",
+            [(meeting_id, name, wage) for name, wage in participants])
+        self.conn.executemany(
+            "INSERT INTO meeting_events (meeting_id, seq, elapsed_ms, name, kind, rate_delta) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(meeting_id, seq) + tuple(event) for seq, event in enumerate(events)])
+        return meeting_id
+
+    def record_meeting(self, snapshot, source="app"):
+        """Persist a MeetingSnapshot. Returns the new meeting id."""
+        events = snapshot.events
+        started_at = None
+        if events.start_ms is not None:
+            started_at = datetime.fromtimestamp(events.start_ms / 1000).strftime(DATE_FORMAT)
+        wages = snapshot.wages or (None,) * len(snapshot.participants)
+        record = (
+            started_at, snapshot.date_str, snapshot.duration_ms or parse_duration(snapshot.duration),
+            snapshot.cost, source, snapshot.log_name, list(zip(snapshot.participants, wages)),
+            [(e.elapsed_ms, e.name, e.kind_name, e.rate_delta) for e in events], snapshot.room,
+        )
+        with self.conn:
+            meeting_id = self._insert(record)
+            if meeting_id is not None:
+                self.conn.executemany(
+                    "INSERT INTO meeting_stints (meeting_id, name, department, join_ms, leave_ms, cost_cents) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(meeting_id, entry.name, entry.department) + stint
+                     for entry in snapshot.ledger for stint in entry.stints])
+            return meeting_id
+
+    def load_snapshot(self, meeting_id):
+        row = self.conn.execute(
+            "SELECT started_at, ended_at, duration_ms, total_cost, room FROM meetings WHERE id = ?",
+            (meeting_id,)).fetchone()
+        if row is None:
+            raise KeyError(meeting_id)
+        started_at, ended_at, duration_ms, total_cost, room = row
+        ended = datetime.strptime(ended_at, DATE_FORMAT)
+        started = datetime.strptime(started_at, DATE_FORMAT) if started_at else ended - timedelta(
+            milliseconds=duration_ms)
+        participants = self.conn.execute(
+            "SELECT name, hourly_wage FROM meeting_participants WHERE meeting_id = ? ORDER BY rowid",
+            (meeting_id,)).fetchall()
+        events = EventLog(int(started.timestamp() * 1000))
+        for elapsed_ms, name, kind, rate_delta in self.conn.execute(
+                "SELECT elapsed_ms, name, kind, rate_delta FROM meeting_events WHERE meeting_id = ? ORDER BY seq",
+                (meeting_id,)):
+            events.append(KIND_NAMES.index(kind), name, elapsed_ms or 0, rate_delta or 0.0)
+        ledger = {}
+        for name, department, join_ms, leave_ms, cost_cents in self.conn.execute(
+                "SELECT name, department, join_ms, leave_ms, cost_cents FROM meeting_stints WHERE meeting_id = ? "
+                "ORDER BY rowid", (meeting_id,)):
+            ledger.setdefault((name, department or ""), []).append((join_ms, leave_ms, cost_cents))
+        entries = tuple(
+            ParticipantCost(name, department, tuple(stints),
+                            sum((duration_ms if leave_ms is None else leave_ms) - join_ms
+                                for join_ms, leave_ms, _ in stints),
+                            sum(cost_cents for _, _, cost_cents in stints))
+            for (name, department), stints in ledger.items())
+        return MeetingSnapshot(ended, tuple(name for name, _ in participants), format_time(duration_ms),
+                               total_cost, events, duration_ms=duration_ms,
+                               wages=tuple(wage for _, wage in participants), room=room or "", ledger=entries,
+                               departments=department_subtotals(entries))
+
+    def render(self, meeting_id, log_dir):
+        """Write the HTML/XML logs for a stored meeting on demand."""
+        return export_meeting(self.load_snapshot(meeting_id), log_dir)
+
+    def summary(self, since=None, until=None):
+        """(meeting count, total cost) for meetings ending in [since, until)."""
+        clauses, params = [], []
+        if since:
+            clauses.append("ended_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("ended_at < ?")
+            params.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        count, total = self.conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(total_cost), 0) FROM meetings{where}", params).fetchone()
+        return count, total
+
+    def import_files(self, paths):
+        """Bulk-load legacy session logs (.txt, .html, .xml). Returns (imported, skipped)."""
+        imported = skipped = 0
+        batch = []
+
+        def flush():
+            nonlocal imported, skipped
+            with self.conn:
+                for record in batch:
+                    if self._insert(record) is None:
+                        skipped += 1
+                    else:
+                        imported += 1
+            batch.clear()
+
+        for path in paths:
+            try:
+                record = parse_log_file(path)
+            except (OSError, ValueError) as e:
+                log.warning("Skipping %s: %s", path, e)
+                skipped += 1
+                continue
+            if record is None:
+                skipped += 1
+                continue
+            batch.append(record)
+            if len(batch) >= IMPORT_BATCH:
+                flush()
+        if batch:
+            flush()
+        return imported, skipped
+
+
+def _parse_events(items):
+    # items: (kind name or None, description) pairs from an exported log
+    events = []
+    for kind, description in items:
+        match = EVENT_RE.match(description)
+        if not match:
+            continue
+        kind = kind or ("join" if match["verb"] == "joined" else "leave")
+        events.append((int(match["minutes"]) * 60000, match["name"], kind, None))
+    return events
+
+
+def _record(fields, participants, events, source, path):
+    ended_at = datetime.strptime(fields["Date"].strip(), DATE_FORMAT)
+    duration_ms = parse_duration(fields["Duration"])
+    started_at = (ended_at - timedelta(milliseconds=duration_ms)).strftime(DATE_FORMAT)
+    cost = float(fields["Cost"].replace(",", ""))
+    names = [name.strip() for name in participants if name.strip()]
+    # Keyed by file stem so the HTML and XML renderings of one meeting import once
+    log_name = os.path.splitext(os.path.basename(path))[0]
+    return (started_at, ended_at.strftime(DATE_FORMAT), duration_ms, cost, source, log_name,
+            [(name, None) for name in names], events, fields.get("Room"))
+
+
+def parse_log_file(path):
+    """Parse one legacy session log into an insert record, or None if it isn't one."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".txt":
+        fields = {}
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                key, sep, value = line.partition(":")
+                if sep:
+                    fields[key.strip()] = value.strip()
+        cost = fields.get("Total Cost") or fields.get("Cost Estimate before Benefits")
+        if not cost or "Date" not in fields or "Duration" not in fields:
+            return None
+        fields["Cost"] = cost.lstrip("$")
+        return _record(fields, fields.get("Participants", "").split(","), [], "txt", path)
+
+    if ext == ".html":
+        with open(path, encoding="utf-8", errors="replace") as f:
+            content = f.read()
+        fields = {}
+        for key, pattern in (("Date", r"Date: (.*?)<br>"), ("Participants", r"Participants \(at end\): (.*?)<br>"),
+                             ("Duration", r"Duration: (.*?)<br>"), ("Cost", r"Total Cost: \$([\d.,]+)")):
+            match = re.search(pattern, content)
+            if not match:
+                return None
+            fields[key] = html.unescape(match.group(1))
+        room = re.search(r"Room: (.*?)<br>", content)
+        if room:
+            fields["Room"] = html.unescape(room.group(1))
+        items = [(kind or None, html.unescape(text)) for kind, text in re.findall(
+            r'<div class="event"><span class="swatch (\w*)"></span>(.*?)</div>', content)]
+        return _record(fields, fields["Participants"].split(","), _parse_events(items), "html", path)
+
+    if ext == ".xml":
+        import xml.etree.ElementTree as ET
+        try:
+            root = ET.parse(path).getroot()
+        except ET.ParseError as e:
+            raise ValueError(str(e)) from e
+        summary = root.find("Summary")
+        if summary is None:
+            return None
+        fields = {
+            "Date": summary.findtext("Date", ""),
+            "Duration": summary.findtext("Duration", ""),
+            "Cost": summary.findtext("TotalCost", ""),
+            "Room": summary.findtext("Room"),
+        }
+        items = [(elem.get("type"), elem.text or "") for elem in root.iterfind("ParticipantEvents/Event")]
+        return _record(fields, summary.findtext("Participants", "").split(","), _parse_events(items), "xml", path)
+
+    return None
+
+
+def find_log_files(log_dir):
+    patterns = ("*.txt", os.path.join("HTML", "*.html"), os.path.join("XML", "*.xml"))
+    return sorted(path for pattern in patterns for path in glob.glob(os.path.join(glob.escape(log_dir), pattern)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TimeIsMoney meeting history database")
+    parser.add_argument("--db", default="MeetingHistory.db", help="history database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_cmd = commands.add_parser("import", help="bulk-load existing session logs")
+    import_cmd.add_argument("log_dir", nargs="?", default="session logs")
+
+    render_cmd = commands.add_parser("render", help="write HTML/XML logs for a stored meeting")
+    render_cmd.add_argument("meeting_id", type=int)
+    render_cmd.add_argument("--log-dir", default="session logs")
+
+    summary_cmd = commands.add_parser("summary", help="meeting count and total cost for a date range")
+    summary_cmd.add_argument("--since", help="YYYY-MM-DD, inclusive")
+    summary_cmd.add_argument("--until", help="YYYY-MM-DD, exclusive")
+
+    args = parser.parse_args(argv)
+    with MeetingHistory(args.db) as history:
+        if args.command == "import":
+            imported, skipped = history.import_files(find_log_files(args.log_dir))
+            print(f"Imported {imported} meetings ({skipped} skipped or already present)")
+        elif args.command == "render":
+            html_filename, xml_filename = history.render(args.meeting_id, args.log_dir)
+            print(f"Wrote {html_filename} and {xml_filename}")
+        elif args.command == "summary":
+            count, total = history.summary(args.since, args.until)
+            print(f"{count} meetings, total cost ${total:.2f}")
+
+
+if __name__ == "__main__":
+    main()
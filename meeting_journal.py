@@ -0,0 +1,270 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from cost_engine import CostEngine, department_subtotals
+from event_log import JOIN, LEAVE, EventLog
+from meeting_export import MeetingSnapshot, atomic_write
+from telemetry import METRICS
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+log = logging.getLogger(__name__)
+SYNC_SECONDS = METRICS.histogram("timeismoney_journal_sync_seconds", "Journal batch write and fsync duration")
+JOURNAL_RECORDS = METRICS.counter("timeismoney_journal_records_total", "Records made durable in the journal")
+
+DEFAULT_SYNC_MS = 50  # Group-commit window: records appended within it share one fsync
+CHECKPOINT_MS = 30000  # How often live meetings journal their elapsed time
+
+
+@dataclass
+class JournaledMeeting:
+    """One meeting rebuilt from the journal."""
+    meeting_id: str
+    room: str
+    start_ms: int  # Wall time of meeting start
+    initial: dict  # name -> wage, participants present at start
+    events: list = field(default_factory=list)  # (kind, name, elapsed_ms, wage)
+    last_ms: int = 0  # Latest elapsed time the journal knows about, from events, checkpoints or the end
+    ended_at_ms: int = None  # Wall time of end_meeting, None while live
+    saved: bool = False
+    discarded: bool = False
+
+    @property
+    def live(self):
+        return self.ended_at_ms is None and not self.discarded
+
+    @property
+    def unsaved(self):
+        return self.ended_at_ms is not None and not self.saved and not self.discarded
+
+    def participants(self):
+        """name -> wage of everyone in the meeting after the last event, in join order."""
+        present = dict(self.initial)
+        for kind, name, _, wage in self.events:
+            if kind == JOIN:
+                present[name] = wage
+            else:
+                present.pop(name, None)
+        return present
+
+    def event_log(self):
+        log = EventLog(self.start_ms)
+        for kind, name, elapsed_ms, wage in self.events:
+            log.append(kind, name, elapsed_ms, wage if kind == JOIN else -wage)
+        return log
+
+    def cost_engine(self, department_of=None):
+        # Same join/leave sequence the live room applied, so the cost and ledger match exactly
+        department_of = department_of or (lambda name: "")
+        engine = CostEngine()
+        for name, wage in self.initial.items():
+            engine.join(name, wage, 0, department_of(name))
+        for kind, name, elapsed_ms, wage in self.events:
+            if kind == JOIN:
+                engine.join(name, wage, elapsed_ms, department_of(name))
+            elif name in engine:
+                engine.leave(name, elapsed_ms)
+        return engine
+
+    def snapshot(self, duration, department_of=None):
+        """MeetingSnapshot of an ended meeting; duration is the formatted last_ms."""
+        present = self.participants()
+        engine = self.cost_engine(department_of)
+        ledger = engine.ledger(self.last_ms)
+        return MeetingSnapshot(datetime.fromtimestamp(self.ended_at_ms / 1000), tuple(present), duration,
+                               engine.cents_at(self.last_ms) / 100, self.event_log(),
+                               duration_ms=self.last_ms, wages=tuple(present.values()), room=self.room,
+                               ledger=ledger, departments=department_subtotals(ledger))
+
+
+class JournalLocked(OSError):
+    """Another running instance owns the journal."""
+
+
+def lock_exclusive(f):
+    """Lock open file f for this process without waiting. Raises OSError if another process holds it.
+
+    The OS drops the lock when the process exits, so a crash never leaves a stale lock behind.
+    """
+    if os.name == "nt":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def replay(path):
+    """Meetings recorded in the journal at path, in start order. A torn final line is ignored."""
+    meetings = {}
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Partially written when the process died
+            kind = record.get("t")
+            if kind == "start":
+                meetings[record["m"]] = JournaledMeeting(record["m"], record["room"], record["at"],
+                                                         {name: wage for name, wage in record["p"]})
+                continue
+            meeting = meetings.get(record.get("m"))
+            if meeting is None:
+                continue
+            if kind in ("join", "leave"):
+                meeting.events.append((JOIN if kind == "join" else LEAVE, record["n"], record["ms"], record["w"]))
+                meeting.last_ms = max(meeting.last_ms, record["ms"])
+            elif kind == "tick":
+                meeting.last_ms = max(meeting.last_ms, record["ms"])
+            elif kind == "end":
+                meeting.last_ms = record["ms"]
+                meeting.ended_at_ms = record["at"]
+            elif kind == "saved":
+                meeting.saved = True
+            elif kind == "reset":
+                meeting.discarded = True
+    return list(meetings.values())
+
+
+class MeetingJournal:
+    """Append-only write-ahead log of meeting start/join/leave/end records.
+
+    Appends only serialize a line and hand it to a writer thread, which
+    gathers everything that arrives within sync_ms and makes it durable with a
+    single write + fsync, so journaling costs microseconds per event on the
+    GUI thread. Opening the journal replays it (see pending) and compacts it
+    down to the meetings that still need recovering.
+
+    The journal sits in the shared app directory, so it is held under an
+    exclusive lock on path + ".lock" while open. A second instance gets
+    JournalLocked and runs without one instead of resuming the first
+    instance's live meetings as its own.
+    """
+
+    def __init__(self, path, sync_ms=DEFAULT_SYNC_MS):
+        self.path = path
+        self.sync_interval = sync_ms / 1000
+        self.lock_file = open(f"{path}.lock", "a+")
+        try:
+            lock_exclusive(self.lock_file)
+        except OSError as e:
+            self.lock_file.close()
+            raise JournalLocked(f"{path} is in use by another TimeIsMoney instance") from e
+        try:
+            self.pending = [m for m in replay(path) if m.live or m.unsaved]  # Meetings to resume or save
+            self._compact(self.pending)
+            self.file = open(path, "a", encoding="utf-8", newline="\n")
+        except BaseException:
+            self.lock_file.close()
+            raise
+        self.cond = threading.Condition()
+        self.queue = []
+        self.appended = 0  # Records handed to the writer
+        self.synced = 0  # Records known to be on disk
+        self.closed = False
+        self.thread = threading.Thread(target=self._writer, name="meeting-journal", daemon=True)
+        self.thread.start()
+
+    def _compact(self, meetings):
+        # Rewrite the file with only what's still needed, dropping saved/discarded meetings and any torn tail
+        with atomic_write(self.path) as f:
+            for meeting in meetings:
+                f.write(self._line({"t": "start", "m": meeting.meeting_id, "room": meeting.room,
+                                    "at": meeting.start_ms, "p": list(meeting.initial.items())}))
+                for kind, name, elapsed_ms, wage in meeting.events:
+                    f.write(self._line({"t": "join" if kind == JOIN else "leave", "m": meeting.meeting_id,
+                                        "n": name, "ms": elapsed_ms, "w": wage}))
+                if meeting.ended_at_ms is not None:
+                    f.write(self._line({"t": "end", "m": meeting.meeting_id, "ms": meeting.last_ms,
+                                        "at": meeting.ended_at_ms}))
+                elif meeting.last_ms:
+                    f.write(self._line({"t": "tick", "m": meeting.meeting_id, "ms": meeting.last_ms}))
+
+    @staticmethod
+    def _line(record):
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+    def _append(self, record):
+        line = self._line(record)
+        with self.cond:
+            if self.closed:
+                return
+            self.queue.append(line)
+            self.appended += 1
+            self.cond.notify_all()
+
+    def start(self, room, start_ms, participants):
+        """Journal a meeting start; participants is (name, wage) pairs. Returns the new meeting id."""
+        meeting_id = uuid.uuid4().hex
+        self._append({"t": "start", "m": meeting_id, "room": room, "at": start_ms, "p": list(participants)})
+        return meeting_id
+
+    def join(self, meeting_id, name, elapsed_ms, wage):
+        self._append({"t": "join", "m": meeting_id, "n": name, "ms": elapsed_ms, "w": wage})
+
+    def leave(self, meeting_id, name, elapsed_ms, wage):
+        self._append({"t": "leave", "m": meeting_id, "n": name, "ms": elapsed_ms, "w": wage})
+
+    def checkpoint(self, meeting_id, elapsed_ms):
+        """Journal that a live meeting was still running at elapsed_ms; a resume picks up from the latest one."""
+        self._append({"t": "tick", "m": meeting_id, "ms": elapsed_ms})
+
+    def end(self, meeting_id, elapsed_ms, ended_at_ms):
+        self._append({"t": "end", "m": meeting_id, "ms": elapsed_ms, "at": ended_at_ms})
+
+    def saved(self, meeting_id):
+        """The meeting is in the history DB and no longer needs recovering. Safe from any thread."""
+        self._append({"t": "saved", "m": meeting_id})
+
+    def discard(self, meeting_id):
+        self._append({"t": "reset", "m": meeting_id})
+
+    def sync(self, timeout=None):
+        """Block until every record appended so far is on disk. Returns False on timeout."""
+        with self.cond:
+            target = self.appended
+            return self.cond.wait_for(lambda: self.synced >= target, timeout)
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join()
+        self.file.close()
+        self.lock_file.close()  # Releases the lock
+
+    def _writer(self):
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.queue or self.closed)
+                if not self.queue:
+                    return  # Closed with nothing left to write
+                closing = self.closed
+            if not closing:
+                time.sleep(self.sync_interval)  # Let a burst (e.g. Add All Employees) share this fsync
+            with self.cond:
+                batch, self.queue = self.queue, []
+            try:
+                with SYNC_SECONDS.time():
+                    self.file.write("".join(batch))
+                    self.file.flush()
+                    os.fsync(self.file.fileno())
+                JOURNAL_RECORDS.inc(len(batch))
+            except OSError as e:
+                # Keep the meeting running; it just isn't crash-safe until the disk recovers
+                log.error("Meeting journal write failed: %s", e)
+            with self.cond:
+                self.synced += len(batch)
+                self.cond.notify_all()
@@ -0,0 +1,461 @@
+import logging
+import time
+from datetime import datetime
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QComboBox, QLabel, QLineEdit, QListView, QListWidget, QMessageBox, QPushButton, \
+    QVBoxLayout, QWidget
+
+from cost_engine import CostEngine, department_subtotals, simulated_cost
+from department_menu import department_label
+from event_log import EventLog, clock_str
+from meeting_clock import MeetingClock, format_time
+from meeting_export import MeetingSnapshot
+from participant_model import ParticipantModel
+from telemetry import METRICS
+
+log = logging.getLogger(__name__)
+PARTICIPANT_EVENTS = METRICS.counter("timeismoney_participant_events_total",
+                                     "Joins and leaves recorded in live meetings")
+MEETINGS_STARTED = METRICS.counter("timeismoney_meetings_started_total", "Meetings started or resumed")
+MEETINGS_ENDED = METRICS.counter("timeismoney_meetings_ended_total", "Meetings ended")
+
+
+class MeetingRoom(QWidget):
+    """Controls and state for one meeting; the main window hosts one per conference room.
+
+    Employee data, the Add Participant menu, the render loop and exports are
+    shared services borrowed from the window (app).
+    """
+    SEARCH_DEBOUNCE_MS = 120
+    SEARCH_RESULT_LIMIT = 50
+    LIVE_EVENT_TAIL = 20  # Most recent join/leave events included in live_state()
+
+    def __init__(self, app, room_name):
+        super().__init__()
+        self.app = app
+        self.room_name = room_name
+
+        # Left sidebar (vertical layout for controls) - acting as toolbar
+        self.sidebar_layout = QVBoxLayout(self)
+        self.setMaximumWidth(200)
+
+        # Search box for employees
+        self.search_box = QLineEdit(self)
+        self.search_box.setPlaceholderText("Search Employees...")
+        self.search_box.textChanged.connect(self.schedule_search)
+        self.sidebar_layout.addWidget(self.search_box)
+
+        # Debounce keystrokes so only the settled query hits the index
+        self.search_debounce = QTimer(self)
+        self.search_debounce.setSingleShot(True)
+        self.search_debounce.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_debounce.timeout.connect(lambda: self.update_search_results(self.search_box.text()))
+
+        # Search results list
+        self.search_results = QListWidget(self)
+        self.search_results.itemClicked.connect(self.add_participant_from_search)
+        self.search_results.setMaximumHeight(100)
+        self.sidebar_layout.addWidget(self.search_results)
+
+        # Add Participant button (Red)
+        self.add_participant_button = QPushButton("Add Participant", self)
+        self.add_participant_button.clicked.connect(self.show_participant_menu)
+        self.add_participant_button.setStyleSheet("background-color: red; color: white;")
+        self.sidebar_layout.addWidget(self.add_participant_button)
+
+        # Remove Participant button (Green)
+        self.remove_participant_button = QPushButton("Remove Participant", self)
+        self.remove_participant_button.clicked.connect(self.remove_participant)
+        self.remove_participant_button.setStyleSheet("background-color: green; color: white;")
+        self.sidebar_layout.addWidget(self.remove_participant_button)
+
+        # Add All Employees button (Purple)
+        self.add_all_button = QPushButton("Add All Employees", self)
+        self.add_all_button.clicked.connect(self.add_all_employees)
+        self.add_all_button.setStyleSheet("background-color: purple; color: white;")
+        self.sidebar_layout.addWidget(self.add_all_button)
+
+        # Participants list: a view over the participant model
+        self.participants = ParticipantModel(self)
+        self.participants_list = QListView(self)
+        self.participants_list.setUniformItemSizes(True)
+        self.participants_list.setModel(self.participants)
+        self.sidebar_layout.addWidget(self.participants_list)
+
+        # Timer display label
+        self.timer_label = QLabel("Time Elapsed: 00:00:00:000", self)
+        self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.sidebar_layout.addWidget(self.timer_label)
+
+        # Meeting Start button (Blue when active, Grey when inactive)
+        self.start_button = QPushButton("Meeting Start", self)
+        self.start_button.clicked.connect(self.start_meeting)
+        self.start_button.setStyleSheet("background-color: blue; color: white;")
+        self.sidebar_layout.addWidget(self.start_button)
+
+        # End Meeting button (Grey initially, Blue when active)
+        self.end_button = QPushButton("End Meeting", self)
+        self.end_button.clicked.connect(self.end_meeting)
+        self.end_button.setEnabled(False)
+        self.end_button.setStyleSheet("background-color: grey; color: white;")
+        self.sidebar_layout.addWidget(self.end_button)
+
+        # Meeting duration label
+        self.duration_label = QLabel("", self)
+        self.duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.sidebar_layout.addWidget(self.duration_label)
+
+        # Meeting cost label
+        self.cost_label = QLabel("Meeting Cost: $0.00", self)
+        self.cost_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.cost_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
+        self.sidebar_layout.addWidget(self.cost_label)
+
+        # Running cost per department
+        self.department_costs_label = QLabel("", self)
+        self.department_costs_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.sidebar_layout.addWidget(self.department_costs_label)
+
+        # Set meeting length label
+        self.simulate_label = QLabel("Set Meeting Length:", self)
+        self.sidebar_layout.addWidget(self.simulate_label)
+
+        # Simulate combo box
+        self.simulate_combo = QComboBox(self)
+        self.simulate_combo.addItems(["15 min", "30 min", "45 min", "60 min", "75 min", "90 min", "105 min", "120 min"])
+        self.simulate_combo.currentTextChanged.connect(self.update_simulated_cost)
+        self.sidebar_layout.addWidget(self.simulate_combo)
+
+        # Simulated cost label
+        self.simulated_cost_label = QLabel("Simulated Cost: $0.00", self)
+        self.simulated_cost_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.sidebar_layout.addWidget(self.simulated_cost_label)
+
+        # Add stretch to push controls to top and separate reset button
+        self.sidebar_layout.addStretch()
+
+        # Reset button (now at bottom of toolbar)
+        self.reset_button = QPushButton("Reset Meeting", self)
+        self.reset_button.clicked.connect(self.reset_meeting)
+        self.reset_button.setStyleSheet("background-color: orange; color: black;")
+        self.sidebar_layout.addWidget(self.reset_button)
+
+        # Timer setup: the clock is the time model, the shared scheduler only repaints
+        self.clock = MeetingClock()
+        self.render_scheduler = app.render_scheduler
+        self.render_scheduler.bind(self.timer_label, lambda: f"Time Elapsed: {format_time(self.elapsed_ms)}")
+        self.render_scheduler.bind(self.cost_label, lambda: f"Meeting Cost: ${self.calculate_total_cost():.2f}")
+        self.render_scheduler.bind(self.department_costs_label, self.department_costs_text)
+        self.render_scheduler.on_tick(self.update_timer)
+        self.start_time = None
+        self.last_tick_bucket = 0
+        self.participant_events = EventLog()  # Typed join/leave records, formatted only at export
+        self.meeting_start_str = ""
+        self.cost_engine = CostEngine()  # Tracks join times and running cost
+        self.meeting_id = None  # This meeting's id in the journal
+
+    @property
+    def journal(self):
+        # Crash-safe record of the live meeting, None until loaded or if unavailable
+        return self.app.journal
+
+    def detach(self):
+        """Stop using the shared services before the room is closed."""
+        self.render_scheduler.unbind(self.timer_label)
+        self.render_scheduler.unbind(self.cost_label)
+        self.render_scheduler.unbind(self.department_costs_label)
+        self.render_scheduler.remove_tick(self.update_timer)
+        self.app.sessions.remove_room(self)
+
+    def show_participant_menu(self):
+        menu = self.app.get_participant_menu()
+        menu.exec(self.add_participant_button.mapToGlobal(self.add_participant_button.rect().bottomLeft()))
+
+    def add_participant(self, name, via):
+        if name in self.participants:
+            return False
+        try:
+            wage = self.app.employee_repo.wage(name)
+        except KeyError:
+            # Picked from results shown before a roster sync removed or renamed them
+            self.app.statusBar().showMessage(f"{name} is no longer in the employee roster", 5000)
+            self.refresh_search()
+            return False
+        other = self.app.sessions.room_of(name)
+        if other is not None and other is not self:
+            # Flag people already in another room rather than billing them twice
+            answer = QMessageBox.question(
+                self, "Already In A Meeting",
+                f"{name} is already in {other.room_name}. Move them to {self.room_name}?")
+            if answer != QMessageBox.StandardButton.Yes:
+                return False
+            other.drop_participant(name)
+        self.participants.add(name, wage)
+        self.app.sessions.claim(name, self)
+        log.debug("%s joined the money-making party via %s!", name, via,
+                  extra={"room": self.room_name, "participant": name})
+        if self.clock.running:
+            elapsed_ms = self.elapsed_ms
+            self.participant_events.join(name, elapsed_ms, wage)
+            PARTICIPANT_EVENTS.inc()
+            self.cost_engine.join(name, wage, elapsed_ms, self.app.department_of(name))  # Record join time
+            if self.journal is not None:
+                self.journal.join(self.meeting_id, name, elapsed_ms, wage)
+            # Update cost label immediately
+            self.render_scheduler.refresh()
+        # Update simulated cost
+        self.update_simulated_cost(self.simulate_combo.currentText())
+        return True
+
+    def add_participant_from_menu(self, name):
+        self.add_participant(name, "menu")
+
+    def schedule_search(self, text):
+        if not text:
+            # Clearing is cheap, do it right away
+            self.search_debounce.stop()
+            self.update_search_results(text)
+        else:
+            self.search_debounce.start()
+
+    def update_search_results(self, text):
+        if text:
+            self.app.get_employees()  # Rebuilds the index if the DB changed
+            matches = self.app.employee_index.search(text, limit=self.SEARCH_RESULT_LIMIT)
+        else:
+            matches = []
+        self.search_results.setUpdatesEnabled(False)
+        self.search_results.clear()
+        self.search_results.addItems(matches)
+        self.search_results.setUpdatesEnabled(True)
+
+    def refresh_search(self):
+        """Re-run the current search, e.g. after the roster was reloaded."""
+        if self.search_box.text():
+            self.update_search_results(self.search_box.text())
+
+    def add_participant_from_search(self, item):
+        self.add_participant(item.text(), "search")
+
+    def remove_participant(self):
+        selected_indexes = self.participants_list.selectionModel().selectedIndexes()
+        if not selected_indexes:
+            log.debug("No participant selected for removal")
+            return
+        self.drop_participant(self.participants.name_at(selected_indexes[0].row()))
+
+    def drop_participant(self, selected_name):
+        wage = self.participants.remove(selected_name)
+        self.app.sessions.release(selected_name, self)
+        fields = {"room": self.room_name, "participant": selected_name, "wage": wage}
+
+        # Close out the cost this participant incurred before removal
+        elapsed_ms = self.elapsed_ms
+        if self.clock.running and selected_name in self.cost_engine:
+            fields["time_in_meeting_ms"] = elapsed_ms - self.cost_engine.join_times[selected_name]
+            fields["cost_incurred"] = round(self.cost_engine.leave(selected_name, elapsed_ms), 2)
+
+        if self.clock.running:
+            self.participant_events.leave(selected_name, elapsed_ms, wage)
+            PARTICIPANT_EVENTS.inc()
+            if self.journal is not None:
+                self.journal.leave(self.meeting_id, selected_name, elapsed_ms, wage)
+            self.render_scheduler.refresh()
+        if log.isEnabledFor(logging.DEBUG):
+            fields.update(hourly_rate=self.participants.total_wage, meeting_cost=round(self.calculate_total_cost(), 2))
+            log.debug("%s has left the money-making party!", selected_name, extra=fields)
+        # Update simulated cost
+        self.update_simulated_cost(self.simulate_combo.currentText())
+
+    def add_all_employees(self):
+        employees = self.app.get_employees()
+        sessions = self.app.sessions
+        # Anyone already in another room stays there; they are reported, not double-counted
+        busy = [employee[0] for employee in employees if sessions.room_of(employee[0]) not in (None, self)]
+        busy_names = set(busy)
+        # One model reset for the whole batch instead of an addItem/redraw per employee
+        added = self.participants.add_many(
+            (employee[0], employee[1]) for employee in employees if employee[0] not in busy_names)
+        elapsed_ms = self.elapsed_ms  # One timestamp for the whole bulk join
+
+        for name, wage in added:
+            sessions.claim(name, self)
+            if self.clock.running:
+                self.participant_events.join(name, elapsed_ms, wage)
+                self.cost_engine.join(name, wage, elapsed_ms, self.app.department_of(name))  # Record join time
+                if self.journal is not None:
+                    self.journal.join(self.meeting_id, name, elapsed_ms, wage)
+
+        if self.clock.running:
+            PARTICIPANT_EVENTS.inc(len(added))
+        log.info("%d employees joined the company-wide cash bash!", len(added),
+                 extra={"room": self.room_name, "skipped": len(busy)})
+        if busy:
+            self.app.statusBar().showMessage(
+                f"{len(busy)} employees skipped: already in another meeting", 5000)
+        if self.clock.running:
+            self.render_scheduler.refresh()
+        # Update simulated cost
+        self.update_simulated_cost(self.simulate_combo.currentText())
+
+    def calculate_total_cost(self):
+        return self.cost_engine.cost_at(self.elapsed_ms)
+
+    def department_costs_text(self):
+        return "\n".join(f"{department_label(department) or 'Other'}: ${cost:.2f}"
+                         for department, cost in self.cost_engine.department_costs(self.elapsed_ms))
+
+    def update_simulated_cost(self, text):
+        if not text:
+            self.simulated_cost_label.setText("Simulated Cost: $0.00")
+            return
+        try:
+            minutes = int(text.split()[0])
+            cost = simulated_cost(self.participants.total_wage, minutes)
+            self.simulated_cost_label.setText(f"Simulated Cost: ${cost:.2f}")
+        except ValueError:
+            self.simulated_cost_label.setText("Simulated Cost: $0.00")
+
+    def start_meeting(self):
+        if not self.participants:
+            QMessageBox.warning(self, "No Participants", "MEETINGS ARE FOR PEOPLE")
+            return
+
+        if not self.clock.running:
+            self.start_time = self.clock.start()
+            self.participant_events.reset(self.start_time)
+            self.cost_engine.reset()
+            # Set join times for initial participants
+            wages = self.participants.wages()
+            for name, wage in wages.items():
+                self.cost_engine.join(name, wage, 0, self.app.department_of(name))
+            if self.journal is not None:
+                self.meeting_id = self.journal.start(self.room_name, self.start_time, wages.items())
+            self.show_running()
+            MEETINGS_STARTED.inc()
+            log.info("Meeting initiated! Time to make some money, honey!",
+                     extra={"room": self.room_name, "participants": len(wages)})
+
+    def resume_meeting(self, meeting):
+        """Pick up a meeting replayed from the journal (a JournaledMeeting) where it left off.
+
+        Returns the milliseconds the app was down, which are not counted.
+        """
+        added = self.participants.add_many(meeting.participants().items())
+        for name, _ in added:
+            self.app.sessions.claim(name, self)
+        self.participant_events = meeting.event_log()
+        self.cost_engine = meeting.cost_engine(self.app.department_of)
+        # Continue from the last time the app was known to be running; downtime is not billed
+        elapsed_ms = meeting.last_ms
+        self.start_time = self.clock.resume(meeting.start_ms, elapsed_ms)
+        self.meeting_id = meeting.meeting_id
+        self.show_running()
+        self.update_simulated_cost(self.simulate_combo.currentText())
+        MEETINGS_STARTED.inc()
+        gap_ms = max(0, time.time_ns() // 1_000_000 - meeting.start_ms - elapsed_ms)
+        log.info("Resumed meeting from the journal at %s", format_time(elapsed_ms),
+                 extra={"room": self.room_name, "not_counted_ms": gap_ms})
+        return gap_ms
+
+    def show_running(self):
+        self.last_tick_bucket = self.elapsed_ms // 10000
+        self.meeting_start_str = clock_str(self.start_time)
+        self.start_button.setText("Meeting Started")
+        self.start_button.setEnabled(False)
+        self.start_button.setStyleSheet("background-color: grey; color: white;")
+        self.end_button.setEnabled(True)
+        self.end_button.setStyleSheet("background-color: blue; color: white;")
+        self.duration_label.setText("")
+        self.cost_label.setText(f"Meeting Cost: ${self.calculate_total_cost():.2f}")
+        self.app.room_state_changed(self)
+
+    def end_meeting(self):
+        if self.clock.running:
+            ended_at = datetime.now()
+            self.clock.stop()
+            if self.journal is not None:
+                self.journal.end(self.meeting_id, self.elapsed_ms, int(ended_at.timestamp() * 1000))
+            self.app.room_state_changed(self)
+            self.end_button.setEnabled(False)
+            self.end_button.setStyleSheet("background-color: grey; color: white;")
+            self.start_button.setEnabled(True)
+            self.start_button.setStyleSheet("background-color: blue; color: white;")
+            self.start_button.setText("Meeting Start")
+            duration_str = format_time(self.elapsed_ms)
+            self.duration_label.setText(f"Meeting Duration: {duration_str}")
+            total_cost = self.cost_engine.cents_at(self.elapsed_ms) / 100  # What the ledger adds up to
+            self.cost_label.setText(f"Meeting Cost: ${total_cost:.2f}")
+            MEETINGS_ENDED.inc()
+            log.info("Meeting over! Time banked: %s. Cash it in!", duration_str,
+                     extra={"room": self.room_name, "cost": round(total_cost, 2)})
+            self.save_meeting_data(self.participants.names(), duration_str, total_cost, ended_at)
+
+    def save_meeting_data(self, participants, duration, cost, ended_at=None):
+        # Snapshot the meeting now; formatting and disk/network I/O happen off the GUI thread
+        participants = tuple(participants)
+        ledger = self.cost_engine.ledger(self.elapsed_ms)
+        snapshot = MeetingSnapshot(ended_at or datetime.now(), participants, duration, cost,
+                                   self.participant_events.snapshot(), duration_ms=self.elapsed_ms,
+                                   wages=tuple(self.participants.wage(name) for name in participants),
+                                   room=self.room_name, ledger=ledger,
+                                   departments=department_subtotals(ledger))
+        self.app.export_snapshot(snapshot, self.meeting_id)
+
+    def reset_meeting(self):
+        if self.clock.running and self.journal is not None:
+            self.journal.discard(self.meeting_id)  # Abandoned, nothing to recover
+        self.meeting_id = None
+        self.clock.reset()
+        self.app.room_state_changed(self)
+        self.participants.clear()
+        self.app.sessions.release_all(self)
+        self.participant_events.reset()
+        self.cost_engine.reset()
+        self.timer_label.setText("Time Elapsed: 00:00:00:000")
+        self.duration_label.setText("")
+        self.cost_label.setText("Meeting Cost: $0.00")
+        self.department_costs_label.setText("")
+        self.simulated_cost_label.setText("Simulated Cost: $0.00")
+        self.start_button.setText("Meeting Start")
+        self.start_button.setEnabled(True)
+        self.start_button.setStyleSheet("background-color: blue; color: white;")
+        self.end_button.setEnabled(False)
+        self.end_button.setStyleSheet("background-color: grey; color: white;")
+        log.debug("Resetting the money clock—cha-ching!", extra={"room": self.room_name})
+
+    def live_state(self):
+        """Plain-data view of this room for the live feed."""
+        live = self.clock.running
+        elapsed_ms = self.elapsed_ms
+        events = self.participant_events
+        first = max(0, len(events) - self.LIVE_EVENT_TAIL)
+        return {
+            "room": self.room_name,
+            "live": live,
+            "started_at": self.start_time if live else None,
+            "elapsed_ms": elapsed_ms,
+            "rate": self.cost_engine.hourly_rate if live else 0.0,
+            "cost": round(self.cost_engine.cost_at(elapsed_ms), 2),
+            "participants": len(self.participants),
+            "departments": {department or "Other": round(cost, 2)
+                            for department, cost in self.cost_engine.department_costs(elapsed_ms)},
+            # seq lets clients that skipped a coalesced update de-duplicate events
+            "events": [{"seq": seq, "elapsed_ms": event.elapsed_ms, "name": event.name, "kind": event.kind_name}
+                       for seq, event in ((seq, events[seq]) for seq in range(first, len(events)))],
+        }
+
+    @property
+    def elapsed_ms(self):
+        return self.clock.elapsed_ms()
+
+    def update_timer(self):
+        # Labels are repainted by render_scheduler; this only runs per-tick side effects
+        if not self.clock.running or not log.isEnabledFor(logging.DEBUG):
+            return
+        bucket = self.elapsed_ms // 10000
+        if bucket != self.last_tick_bucket:
+            self.last_tick_bucket = bucket
+            log.debug("Tick-tock! Time’s money, and you’re racking it up!", extra={"room": self.room_name})
@@ -0,0 +1,44 @@
+class SessionManager:
+    """Every meeting room tracked by this process, and which room each employee is in.
+
+    An employee belongs to at most one room at a time, so nobody's wage is
+    ever counted by two concurrent meetings. Rooms are duck-typed: anything
+    with room_name, clock, cost_engine and calculate_total_cost() works.
+    """
+
+    def __init__(self):
+        self.rooms = []
+        self.attendance = {}  # employee name -> room they are currently in
+
+    def add_room(self, room):
+        self.rooms.append(room)
+
+    def remove_room(self, room):
+        self.rooms.remove(room)
+        self.release_all(room)
+
+    def room_of(self, name):
+        return self.attendance.get(name)
+
+    def claim(self, name, room):
+        """Record name as being in room. Returns the room they were in before, if another one."""
+        previous = self.attendance.get(name)
+        self.attendance[name] = room
+        return previous if previous is not room else None
+
+    def release(self, name, room):
+        if self.attendance.get(name) is room:
+            del self.attendance[name]
+
+    def release_all(self, room):
+        for name in [name for name, owner in self.attendance.items() if owner is room]:
+            del self.attendance[name]
+
+    def live_rooms(self):
+        return [room for room in self.rooms if room.clock.running]
+
+    def live_rate(self):
+        return sum(room.cost_engine.hourly_rate for room in self.live_rooms())
+
+    def live_cost(self):
+        return sum(room.calculate_total_cost() for room in self.live_rooms())
@@ -0,0 +1,105 @@
+from array import array
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class ParticipantModel(QAbstractListModel):
+    """Current participants and their hourly wages, projected into a list view.
+
+    Names live in a plain list with a name -> row dict alongside it for O(1)
+    membership, and wages in a parallel array of doubles. The running wage
+    total is maintained on insert/remove so nothing has to re-sum it.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._rows = {}  # name -> row in _names
+        self._wages = array("d")
+        self.total_wage = 0.0
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._names[index.row()]
+
+    # Python-side API
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def names(self):
+        return list(self._names)
+
+    def wage(self, name):
+        return self._wages[self._rows[name]]
+
+    def wages(self):
+        return dict(zip(self._names, self._wages))
+
+    def name_at(self, row):
+        return self._names[row]
+
+    def add(self, name, wage):
+        if name in self._rows:
+            return False
+        row = len(self._names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows[name] = row
+        self._names.append(name)
+        self._wages.append(wage)
+        self.total_wage += wage
+        self.endInsertRows()
+        return True
+
+    def add_many(self, pairs):
+        """Add (name, wage) pairs in one model reset. Returns the pairs actually added."""
+        added = []
+        rows = self._rows
+        for name, wage in pairs:
+            if name not in rows:
+                rows[name] = -1  # Placeholder so duplicates within pairs are skipped too
+                added.append((name, wage))
+        if not added:
+            return added
+        self.beginResetModel()
+        for name, wage in added:
+            rows[name] = len(self._names)
+            self._names.append(name)
+            self._wages.append(wage)
+            self.total_wage += wage
+        self.endResetModel()
+        return added
+
+    def remove(self, name):
+        """Remove a participant and return their wage."""
+        row = self._rows.pop(name)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._names[row]
+        wage = self._wages.pop(row)
+        for later in range(row, len(self._names)):
+            self._rows[self._names[later]] = later
+        self.total_wage -= wage
+        if not self._names:
+            self.total_wage = 0.0
+        self.endRemoveRows()
+        return wage
+
+    def clear(self):
+        self.beginResetModel()
+        self._names = []
+        self._rows = {}
+        self._wages = array("d")
+        self.total_wage = 0.0
+        self.endResetModel()
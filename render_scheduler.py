@@ -0,0 +1,127 @@
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+from telemetry import METRICS
+
+DEFAULT_REFRESH_HZ = 30
+HIDDEN_REFRESH_HZ = 1
+TICK_SECONDS = METRICS.histogram("timeismoney_render_tick_seconds", "Render loop tick duration")
+
+
+class RenderScheduler(QObject):
+    """Refreshes bound labels at a fixed rate, decoupled from the meeting time model.
+
+    Each binding pairs a label with a function producing its text. A tick only
+    calls setText when the text actually changed, labels that are not shown
+    (such as those on a background tab) are skipped, and while the window is
+    minimized or hidden the timer drops to HIDDEN_REFRESH_HZ and skips painting
+    until the window comes back.
+    """
+
+    def __init__(self, window, refresh_hz=DEFAULT_REFRESH_HZ, hidden_hz=HIDDEN_REFRESH_HZ):
+        super().__init__(window)
+        self.window = window
+        self.refresh_hz = max(1, int(refresh_hz))
+        self.hidden_hz = max(1, int(hidden_hz))
+        self.bindings = []  # [label, text_fn, last_text]
+        self.tick_callbacks = []
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.throttled = False
+        self.reset_stats()
+        window.installEventFilter(self)
+
+    def bind(self, label, text_fn):
+        self.bindings.append([label, text_fn, label.text()])
+
+    def unbind(self, label):
+        self.bindings = [binding for binding in self.bindings if binding[0] is not label]
+
+    def on_tick(self, callback):
+        self.tick_callbacks.append(callback)
+
+    def remove_tick(self, callback):
+        self.tick_callbacks.remove(callback)
+
+    def isActive(self):
+        return self.timer.isActive()
+
+    def start(self):
+        self.reset_stats()
+        self.invalidate()
+        self.throttled = False
+        self.timer.start(self._interval_ms(self.refresh_hz))
+
+    def stop(self):
+        self.timer.stop()
+
+    def invalidate(self):
+        # Forget cached text so the next render repaints every binding
+        for binding in self.bindings:
+            binding[2] = None
+
+    def reset_stats(self):
+        self.ticks = 0
+        self.repaints = 0
+        self.repaints_skipped = 0
+        self.started_at = time.perf_counter()
+
+    def stats(self):
+        elapsed = time.perf_counter() - self.started_at
+        return {
+            "ticks": self.ticks,
+            "ticks_per_second": self.ticks / elapsed if elapsed > 0 else 0.0,
+            "repaints": self.repaints,
+            "repaints_skipped": self.repaints_skipped,
+        }
+
+    def tick(self):
+        with TICK_SECONDS.time():
+            self.ticks += 1
+            for callback in self.tick_callbacks:
+                callback()
+            if self._window_hidden():
+                self._set_throttled(True)
+                self.repaints_skipped += len(self.bindings)
+                return
+            self._set_throttled(False)
+            self.refresh()
+
+    def refresh(self):
+        for binding in self.bindings:
+            label, text_fn, last_text = binding
+            if not label.isVisibleTo(self.window):
+                # e.g. a label on a background tab; it repaints once it is shown again
+                self.repaints_skipped += 1
+                continue
+            text = text_fn()
+            if text == last_text:
+                self.repaints_skipped += 1
+                continue
+            label.setText(text)
+            binding[2] = text
+            self.repaints += 1
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and self.timer.isActive() and event.type() in (
+                QEvent.Type.WindowStateChange, QEvent.Type.Show, QEvent.Type.Hide):
+            # Repaint right away on restore rather than waiting out a throttled tick
+            hidden = self._window_hidden()
+            self._set_throttled(hidden)
+            if not hidden:
+                self.refresh()
+        return False
+
+    def _window_hidden(self):
+        return self.window.isMinimized() or not self.window.isVisible()
+
+    def _set_throttled(self, throttled):
+        if throttled == self.throttled:
+            return
+        self.throttled = throttled
+        self.timer.setInterval(self._interval_ms(self.hidden_hz if throttled else self.refresh_hz))
+
+    @staticmethod
+    def _interval_ms(hz):
+        return max(1, round(1000 / hz))
@@ -0,0 +1,99 @@
+from PyQt6.QtCore import QDate
+from PyQt6.QtWidgets import QComboBox, QDateEdit, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel, \
+    QMessageBox, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout
+
+from analytics import CostAnalytics, export_report
+from meeting_history import MeetingHistory
+
+GROUPINGS = (
+    ("Department", "department"),
+    ("Cost Center", "cost_center"),
+    ("Worksite", "worksite_assignment"),
+    ("Recurring Meeting", "series"),
+    ("All Meetings", "total"),
+)
+PERIOD_CHOICES = (("Week", "week"), ("Day", "day"))
+HEADERS = ("Period", "Group", "Meetings", "Person Hours", "Cost")
+DEFAULT_WEEKS = 12
+
+
+class CostReportDialog(QDialog):
+    """Meeting cost per period and group, read from the precomputed rollups."""
+
+    def __init__(self, parent, history_path):
+        super().__init__(parent)
+        self.setWindowTitle("Meeting Cost Reports")
+        self.resize(700, 500)
+        self.history = MeetingHistory(history_path)
+        self.analytics = CostAnalytics(self.history)
+        self.rows = []
+
+        layout = QVBoxLayout(self)
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Group by:", self))
+        self.grouping_combo = QComboBox(self)
+        for label, dimension in GROUPINGS:
+            self.grouping_combo.addItem(label, dimension)
+        controls.addWidget(self.grouping_combo)
+        self.period_combo = QComboBox(self)
+        for label, period in PERIOD_CHOICES:
+            self.period_combo.addItem(label, period)
+        controls.addWidget(self.period_combo)
+        controls.addWidget(QLabel("From:", self))
+        self.since_edit = QDateEdit(QDate.currentDate().addDays(-7 * DEFAULT_WEEKS), self)
+        self.since_edit.setCalendarPopup(True)
+        controls.addWidget(self.since_edit)
+        controls.addWidget(QLabel("To:", self))
+        self.until_edit = QDateEdit(QDate.currentDate(), self)
+        self.until_edit.setCalendarPopup(True)
+        controls.addWidget(self.until_edit)
+        layout.addLayout(controls)
+
+        self.table = QTableWidget(0, len(HEADERS), self)
+        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        footer = QHBoxLayout()
+        self.total_label = QLabel("", self)
+        footer.addWidget(self.total_label)
+        footer.addStretch()
+        self.export_button = QPushButton("Export...", self)
+        self.export_button.clicked.connect(self.export)
+        footer.addWidget(self.export_button)
+        layout.addLayout(footer)
+
+        for combo in (self.grouping_combo, self.period_combo):
+            combo.currentIndexChanged.connect(self.refresh)
+        for edit in (self.since_edit, self.until_edit):
+            edit.dateChanged.connect(self.refresh)
+        self.refresh()
+
+    def refresh(self):
+        since = self.since_edit.date().toString("yyyy-MM-dd")
+        until = self.until_edit.date().addDays(1).toString("yyyy-MM-dd")  # The To date is inclusive
+        self.rows = self.analytics.report(self.grouping_combo.currentData(), self.period_combo.currentData(),
+                                          since, until)
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(self.rows))
+        for row, (period_start, value, meetings, person_hours, cost) in enumerate(self.rows):
+            for column, text in enumerate((period_start, value, str(meetings), f"{person_hours:.1f}",
+                                           f"${cost:,.2f}")):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+        self.table.setUpdatesEnabled(True)
+        self.total_label.setText(f"Total: ${sum(row[4] for row in self.rows):,.2f}")
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Report", "meeting_costs.csv",
+                                              "CSV (*.csv);;Parquet (*.parquet)")
+        if not path:
+            return
+        try:
+            export_report(self.rows, path)
+        except (OSError, RuntimeError) as e:
+            QMessageBox.warning(self, "Export Failed", str(e))
+
+    def done(self, result):
+        self.history.close()
+        super().done(result)
@@ -0,0 +1,275 @@
+"""Sync the Employees table in EmployeeData.db from an HR roster export.
+
+    python roster_sync.py hr_export.csv --db EmployeeData.db
+    python roster_sync.py hr_export.csv --effective 2024-07-01 --dry-run
+
+The export is read row by row and compared with the table by employee id.
+Rows entered by hand before the first sync have no id; they are matched by
+name and take the export's id. Every change is applied in one transaction,
+so the app never sees a half-synced roster, and a running TimeIsMoney
+reloads its employee cache when the commit lands.
+
+Headers are matched case-insensitively against COLUMN_ALIASES; employee id,
+name and hourly wage are required, and columns the export lacks keep their
+current values. Wage changes are recorded in wage_history from the row's
+effective date, or --effective (default: today), so past meetings are still
+priced at the wage they were held at. Employees missing from the export are
+reported and kept unless --remove-missing is given.
+"""
+import argparse
+import csv
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
+
+from employee_repository import migrate
+
+# Employees column -> accepted headers, compared casefolded with "_" read as a space
+COLUMN_ALIASES = {
+    "employee_id": ("employee id", "employee number", "emp id", "id"),
+    "name": ("name", "employee name", "full name"),
+    "working_wage": ("working wage", "hourly wage", "wage", "hourly rate", "rate"),
+    "department": ("department", "dept"),
+    "cost_center": ("cost center",),
+    "worksite_assignment": ("worksite assignment", "worksite", "location"),
+    "has_benefits": ("has benefits", "benefits"),
+    "effective_date": ("effective date", "effective"),
+}
+REQUIRED_COLUMNS = ("employee_id", "name", "working_wage")
+SYNC_COLUMNS = ("employee_id", "name", "working_wage", "department", "cost_center", "worksite_assignment",
+                "has_benefits")
+DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y")
+PREHISTORY = "0001-01-01"  # effective_from for a hand-entered wage that predates the first sync
+MAX_REPORTED_ERRORS = 20
+
+EMPLOYEES_TABLE = """
+CREATE TABLE IF NOT EXISTS Employees (
+    name TEXT,
+    working_wage INTEGER,
+    department TEXT,
+    cost_center TEXT,
+    worksite_assignment TEXT,
+    has_benefits TEXT
+)"""
+UPSERT = (f"INSERT INTO Employees ({', '.join(SYNC_COLUMNS)}) VALUES ({', '.join('?' * len(SYNC_COLUMNS))}) "
+          "ON CONFLICT (employee_id) DO UPDATE SET "
+          + ", ".join(f"{column} = excluded.{column}" for column in SYNC_COLUMNS[1:]))
+
+
+@dataclass
+class SyncPlan:
+    upserts: list = field(default_factory=list)  # SYNC_COLUMNS tuples, new or changed
+    adopted: list = field(default_factory=list)  # (employee_id, rowid) of hand-entered rows matched by name
+    wages: list = field(default_factory=list)  # (employee_id, effective_from, wage) for wage_history
+    rows: int = 0  # Usable rows in the export
+    added: int = 0
+    updated: int = 0
+    wage_changes: int = 0
+    unchanged: int = 0
+    missing: list = field(default_factory=list)  # (employee_id, name) in the table but not the export
+    unmatched: list = field(default_factory=list)  # Names of hand-entered rows the export didn't match; always kept
+    errors: list = field(default_factory=list)  # (line, message) of skipped rows
+    warnings: list = field(default_factory=list)
+
+    @property
+    def changes(self):
+        return len(self.upserts) + len(self.adopted) + len(self.wages)
+
+    def summary(self):
+        return (f"{self.added} added, {self.updated} updated ({self.wage_changes} wage changes), "
+                f"{len(self.adopted)} matched by name, {self.unchanged} unchanged, "
+                f"{len(self.missing)} missing from the export, {len(self.unmatched)} hand-entered not matched, "
+                f"{len(self.errors)} rows skipped")
+
+
+def normalize_header(header):
+    return " ".join((header or "").replace("_", " ").casefold().split())
+
+
+def map_columns(headers):
+    """{Employees column: CSV header}. Raises ValueError if a required column is missing."""
+    by_alias = {alias: column for column, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    columns = {}
+    for header in headers or ():
+        column = by_alias.get(normalize_header(header))
+        if column is not None and column not in columns:
+            columns[column] = header
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise ValueError(f"Roster export has no {', '.join(missing)} column (headers: {', '.join(headers or ())})")
+    return columns
+
+
+def parse_wage(text):
+    wage = float(text.strip().lstrip("$").replace(",", ""))
+    if wage < 0:
+        raise ValueError(f"negative wage {text!r}")
+    return wage
+
+
+def parse_date(text):
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text.strip(), date_format).date().isoformat()
+        except ValueError:
+            pass
+    raise ValueError(f"unrecognized date {text!r}")
+
+
+def read_roster(f, effective):
+    """Yield (line, (SYNC_COLUMNS values, effective_from) or None, error) for each data row of a CSV export.
+
+    Columns the export doesn't have, and cells missing from a short row, are None.
+    """
+    reader = csv.reader(f)
+    headers = next(reader, None)
+    columns = map_columns(headers)
+    indexes = [headers.index(columns[column]) if column in columns else None for column in SYNC_COLUMNS]
+    effective_index = headers.index(columns["effective_date"]) if "effective_date" in columns else None
+    for line, row in enumerate(reader, start=2):
+        if not row:
+            continue  # Blank line
+        try:
+            record = [row[index].strip() if index is not None and index < len(row) else None
+                      for index in indexes]
+            if not record[0] or not record[1]:
+                raise ValueError("missing employee id or name")
+            if not record[2]:
+                raise ValueError("missing wage")
+            record[2] = parse_wage(record[2])
+            row_effective = effective
+            if effective_index is not None and effective_index < len(row) and row[effective_index].strip():
+                row_effective = parse_date(row[effective_index])
+        except ValueError as e:
+            yield line, None, str(e)
+            continue
+        yield line, (tuple(record), row_effective), None
+
+
+def blank_null(values):
+    """values with NULLs as "", so a hand-entered NULL matches an empty export column."""
+    return tuple("" if value is None else value for value in values)
+
+
+def plan_sync(conn, rows):
+    """Diff roster rows (from read_roster) against the Employees table."""
+    plan = SyncPlan()
+    keyed = {}  # employee_id -> SYNC_COLUMNS values
+    by_name = {}  # name -> (rowid, values) of a hand-entered row with no id yet
+    names = {}  # name -> employee_id of keyed rows, to flag two people sharing a name
+    for rowid, *values in conn.execute(f"SELECT rowid, {', '.join(SYNC_COLUMNS)} FROM Employees"):
+        if values[0] is None:
+            by_name.setdefault(values[1], (rowid, values))
+        else:
+            keyed[values[0]] = tuple(values)
+            names[values[1]] = values[0]
+    has_history = {row[0] for row in conn.execute("SELECT DISTINCT employee_id FROM wage_history")}
+
+    seen = set()
+    for line, parsed, error in rows:
+        if error is not None:
+            plan.errors.append((line, error))
+            continue
+        record, effective = parsed
+        employee_id, name, wage = record[:3]
+        if employee_id in seen:
+            plan.errors.append((line, f"duplicate employee id {employee_id!r}"))
+            continue
+        seen.add(employee_id)
+        plan.rows += 1
+
+        current = keyed.get(employee_id)
+        if current is None and name in by_name:
+            rowid, values = by_name.pop(name)
+            plan.adopted.append((employee_id, rowid))
+            current = (employee_id, *values[1:])
+            if current[2] is not None and current[2] != wage:
+                plan.wages.append((employee_id, PREHISTORY, current[2]))  # What past meetings were priced at
+        elif current is None and names.get(name, employee_id) != employee_id:
+            plan.warnings.append(f"line {line}: {name!r} is also employee {names[name]}; the app tells them apart "
+                                 "by name only")
+
+        if current is None:
+            record = blank_null(record)
+            plan.upserts.append(record)
+            plan.wages.append((employee_id, effective, wage))
+            plan.added += 1
+            continue
+        if None in record:
+            record = tuple(old if new is None else new for new, old in zip(record, current))
+        if current[2] != wage or employee_id not in has_history:
+            plan.wages.append((employee_id, effective, wage))
+            plan.wage_changes += current[2] != wage
+        if blank_null(current) != blank_null(record):
+            plan.upserts.append(record)
+            plan.updated += 1
+        else:
+            plan.unchanged += 1
+
+    plan.missing = [(employee_id, values[1]) for employee_id, values in keyed.items() if employee_id not in seen]
+    plan.unmatched = sorted(by_name)
+    return plan
+
+
+def apply_sync(conn, plan, remove_missing=False):
+    """Write a SyncPlan in one transaction."""
+    with conn:
+        conn.executemany("UPDATE Employees SET employee_id = ? WHERE rowid = ?", plan.adopted)
+        conn.executemany(UPSERT, plan.upserts)
+        conn.executemany("INSERT OR REPLACE INTO wage_history (employee_id, effective_from, wage) VALUES (?, ?, ?)",
+                         plan.wages)
+        if remove_missing:
+            conn.executemany("DELETE FROM Employees WHERE employee_id = ?",
+                             [(employee_id,) for employee_id, _ in plan.missing])
+
+
+def sync_roster(db_path, csv_path, effective=None, remove_missing=False, dry_run=False):
+    """Plan and (unless dry_run) apply a sync of db_path from csv_path. Returns the SyncPlan."""
+    effective = effective or date.today().isoformat()
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(EMPLOYEES_TABLE)  # First sync into a new database
+        migrate(conn)
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            plan = plan_sync(conn, read_roster(f, effective))
+        if plan.errors and remove_missing:
+            # A row that failed to parse would look like a departed employee
+            raise ValueError(f"Not removing missing employees: {len(plan.errors)} rows could not be read")
+        if not plan.rows:
+            raise ValueError(f"No usable rows in {csv_path}")
+        if not dry_run and (plan.changes or (remove_missing and plan.missing)):
+            apply_sync(conn, plan, remove_missing)
+    finally:
+        conn.close()
+    return plan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync EmployeeData.db from an HR roster CSV export")
+    parser.add_argument("roster", help="HR export (.csv)")
+    parser.add_argument("--db", default="EmployeeData.db", help="employee database to update")
+    parser.add_argument("--effective", type=parse_date,
+                        help="date wage changes take effect, for rows without an effective date (default: today)")
+    parser.add_argument("--remove-missing", action="store_true",
+                        help="delete employees that are not in the export")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args(argv)
+
+    try:
+        plan = sync_roster(args.db, args.roster, args.effective, args.remove_missing, args.dry_run)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        sys.exit(str(e))
+    for line, error in plan.errors[:MAX_REPORTED_ERRORS]:
+        print(f"line {line}: {error}", file=sys.stderr)
+    if len(plan.errors) > MAX_REPORTED_ERRORS:
+        print(f"... and {len(plan.errors) - MAX_REPORTED_ERRORS} more", file=sys.stderr)
+    for warning in plan.warnings[:MAX_REPORTED_ERRORS]:
+        print(f"warning: {warning}", file=sys.stderr)
+    action = "Would apply" if args.dry_run else "Applied" if plan.changes else "Up to date"
+    removed = " (removed)" if args.remove_missing and not args.dry_run else ""
+    print(f"{action}: {plan.summary()}{removed}")
+
+
+if __name__ == "__main__":
+    main()
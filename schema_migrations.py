@@ -0,0 +1,21 @@
+def apply_migrations(conn, migrations):
+    """Run the steps of migrations (lists of SQL statements) that PRAGMA user_version says are still pending.
+
+    Python's sqlite3 module doesn't open a transaction for DDL, so each step
+    is wrapped in an explicit BEGIN ... COMMIT together with its user_version
+    bump. A step that fails part way is rolled back whole and retried on the
+    next start. Returns the resulting schema version.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target, statements in enumerate(migrations[version:], start=version + 1):
+        conn.execute("BEGIN")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {target}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        version = target
+    return version
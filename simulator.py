@@ -0,0 +1,110 @@
+"""What-if meeting cost grids computed with NumPy broadcasting.
+
+Generalizes the window's "Set Meeting Length" estimate from one duration and
+the current participants to whole grids of attendee subsets x durations x
+yearly recurrences, optionally broken down by department. Requires numpy.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from cost_engine import SIMULATION_BUFFER_MINUTES
+
+DEFAULT_BENEFITS_LOADING = 0.0  # Extra fraction of wage for employees with has_benefits set
+
+
+def has_benefits(value):
+    """Interpret the free-text has_benefits column ('', None, 'Y', 'yes', '1', ...)."""
+    if value is None:
+        return False
+    return str(value).strip().casefold() in ("y", "yes", "true", "1", "x")
+
+
+@dataclass
+class ScenarioGrid:
+    durations: np.ndarray  # (d,) minutes, before buffer
+    recurrences: np.ndarray  # (r,) occurrences per year
+    hourly_rate: np.ndarray  # (s,) loaded hourly rate of each attendee subset
+    per_occurrence: np.ndarray  # (s, d) cost of one meeting
+    annual: np.ndarray  # (s, d, r) cost per year
+    departments: tuple = ()
+    by_department: np.ndarray = None  # (s, k, d, r) annual cost split by department, if requested
+
+    @property
+    def size(self):
+        return self.annual.size
+
+    def cheapest(self, n=10):
+        """Indices (subset, duration, recurrence) of the n cheapest annual scenarios."""
+        if n <= 0 or self.size == 0:
+            return []
+        flat = np.argpartition(self.annual, min(n, self.size - 1), axis=None)[:n]
+        flat = flat[np.argsort(self.annual.ravel()[flat])]
+        return [tuple(int(i) for i in idx) for idx in zip(*np.unravel_index(flat, self.annual.shape))]
+
+
+class Simulator:
+    """Holds the loaded wage vector of a roster and prices scenario grids over it."""
+
+    def __init__(self, names, wages, departments=None, benefits=None,
+                 benefits_loading=DEFAULT_BENEFITS_LOADING, overhead=1.0,
+                 buffer_minutes=SIMULATION_BUFFER_MINUTES):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.wages = np.asarray(wages, dtype=np.float64)
+        benefits = np.zeros(len(self.names), dtype=bool) if benefits is None else np.asarray(benefits, dtype=bool)
+        # Loaded rate: wage, plus benefits for those who get them, times any flat overhead factor
+        self.loaded = self.wages * (1.0 + benefits_loading * benefits) * overhead
+        self.buffer_minutes = buffer_minutes
+
+        departments = [""] * len(self.names) if departments is None else [d or "" for d in departments]
+        self.department_names = tuple(sorted(set(departments)))
+        codes = {dept: k for k, dept in enumerate(self.department_names)}
+        self.department_codes = np.fromiter((codes[d] for d in departments), dtype=np.intp,
+                                            count=len(departments))
+
+    @classmethod
+    def from_employees(cls, rows, **kwargs):
+        """Build from get_employees() rows (name, wage, department, cost_center, worksite, has_benefits)."""
+        rows = list(rows)
+        return cls([row[0] for row in rows], [row[1] or 0 for row in rows],
+                   departments=[row[2] for row in rows],
+                   benefits=[has_benefits(row[5]) for row in rows], **kwargs)
+
+    def masks(self, subsets):
+        """Boolean (s, n) attendee matrix from an iterable of name lists."""
+        subsets = list(subsets)
+        mask = np.zeros((len(subsets), len(self.names)), dtype=bool)
+        for row, names in enumerate(subsets):
+            mask[row, [self.index[name] for name in names]] = True
+        return mask
+
+    def department_mask(self, department):
+        return self.department_codes == self.department_names.index(department)
+
+    def grid(self, subsets, durations, recurrences=(1,), by_department=False):
+        """Price every subset x duration x recurrence combination.
+
+        subsets is a boolean (s, n) mask over the roster (see masks()) or a
+        list of name lists; durations are in minutes before the buffer and
+        recurrences are occurrences per year.
+        """
+        mask = np.asarray(subsets if isinstance(subsets, np.ndarray) else self.masks(subsets), dtype=bool)
+        durations = np.asarray(durations, dtype=np.float64)
+        recurrences = np.asarray(recurrences, dtype=np.float64)
+        hours = (durations + self.buffer_minutes) / 60.0  # (d,)
+
+        hourly_rate = mask @ self.loaded  # (s,)
+        per_occurrence = hourly_rate[:, None] * hours[None, :]  # (s, d)
+        annual = per_occurrence[:, :, None] * recurrences[None, None, :]  # (s, d, r)
+
+        department_costs = None
+        if by_department:
+            k = len(self.department_names)
+            one_hot = np.zeros((len(self.names), k))
+            one_hot[np.arange(len(self.names)), self.department_codes] = self.loaded
+            department_rate = mask @ one_hot  # (s, k)
+            department_costs = (department_rate[:, :, None, None] * hours[None, None, :, None]
+                                * recurrences[None, None, None, :])  # (s, k, d, r)
+        return ScenarioGrid(durations, recurrences, hourly_rate, per_occurrence, annual,
+                            self.department_names, department_costs)
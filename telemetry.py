@@ -0,0 +1,217 @@
+"""Logging and metrics for the app.
+
+Modules log through the standard logging module (log = logging.getLogger(__name__)).
+configure() routes every record through a queue to a background thread, so a
+slow console or log file never stalls the GUI thread. Records below the
+configured level are dropped before any message is formatted.
+
+Counters and histograms live in METRICS and are no-ops unless enabled. When
+enabled they can be dumped as JSON on exit and are served by the live feed at
+/metrics in the Prometheus text format.
+
+    TIMEISMONEY_LOG_LEVEL     WARNING (default), INFO or DEBUG
+    TIMEISMONEY_LOG_FORMAT    text (default) or json, one object per line
+    TIMEISMONEY_LOG_FILE      append here instead of writing to stderr
+    TIMEISMONEY_METRICS       1 to collect metrics
+    TIMEISMONEY_METRICS_FILE  write the metrics here as JSON on exit (implies TIMEISMONEY_METRICS=1)
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+
+DEFAULT_LEVEL = "WARNING"
+# Upper bounds in seconds, roughly x2.5 apart from 100 us to 10 s
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+NULL_TIMER = nullcontext()
+
+
+def record_fields(record):
+    """The structured fields passed with extra={...} on a log call."""
+    return {key: value for key, value in vars(record).items() if key not in RECORD_ATTRIBUTES}
+
+
+class TextFormatter(logging.Formatter):
+    """'time LEVEL logger: message key=value ...'"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record):
+        text = super().format(record)
+        fields = record_fields(record)
+        if fields:
+            text += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+        return text
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with its structured fields at the top level."""
+
+    def format(self, record):
+        entry = {"time": round(record.created, 3), "level": record.levelname, "logger": record.name,
+                 "message": record.getMessage(), **record_fields(record)}
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class Counter:
+    def __init__(self, registry, name, description):
+        self.registry = registry
+        self.name = name
+        self.description = description
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        if self.registry.enabled:
+            with self.lock:
+                self.value += amount
+
+    def snapshot(self):
+        return self.value
+
+    def prometheus(self):
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter", f"{self.name} {self.value}"]
+
+
+class Histogram:
+    """Count, sum, max and fixed-bucket counts of observed values (seconds for timings)."""
+
+    def __init__(self, registry, name, description, buckets=DEFAULT_BUCKETS):
+        self.registry = registry
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot: above every bound
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        if self.registry.enabled:
+            with self.lock:
+                self.counts[bisect_left(self.buckets, value)] += 1
+                self.count += 1
+                self.sum += value
+                self.max = max(self.max, value)
+
+    def time(self):
+        """Context manager observing the seconds its body took; a shared no-op when metrics are off."""
+        return HistogramTimer(self) if self.registry.enabled else NULL_TIMER
+
+    def snapshot(self):
+        with self.lock:
+            return {"count": self.count, "sum": self.sum, "mean": self.sum / self.count if self.count else 0.0,
+                    "max": self.max, "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts))}
+
+    def prometheus(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            cumulative = 0
+            for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum {self.sum}")
+            lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class HistogramTimer:
+    __slots__ = ("histogram", "started")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+
+
+class MetricsRegistry:
+    """Named counters and histograms. Metrics are declared at import time and collect only while enabled."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.metrics = {}
+
+    def counter(self, name, description):
+        return self.metrics.setdefault(name, Counter(self, name, description))
+
+    def histogram(self, name, description, buckets=DEFAULT_BUCKETS):
+        return self.metrics.setdefault(name, Histogram(self, name, description, buckets))
+
+    def snapshot(self):
+        return {name: metric.snapshot() for name, metric in sorted(self.metrics.items())}
+
+    def prometheus(self):
+        """Prometheus text exposition of every metric, as bytes."""
+        lines = []
+        for _, metric in sorted(self.metrics.items()):
+            lines.extend(metric.prometheus())
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+METRICS = MetricsRegistry(enabled=bool(os.environ.get("TIMEISMONEY_METRICS_FILE"))
+                          or os.environ.get("TIMEISMONEY_METRICS", "0") != "0")
+_listener = None
+
+
+def configure(level=None, fmt=None, log_file=None):
+    """Send log records through a queue to a background writer. Safe to call more than once.
+
+    Arguments default to the TIMEISMONEY_LOG_* environment variables.
+    """
+    global _listener
+    level = (level or os.environ.get("TIMEISMONEY_LOG_LEVEL") or DEFAULT_LEVEL).upper()
+    fmt = fmt or os.environ.get("TIMEISMONEY_LOG_FORMAT", "text")
+    log_file = log_file or os.environ.get("TIMEISMONEY_LOG_FILE")
+
+    if _listener is not None:
+        _listener.stop()
+    else:
+        atexit.register(shutdown)
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+    records = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    for old in root.handlers[:]:
+        root.removeHandler(old)
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(level)
+
+
+def shutdown():
+    """Flush queued log records and write the metrics file, if one is configured."""
+    global _listener
+    metrics_file = os.environ.get("TIMEISMONEY_METRICS_FILE")
+    if metrics_file and METRICS.enabled:
+        try:
+            METRICS.dump(metrics_file)
+        except OSError as e:
+            logging.getLogger(__name__).warning("Could not write metrics: %s", e)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from analytics import CostAnalytics
+from meeting_history import MeetingHistory
+
+EMPLOYEES = {"Ann": ("Ann", 20, "OFFICE", "LABOR", "SITE1", "yes"),
+             "Bo": ("Bo", 30, "SALES", "GENERAL", "SITE1", "yes")}
+
+
+class RollupTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = MeetingHistory(os.path.join(self.tmp.name, "history.db"))
+        self.analytics = CostAnalytics(self.history)
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    def record(self, started_at, ended_at, duration_ms, total_cost, participants, events, stints=()):
+        with self.history.conn:
+            meeting_id = self.history._insert((started_at, ended_at, duration_ms, total_cost, "app",
+                                               f"log_{started_at}", participants, events, "Room 1"))
+            self.history.conn.executemany(
+                "INSERT INTO meeting_stints (meeting_id, name, department, join_ms, leave_ms, cost_cents) "
+                "VALUES (?, ?, ?, ?, ?, ?)", [(meeting_id,) + stint for stint in stints])
+
+    def test_costs_come_from_stored_stints(self):
+        # Ann's 20/h for 1000 ms is about half a cent; the ledger rounded it up to one, not the events
+        self.record("2024-07-03 09:00:00", "2024-07-03 09:00:01", 1000, 0.01, [("Ann", 20.0), ("Bo", 30.0)],
+                    [(0, "Ann", "join", 20.0), (0, "Bo", "join", 30.0)],
+                    [("Ann", "OFFICE", 0, None, 1), ("Bo", "SALES", 0, 400, 0)])
+        self.analytics.apply_pending(EMPLOYEES)
+        self.assertEqual([(value, hours * 3600000, cost) for _, value, _, hours, cost in
+                          self.analytics.report("department", "day")],
+                         [("OFFICE", 1000, 0.01), ("SALES", 400, 0.0)])
+        self.assertEqual(self.analytics.report("total", "day")[0][4], 0.01)
+
+    def test_meetings_without_stints_are_attributed_from_events(self):
+        self.record("2024-07-03 09:00:00", "2024-07-03 10:00:00", 3600000, 50.0, [("Ann", 20.0), ("Bo", 30.0)],
+                    [(0, "Ann", "join", 20.0), (0, "Bo", "join", 30.0)])
+        self.analytics.apply_pending(EMPLOYEES)
+        self.assertEqual([(value, cost) for _, value, _, _, cost in self.analytics.report("department", "day")],
+                         [("SALES", 30.0), ("OFFICE", 20.0)])
+
+    def test_weekly_report_keeps_the_week_since_falls_in(self):
+        self.record("2024-07-01 09:00:00", "2024-07-01 10:00:00", 3600000, 20.0, [("Ann", 20.0)],
+                    [(0, "Ann", "join", 20.0)], [("Ann", "OFFICE", 0, None, 2000)])
+        self.analytics.apply_pending(EMPLOYEES)
+        self.assertEqual([row[0] for row in self.analytics.report("total", "week", since="2024-07-03")],
+                         ["2024-07-01"])
+        self.assertEqual(self.analytics.report("total", "day", since="2024-07-03"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from cost_engine import CostEngine, allocate_cents, department_subtotals, meeting_cost
+
+
+class LedgerTest(unittest.TestCase):
+    def test_participant_costs_add_up_to_the_total(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            engine = CostEngine()
+            elapsed_ms = 0
+            for _ in range(rng.randint(1, 30)):
+                elapsed_ms += rng.randint(0, 90000)
+                name = f"P{rng.randint(0, 9)}"
+                if name in engine and rng.random() < 0.5:
+                    engine.leave(name, elapsed_ms)
+                else:
+                    engine.join(name, rng.randint(1500, 9999) / 100, elapsed_ms, rng.choice("ABC"))
+            elapsed_ms += rng.randint(0, 90000)
+            ledger = engine.ledger(elapsed_ms)
+            total = engine.cents_at(elapsed_ms)
+            self.assertEqual(sum(entry.cost_cents for entry in ledger), total)
+            self.assertEqual(round(sum(cost for _, cost in department_subtotals(ledger)) * 100), total)
+            for entry in ledger:
+                self.assertEqual(sum(cents for _, _, cents in entry.stints), entry.cost_cents)
+
+    def test_allocate_cents_gives_leftover_to_largest_remainders(self):
+        cent = 3_600_000_000  # One cent in cost units
+        self.assertEqual(allocate_cents([cent * 4 // 10, cent * 4 // 10, cent * 4 // 10]), [1, 0, 0])
+        self.assertEqual(allocate_cents([cent * 3 // 10, cent * 6 // 10]), [0, 1])
+        self.assertEqual(allocate_cents([]), [])
+
+
+class MeetingCostTest(unittest.TestCase):
+    def test_attendee_joining_after_the_end_costs_nothing(self):
+        self.assertEqual(meeting_cost([("a", 60, 0, None), ("b", 60, 45 * 60000, None)], 30 * 60000), 30.0)
+
+    def test_attendee_leaving_before_joining_costs_nothing(self):
+        self.assertEqual(meeting_cost([("a", 60, 0, None), ("b", 60, 20 * 60000, 10 * 60000)], 30 * 60000), 30.0)
+
+    def test_stints_are_clamped_to_the_meeting(self):
+        self.assertEqual(meeting_cost([("a", 60, -10 * 60000, 90 * 60000)], 30 * 60000), 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
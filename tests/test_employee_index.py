@@ -0,0 +1,34 @@
+import random
+import unittest
+
+from benchmarks.bench_employee_index import synthetic_names
+from employee_index import EmployeeIndex
+
+
+class RefineOrderTest(unittest.TestCase):
+    def test_typing_another_character_ranks_like_a_fresh_search(self):
+        names = list(synthetic_names(2000, 1)) + ["Ann Marie Smith", "Zed Ann Marie", "Bo Annabel", "Ann", "Cy Ann"]
+        typed, fresh = EmployeeIndex(names), EmployeeIndex(names)
+        rng = random.Random(2)
+        for limit in (None, 50, 5):
+            for _ in range(300):
+                name = rng.choice(names).casefold()
+                starts = [0, rng.randrange(len(name))] + [i + 1 for i, c in enumerate(name) if c == " "]
+                start = rng.choice(starts)
+                query = name[start:start + rng.randint(1, 8)]
+                typed.search("")
+                for end in range(1, len(query) + 1):
+                    fresh.last_matches = None  # Force the index path
+                    self.assertEqual(typed.search(query[:end], limit), fresh.search(query[:end], limit),
+                                     (query[:end], limit))
+
+    def test_word_prefix_matches_rank_by_matching_word(self):
+        index = EmployeeIndex(["Amy Annz", "Bob Anders"])
+        index.search("a")
+        self.assertEqual(index.search("an"), ["Bob Anders", "Amy Annz"])  # Refined from "a"
+        index.search("")
+        self.assertEqual(index.search("an"), ["Bob Anders", "Amy Annz"])
+
+
+if __name__ == "__main__":
+    unittest.main()
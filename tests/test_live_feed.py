@@ -0,0 +1,45 @@
+import asyncio
+import struct
+import unittest
+
+from live_feed import WS_PING, WS_PROTOCOL_ERROR, WS_TOO_BIG, WsProtocolError, read_ws_frame
+
+
+def client_frame(payload, opcode=WS_PING, mask=b"\x01\x02\x03\x04"):
+    size = len(payload)
+    if size < 126:
+        header = struct.pack("!BB", 0x80 | opcode, 0x80 | size)
+    else:
+        header = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, size)
+    return header + mask + bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+
+
+def read(data):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_ws_frame(reader)
+    return asyncio.run(run())
+
+
+class ReadFrameTest(unittest.TestCase):
+    def test_masked_frame_is_unmasked(self):
+        self.assertEqual(read(client_frame(b"hello")), (WS_PING, b"hello"))
+        self.assertEqual(read(client_frame(b"x" * 125)), (WS_PING, b"x" * 125))
+
+    def test_oversize_frame_is_refused_before_its_payload(self):
+        with self.assertRaises(WsProtocolError) as caught:
+            read(client_frame(b"x" * 126)[:8])  # Header, extended length and mask only
+        self.assertEqual(caught.exception.status, WS_TOO_BIG)
+        with self.assertRaises(WsProtocolError):
+            read(struct.pack("!BBQ", 0x80 | WS_PING, 0x80 | 127, 1 << 40))
+
+    def test_unmasked_frame_is_refused(self):
+        with self.assertRaises(WsProtocolError) as caught:
+            read(struct.pack("!BB", 0x80 | WS_PING, 5) + b"hello")
+        self.assertEqual(caught.exception.status, WS_PROTOCOL_ERROR)
+
+
+if __name__ == "__main__":
+    unittest.main()
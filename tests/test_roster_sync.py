@@ -0,0 +1,138 @@
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from employee_repository import EmployeeRepository, migrate, wage_at
+from roster_sync import EMPLOYEES_TABLE, PREHISTORY, apply_sync, plan_sync, read_roster
+
+HEADER = "Employee Number,Full Name,Hourly Rate,Department,Cost Center\n"
+
+
+def roster(*lines, header=HEADER, effective="2024-07-01"):
+    return read_roster(io.StringIO(header + "".join(line + "\n" for line in lines)), effective)
+
+
+class PlanSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute(EMPLOYEES_TABLE)
+        migrate(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def sync(self, *lines, remove_missing=False, **kwargs):
+        plan = plan_sync(self.conn, roster(*lines, **kwargs))
+        apply_sync(self.conn, plan, remove_missing)
+        return plan
+
+    def employees(self):
+        return {row[0]: row[1:] for row in self.conn.execute(
+            "SELECT employee_id, name, working_wage, department, cost_center, worksite_assignment FROM Employees")}
+
+    def wage_history(self):
+        return self.conn.execute("SELECT employee_id, effective_from, wage FROM wage_history "
+                                 "ORDER BY employee_id, effective_from").fetchall()
+
+    def test_first_sync_adds_everyone_with_a_wage_history_entry(self):
+        plan = self.sync("E1,Ann Lee,20,OFFICE,LABOR", "E2,Bo Chan,\"$1,030.50\",DRIVER,LABOR")
+        self.assertEqual((plan.added, plan.updated, plan.unchanged), (2, 0, 0))
+        self.assertEqual(self.employees(), {"E1": ("Ann Lee", 20.0, "OFFICE", "LABOR", ""),
+                                            "E2": ("Bo Chan", 1030.5, "DRIVER", "LABOR", "")})
+        self.assertEqual(self.wage_history(), [("E1", "2024-07-01", 20.0), ("E2", "2024-07-01", 1030.5)])
+
+    def test_unchanged_export_plans_nothing(self):
+        self.sync("E1,Ann Lee,20,OFFICE,LABOR")
+        plan = plan_sync(self.conn, roster("E1,Ann Lee,20,OFFICE,LABOR", effective="2024-08-01"))
+        self.assertEqual((plan.unchanged, plan.changes), (1, 0))
+
+    def test_null_and_empty_columns_are_unchanged(self):
+        self.sync("E1,Ann Lee,20,OFFICE,")
+        self.conn.execute("UPDATE Employees SET cost_center = NULL, worksite_assignment = NULL")
+        plan = plan_sync(self.conn, roster("E1,Ann Lee,20,OFFICE,", effective="2024-08-01"))
+        self.assertEqual((plan.unchanged, plan.changes), (1, 0))
+
+    def test_update_records_wage_change_from_effective_date(self):
+        self.sync("E1,Ann Lee,20,OFFICE,LABOR")
+        plan = self.sync("E1,Ann Lee,22,SALES,LABOR", effective="2024-08-01")
+        self.assertEqual((plan.updated, plan.wage_changes), (1, 1))
+        self.assertEqual(self.employees()["E1"], ("Ann Lee", 22.0, "SALES", "LABOR", ""))
+        self.assertEqual(self.wage_history(), [("E1", "2024-07-01", 20.0), ("E1", "2024-08-01", 22.0)])
+
+    def test_department_change_keeps_wage_history(self):
+        self.sync("E1,Ann Lee,20,OFFICE,LABOR")
+        plan = self.sync("E1,Ann Lee,20,SALES,LABOR", effective="2024-08-01")
+        self.assertEqual((plan.updated, plan.wage_changes), (1, 0))
+        self.assertEqual(self.wage_history(), [("E1", "2024-07-01", 20.0)])
+
+    def test_row_effective_date_overrides_default(self):
+        header = "Employee Number,Full Name,Hourly Rate,Effective Date\n"
+        self.sync("E1,Ann Lee,20,", header=header)
+        self.sync("E1,Ann Lee,25,09/15/2024", header=header)
+        self.assertEqual(self.wage_history(), [("E1", "2024-07-01", 20.0), ("E1", "2024-09-15", 25.0)])
+
+    def test_hand_entered_row_is_adopted_by_name(self):
+        self.conn.execute("INSERT INTO Employees (name, working_wage, department, cost_center, worksite_assignment, "
+                          "has_benefits) VALUES ('Ann Lee', 18, 'OFFICE', 'GENERAL', 'SITE1', 'yes')")
+        self.conn.execute("INSERT INTO Employees (name, working_wage) VALUES ('Cy Hand', 15)")
+        plan = self.sync("E1,Ann Lee,20,OFFICE,LABOR")
+        self.assertEqual((plan.added, plan.updated, len(plan.adopted)), (0, 1, 1))
+        self.assertEqual(plan.unmatched, ["Cy Hand"])
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM Employees").fetchone()[0], 2)
+        # Columns the export doesn't carry keep their hand-entered values
+        self.assertEqual(self.employees()["E1"], ("Ann Lee", 20.0, "OFFICE", "LABOR", "SITE1"))
+        # Past meetings stay priced at the hand-entered wage
+        self.assertEqual(self.wage_history(), [("E1", PREHISTORY, 18), ("E1", "2024-07-01", 20.0)])
+
+    def test_missing_employees_are_reported_and_removed_only_on_request(self):
+        self.sync("E1,Ann Lee,20,OFFICE,LABOR", "E2,Bo Chan,30,DRIVER,LABOR")
+        plan = self.sync("E1,Ann Lee,20,OFFICE,LABOR")
+        self.assertEqual(plan.missing, [("E2", "Bo Chan")])
+        self.assertIn("E2", self.employees())
+        self.sync("E1,Ann Lee,20,OFFICE,LABOR", remove_missing=True)
+        self.assertNotIn("E2", self.employees())
+
+    def test_short_row_keeps_current_values(self):
+        self.sync("E1,Ann Lee,20,OFFICE,LABOR")
+        plan = self.sync("E1,Ann Lee,20")
+        self.assertEqual((plan.unchanged, plan.changes), (1, 0))
+        self.assertEqual(self.employees()["E1"], ("Ann Lee", 20.0, "OFFICE", "LABOR", ""))
+
+    def test_bad_and_duplicate_rows_are_skipped(self):
+        plan = self.sync("E1,Ann Lee,20,OFFICE,LABOR", "E1,Ann Again,21,OFFICE,LABOR", "E2,Bo Chan,lots",
+                         ",No Id,20", "E3,Short")
+        self.assertEqual(plan.rows, 1)
+        self.assertEqual([line for line, _ in plan.errors], [3, 4, 5, 6])
+        self.assertEqual(set(self.employees()), {"E1"})
+
+
+class WageHistoryTest(unittest.TestCase):
+    def test_repository_reads_history_by_name(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "EmployeeData.db")
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(EMPLOYEES_TABLE)
+                migrate(conn)
+            conn.close()
+            for line, effective in (("E1,Ann Lee,20,OFFICE,LABOR", "2024-07-01"),
+                                    ("E1,Ann Lee,22,OFFICE,LABOR", "2024-08-01")):
+                conn = sqlite3.connect(db_path)
+                apply_sync(conn, plan_sync(conn, roster(line, effective=effective)))
+                conn.close()
+            repo = EmployeeRepository(db_path)
+            history = repo.wage_history()
+            repo.close()
+        self.assertEqual(history, {"Ann Lee": [("2024-07-01", 20.0), ("2024-08-01", 22.0)]})
+
+    def test_wage_at_picks_the_wage_in_effect(self):
+        history = [("2024-07-01", 20.0), ("2024-08-01", 22.0)]
+        self.assertEqual(wage_at(history, "2024-06-30"), 20.0)  # Before the first entry: earliest known
+        self.assertEqual(wage_at(history, "2024-07-31 17:00:00"), 20.0)
+        self.assertEqual(wage_at(history, "2024-08-01"), 22.0)
+        self.assertEqual(wage_at([], "2024-08-01", 15), 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import sqlite3
+import unittest
+
+from schema_migrations import apply_migrations
+
+
+class ApplyMigrationsTest(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE t (a TEXT)")
+
+    def tearDown(self):
+        self.conn.close()
+
+    def columns(self):
+        return [row[1] for row in self.conn.execute("PRAGMA table_info(t)")]
+
+    def test_failed_step_is_rolled_back_and_retried(self):
+        migrations = [["ALTER TABLE t ADD COLUMN b TEXT"],
+                      ["ALTER TABLE t ADD COLUMN c TEXT", "CREATE INDEX idx ON missing_table(x)"]]
+        with self.assertRaises(sqlite3.OperationalError):
+            apply_migrations(self.conn, migrations)
+        self.assertEqual(self.columns(), ["a", "b"])  # Half of step 2 undone
+        self.assertEqual(self.conn.execute("PRAGMA user_version").fetchone()[0], 1)
+
+        migrations[1][1] = "CREATE INDEX idx ON t(c)"
+        self.assertEqual(apply_migrations(self.conn, migrations), 2)
+        self.assertEqual(self.columns(), ["a", "b", "c"])
+        self.assertEqual(apply_migrations(self.conn, migrations), 2)  # Nothing left to run
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from cost_engine import simulated_cost
+from simulator import Simulator
+
+NAMES = ("Ann", "Bo", "Cy", "Di")
+WAGES = (20.0, 31.5, 18.25, 44.0)
+DEPARTMENTS = ("OFFICE", "SALES", "OFFICE", "")
+
+
+class GridTest(unittest.TestCase):
+    def setUp(self):
+        self.simulator = Simulator(NAMES, WAGES, departments=DEPARTMENTS, benefits=(True, False, True, False),
+                                   benefits_loading=0.25, overhead=1.1, buffer_minutes=5)
+
+    def loaded(self, name):
+        i = NAMES.index(name)
+        return WAGES[i] * (1.25 if name in ("Ann", "Cy") else 1.0) * 1.1
+
+    def test_grid_matches_simulated_cost(self):
+        subsets = [["Ann"], ["Bo", "Di"], list(NAMES), []]
+        durations, recurrences = (15, 30, 90), (1, 12, 52)
+        grid = self.simulator.grid(subsets, durations, recurrences)
+        self.assertEqual(grid.annual.shape, (4, 3, 3))
+        for s, names in enumerate(subsets):
+            rate = sum(self.loaded(name) for name in names)
+            for d, minutes in enumerate(durations):
+                cost = simulated_cost(rate, minutes, buffer_minutes=5)
+                self.assertAlmostEqual(grid.per_occurrence[s, d], cost)
+                for r, times in enumerate(recurrences):
+                    self.assertAlmostEqual(grid.annual[s, d, r], cost * times)
+
+    def test_department_split_adds_up(self):
+        grid = self.simulator.grid([["Ann", "Bo", "Cy"], ["Di"]], (30, 60), (1, 4), by_department=True)
+        self.assertEqual(grid.departments, ("", "OFFICE", "SALES"))
+        np.testing.assert_allclose(grid.by_department.sum(axis=1), grid.annual)
+        office = grid.departments.index("OFFICE")
+        self.assertAlmostEqual(grid.by_department[0, office, 1, 0],
+                               simulated_cost(self.loaded("Ann") + self.loaded("Cy"), 60, buffer_minutes=5))
+
+    def test_cheapest(self):
+        grid = self.simulator.grid([["Di"], ["Cy"]], (60, 15), (2,))
+        self.assertEqual(grid.cheapest(2), [(1, 1, 0), (0, 1, 0)])
+        self.assertEqual(len(grid.cheapest(100)), 4)
+        self.assertEqual(grid.cheapest(0), [])
+        self.assertEqual(self.simulator.grid([], (15,), (1,)).cheapest(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()